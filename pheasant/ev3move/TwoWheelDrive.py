@@ -3,7 +3,8 @@
 # Copyright © 2021 Qi Tianshi. All rights reserved.
 
 # Drive functions for two-wheel drive robots. Emulates the behavior and functionality of the methods in the built-in
-# ev3devices.Motor class.
+# ev3devices.Motor class. Commands are written to the left motor, then the right, as two separate writes; with `wait`,
+# they then wait for both motors to finish, rather than for the right motor alone.
 
 
 from pybricks.ev3devices import Motor
@@ -36,18 +37,34 @@ class TwoWheelDrive(DoubleMotorBase):
     def run(self, speed):
         self.leftMotor.run(speed)
         self.rightMotor.run(speed)
+        DoubleMotorBase.motorWrites += 2
 
     def run_time(self, speed, time, then=Stop.HOLD, wait=True):
+
         self.leftMotor.run_time(speed, time, then=then, wait=False)
-        self.rightMotor.run_time(speed, time, then=then, wait=wait)
+        self.rightMotor.run_time(speed, time, then=then, wait=False)
+        DoubleMotorBase.motorWrites += 2
+
+        if wait:
+            self.waitForBothMotors()
 
     def run_angle(self, speed, rotation_angle, then=Stop.HOLD, wait=True):
+
         self.leftMotor.run_angle(speed, rotation_angle, then=then, wait=False)
-        self.rightMotor.run_angle(speed, rotation_angle, then=then, wait=wait)
+        self.rightMotor.run_angle(speed, rotation_angle, then=then, wait=False)
+        DoubleMotorBase.motorWrites += 2
+
+        if wait:
+            self.waitForBothMotors()
 
     def run_target(self, speed, target_angle, then=Stop.HOLD, wait=True):
+
         self.leftMotor.run_target(speed, target_angle, then=then, wait=False)
-        self.rightMotor.run_target(speed, target_angle, then=then, wait=wait)
+        self.rightMotor.run_target(speed, target_angle, then=then, wait=False)
+        DoubleMotorBase.motorWrites += 2
+
+        if wait:
+            self.waitForBothMotors()
 
     def dc(self, duty):
         self.leftMotor.dc(duty)
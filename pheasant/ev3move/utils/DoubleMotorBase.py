@@ -6,19 +6,82 @@
 
 
 from pybricks.ev3devices import Motor
+from pybricks.tools import wait
 
 class DoubleMotorBase:
 
     LEFT_MOTOR_DEFAULT = None
     RIGHT_MOTOR_DEFAULT = None
 
+    # Speed commands (in deg/s) that differ from the previous command by less than this are not written.
+    SPEED_DEADBAND = 1
+
+    # Polling interval (in ms) while waiting for both motors to complete their commands.
+    COMPLETION_POLL_TIME = 5
+
+    # Write statistics, shared by all instances.
+    motorWrites = 0
+    skippedWrites = 0
+
     def __init__(self, leftMotor: Motor, rightMotor: Motor):
 
         # Resolves optional arguments with default values.
         self.leftMotor = leftMotor if leftMotor is not None else self.__class__.LEFT_MOTOR_DEFAULT
         self.rightMotor = rightMotor if rightMotor is not None else self.__class__.RIGHT_MOTOR_DEFAULT
 
+        # Last speeds written by runMotors()
+        self.leftCommand = None
+        self.rightCommand = None
+
+    def runMotors(self, leftSpeed: float, rightSpeed: float):
+
+        """
+        Runs both motors at the given speeds, skipping writes within SPEED_DEADBAND of the previous command.
+
+        ## Discussion
+        Other code (e.g. `hold()`) may command the motors without going through this method, so call
+        `resetMotorCommands()` before each control loop to force the first write.
+        """
+
+        deadband = DoubleMotorBase.SPEED_DEADBAND
+
+        if self.leftCommand is None or abs(leftSpeed - self.leftCommand) >= deadband:
+            self.leftMotor.run(leftSpeed)
+            self.leftCommand = leftSpeed
+            DoubleMotorBase.motorWrites += 1
+        else:
+            DoubleMotorBase.skippedWrites += 1
+
+        if self.rightCommand is None or abs(rightSpeed - self.rightCommand) >= deadband:
+            self.rightMotor.run(rightSpeed)
+            self.rightCommand = rightSpeed
+            DoubleMotorBase.motorWrites += 1
+        else:
+            DoubleMotorBase.skippedWrites += 1
+
+    def resetMotorCommands(self):
+        self.leftCommand = None
+        self.rightCommand = None
+
+    def waitForBothMotors(self):
+
+        """
+        Waits until both motors have completed their current commands, by polling each in turn.
+        """
+
+        while not (self.leftMotor.control.done() and self.rightMotor.control.done()):
+            wait(DoubleMotorBase.COMPLETION_POLL_TIME)
+
     @classmethod
     def setDefaultMotors(cls, leftMotor: Motor, rightMotor: Motor):
         cls.LEFT_MOTOR_DEFAULT = leftMotor
         cls.RIGHT_MOTOR_DEFAULT = rightMotor
+
+    @classmethod
+    def setSpeedDeadband(cls, deadband: float):
+        DoubleMotorBase.SPEED_DEADBAND = deadband
+
+    @classmethod
+    def resetWriteCounts(cls):
+        DoubleMotorBase.motorWrites = 0
+        DoubleMotorBase.skippedWrites = 0
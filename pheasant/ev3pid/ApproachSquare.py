@@ -0,0 +1,218 @@
+# ApproachSquare.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Implements gyro straight movement onto a line, handing off to line squaring without stopping.
+
+
+from pybricks.ev3devices import Motor, GyroSensor, ColorSensor
+
+from .GyroStraight import GyroStraight
+from .LineSquare import LineSquare, LinePosition
+from .utils.PIDController import PIDController
+from .utils.Clock import Clock
+from .utils.DoubleColorInput import DoubleColorInput
+from .utils.FlightRecorder import FlightRecorder
+from .utils.LoopProfiler import LoopProfiler
+from .utils.LoopScheduler import LoopScheduler
+
+class ApproachSquare(GyroStraight, DoubleColorInput):
+
+    """
+    Drives straight at `speed` until the color sensors reach the line, then squares both sensors on the line in the
+    same loop, without stopping in between.
+
+    ## Discussion
+    This replaces driving to the line with GyroStraight, holding, waiting, and running LineSquare several times, each
+    ending with a hold and a wait. Each wheel switches to its LineSquare-tuned PID controller once its own sensor
+    reaches the line, and keeps driving straight until then, so that a skewed approach squares both sensors on the
+    same edge. Its speed is slew-limited by `deceleration` from the approach speed, so the robot decelerates into the
+    line rather than stopping dead. The limit runs on the clock time between iterations, so that it holds at any loop
+    rate.
+
+    `linePosition` is where the line is from the sensors when they square: AHEAD squares on the near edge of the line,
+    and BEHIND drives on across the line and squares on its far edge. With AHEAD, the approach must be slow enough for
+    the robot to stop within the line; BEHIND suits fast approaches.
+
+    Squaring has converged once the mean absolute error of each sensor, over the latest `WINDOW` readings, is within
+    `TOLERANCE`, so that a single noisy reading neither ends nor prolongs it. It gives up `TIMEOUT` ms after the first
+    sensor reaches the line. After `run()`, `iterations` and `elapsed` (in ms) give the length of the squaring, and
+    `converged` whether it converged.
+    """
+
+    DECELERATION_DEFAULT = 6000         # In deg/s^2.
+    WINDOW = 8                          # In readings.
+    TOLERANCE = 1                       # Mean absolute reflection error.
+    TIMEOUT = 2000                      # In ms.
+
+    def __init__(self,
+                 speed: float,
+                 angle: int,
+                 linePosition: LinePosition,
+                 deceleration: float = None,
+                 leftSensor: ColorSensor = None,
+                 rightSensor: ColorSensor = None,
+                 leftThreshold: int = None,
+                 rightThreshold: int = None,
+                 sensor: GyroSensor = None,
+                 leftMotor: Motor = None,
+                 rightMotor: Motor = None,
+                 kp: float = None,
+                 ki: float = None,
+                 kd: float = None,
+                 integralLimit: float = None,
+                 outputLimit: float = None,
+                 loopRate: float = None):
+
+        GyroStraight.__init__(self, speed, angle, sensor, leftMotor, rightMotor, kp, ki, kd, integralLimit, outputLimit,
+                              loopRate)
+        DoubleColorInput.__init__(self, leftSensor, rightSensor, leftThreshold, rightThreshold)
+
+        # Resolves optional arguments with default values.
+        self.deceleration = deceleration if deceleration is not None else ApproachSquare.DECELERATION_DEFAULT
+
+        self.linePosition = linePosition
+
+        # Squaring uses the LineSquare tuning.
+        self.leftPid = PIDController(self.leftThreshold, LineSquare.kp_DEFAULT, LineSquare.ki_DEFAULT,
+                                     LineSquare.kd_DEFAULT, LineSquare.INTEGRAL_LIMIT_DEFAULT,
+                                     LineSquare.OUTPUT_LIMIT_DEFAULT, self.loopRate)
+        self.rightPid = PIDController(self.rightThreshold, LineSquare.kp_DEFAULT, LineSquare.ki_DEFAULT,
+                                      LineSquare.kd_DEFAULT, LineSquare.INTEGRAL_LIMIT_DEFAULT,
+                                      LineSquare.OUTPUT_LIMIT_DEFAULT, self.loopRate)
+
+        # Latest absolute errors of each sensor, as ring buffers.
+        self.leftWindow = [0] * ApproachSquare.WINDOW
+        self.rightWindow = [0] * ApproachSquare.WINDOW
+
+        # Results of the latest run
+        self.iterations = 0
+        self.elapsed = None             # In ms.
+        self.converged = None
+
+    def run(self):
+
+        for _ in self.task():
+            pass
+
+    def task(self):
+
+        """
+        Returns the control loop of `run()` as a cooperative task: a generator that runs one iteration each time it is
+        resumed, and finishes once squaring has converged or timed out. Run it alongside other tasks with a
+        TaskScheduler.
+        """
+
+        directionMultiplier = 1 if self.linePosition == LinePosition.AHEAD else -1
+        window = ApproachSquare.WINDOW
+        leftWindow = self.leftWindow
+        rightWindow = self.rightWindow
+        tolerance = ApproachSquare.TOLERANCE * window
+        timeout = ApproachSquare.TIMEOUT * 1000
+
+        scheduler = LoopScheduler(self.loopRate)
+        snapshot = self.snapshot
+        self.resetMotorCommands()
+
+        recorder = FlightRecorder.ACTIVE
+        if recorder is not None:
+            approachSegment = recorder.begin("ApproachSquare approach")
+            leftSegment = recorder.begin("ApproachSquare left")
+            rightSegment = recorder.begin("ApproachSquare right")
+
+        stats = LoopProfiler.stats("ApproachSquare")
+
+        leftSquaring = rightSquaring = False
+        squareStart = None
+        leftSpeed = rightSpeed = self.speed
+        leftSum = rightSum = 0          # Of the absolute errors in the windows.
+        for index in range(window):
+            leftWindow[index] = 0
+            rightWindow[index] = 0
+        self.iterations = 0
+        self.converged = False
+
+        while True:
+
+            dt = scheduler.tick()
+            snapshot.next()
+            stats.tick()
+
+            leftError = snapshot.reflection(self.leftSensor) - self.leftThreshold
+            rightError = snapshot.reflection(self.rightSensor) - self.rightThreshold
+
+            # Hands each wheel off to squaring once its own sensor reaches the line, as LineApproach latches each
+            # sensor; until then, a sensor still short of the line would drive its wheel away from the line.
+            if not leftSquaring and leftError < 0:
+                leftSquaring = True
+            if not rightSquaring and rightError < 0:
+                rightSquaring = True
+            if squareStart is None and (leftSquaring or rightSquaring):
+                squareStart = previous = Clock.now()
+
+            # Converges once both wheels are squaring, and times out from the first.
+            if leftSquaring and rightSquaring:
+
+                index = self.iterations % window
+                leftSum += abs(leftError) - leftWindow[index]
+                rightSum += abs(rightError) - rightWindow[index]
+                leftWindow[index] = abs(leftError)
+                rightWindow[index] = abs(rightError)
+                self.iterations += 1
+
+                if self.iterations >= window and leftSum <= tolerance and rightSum <= tolerance:
+                    self.converged = True
+                    break
+
+            if squareStart is not None and Clock.diff(Clock.now(), squareStart) >= timeout:
+                break
+
+            stats.read()
+
+            # Wheels that have not reached the line keep driving straight.
+            if not (leftSquaring and rightSquaring):
+                output = self.update(snapshot.angle(self.sensor) - self.angle, dt=dt)
+                leftSpeed = leftSpeed if leftSquaring else self.speed - output
+                rightSpeed = rightSpeed if rightSquaring else self.speed + output
+
+            if squareStart is not None:
+
+                # Slew-limits each squaring wheel by the time since the previous iteration, so that the robot
+                # decelerates from the approach speed.
+                now = Clock.now()
+                step = self.deceleration * Clock.diff(now, previous) / 1000000
+                previous = now
+
+                if leftSquaring:
+                    leftTarget = self.leftPid.update(leftError, dt=dt) * directionMultiplier
+                    leftSpeed = min(max(leftTarget, leftSpeed - step), leftSpeed + step)
+                if rightSquaring:
+                    rightTarget = self.rightPid.update(rightError, dt=dt) * directionMultiplier
+                    rightSpeed = min(max(rightTarget, rightSpeed - step), rightSpeed + step)
+
+            stats.computed()
+
+            self.runMotors(leftSpeed, rightSpeed)
+
+            stats.written()
+
+            if recorder is not None:
+                if leftSquaring or rightSquaring:
+                    recorder.segment = leftSegment
+                    recorder.record(self.leftPid, leftSpeed, rightSpeed)
+                    recorder.segment = rightSegment
+                    recorder.record(self.rightPid, leftSpeed, rightSpeed)
+                else:
+                    recorder.segment = approachSegment
+                    recorder.record(self, leftSpeed, rightSpeed)
+
+            yield
+
+        self.leftMotor.hold()
+        self.rightMotor.hold()
+
+        self.elapsed = Clock.diff(Clock.now(), squareStart) / 1000 if squareStart is not None else 0
+
+    def report(self) -> str:
+        return "squared in " + str(self.iterations) + " iterations, " + str(round(self.elapsed)) + " ms" + \
+            ("" if self.converged else " (not converged)")
@@ -9,10 +9,17 @@ from pybricks.ev3devices import Motor, GyroSensor
 
 from ev3move import DoubleMotorBase
 from .utils.PIDController import PIDController
+from .utils.LoopScheduler import LoopScheduler
+from .utils.SensorSnapshot import SensorSnapshot
+from .utils.FlightRecorder import FlightRecorder
+from .utils.LoopProfiler import LoopProfiler
+from .utils.StopCondition import StopCondition
 from .utils.GyroInput import GyroInput
 
 class GyroStraight(PIDController, GyroInput, DoubleMotorBase):
 
+    SEGMENT_NAME = "GyroStraight"       # Flight recorder and loop profiler label for task(), renamed by subclasses.
+
     def __init__(self,
                  speed: float,
                  angle: int,
@@ -23,7 +30,8 @@ class GyroStraight(PIDController, GyroInput, DoubleMotorBase):
                  ki: float = None,
                  kd: float = None,
                  integralLimit: float = None,
-                 outputLimit: float = None):
+                 outputLimit: float = None,
+                 loopRate: float = None):
 
         # Movement parameters
         self.speed = speed
@@ -34,15 +42,67 @@ class GyroStraight(PIDController, GyroInput, DoubleMotorBase):
         DoubleMotorBase.__init__(self, leftMotor, rightMotor)
 
         # PID parameters
-        PIDController.__init__(self, angle, kp, ki, kd, integralLimit, outputLimit)
+        PIDController.__init__(self, angle, kp, ki, kd, integralLimit, outputLimit, loopRate)
+
+        # Readings for the current tick, shared with stop conditions.
+        self.snapshot = SensorSnapshot()
 
     def runUntil(self, stopCondition):
-        while not stopCondition():
+        for _ in self.task(stopCondition):
+            pass
+
+    def task(self, stopCondition):
+
+        """
+        Returns the control loop of `runUntil()` as a cooperative task: a generator that runs one iteration each time it
+        is resumed, and finishes once `stopCondition()` is true. Run it alongside other tasks with a TaskScheduler.
+        """
+
+        scheduler = LoopScheduler(self.loopRate)
+        snapshot = self.snapshot
+        self.resetMotorCommands()
+
+        if isinstance(stopCondition, StopCondition):
+            stopCondition.bind(snapshot)
+
+        recorder = FlightRecorder.ACTIVE
+        if recorder is not None:
+            recorder.begin(self.SEGMENT_NAME)
+
+        stats = LoopProfiler.stats(self.SEGMENT_NAME)
+
+        try:
+            while True:
+
+                dt = scheduler.tick()
+                snapshot.next()
+                stats.tick()
+
+                if stopCondition():
+                    break
+
+                error = snapshot.angle(self.sensor) - self.angle
+
+                stats.read()
+
+                output = self.update(error, dt=dt)
+                leftSpeed, rightSpeed = self.speed - output, self.speed + output
+
+                stats.computed()
+
+                self.runMotors(leftSpeed, rightSpeed)
+
+                stats.written()
+
+                if recorder is not None:
+                    recorder.record(self, leftSpeed, rightSpeed)
 
-            output = self.update(self.sensor.angle() - self.angle)
+                yield
 
-            self.leftMotor.run(self.speed - output)
-            self.rightMotor.run(self.speed + output)
+        finally:
+            # Unbinds the condition, so that later direct calls don't read this loop's last tick.
+            if isinstance(stopCondition, StopCondition):
+                stopCondition.unbind()
 
     def rawControllerOutput(self):
         return self.update(self.sensor.angle() - self.angle)
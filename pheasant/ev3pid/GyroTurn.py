@@ -9,6 +9,10 @@ from pybricks.ev3devices import Motor, GyroSensor
 
 from ev3move import DoubleMotorBase
 from .utils.PIDController import PIDController
+from .utils.LoopScheduler import LoopScheduler
+from .utils.SensorSnapshot import SensorSnapshot
+from .utils.FlightRecorder import FlightRecorder
+from .utils.LoopProfiler import LoopProfiler
 from .utils.GyroInput import GyroInput
 
 class GyroTurn(PIDController, GyroInput, DoubleMotorBase):
@@ -40,7 +44,8 @@ class GyroTurn(PIDController, GyroInput, DoubleMotorBase):
                  ki: float = None,
                  kd: float = None,
                  integralLimit: float = None,
-                 outputLimit: float = None):
+                 outputLimit: float = None,
+                 loopRate: float = None):
 
         # Resolves optional arguments with default values.
         if leftDriven and rightDriven:
@@ -68,20 +73,62 @@ class GyroTurn(PIDController, GyroInput, DoubleMotorBase):
         DoubleMotorBase.__init__(self, leftMotor, rightMotor)
 
         # PID parameters
-        super().__init__(angle, kp, ki, kd, integralLimit, outputLimit)
+        super().__init__(angle, kp, ki, kd, integralLimit, outputLimit, loopRate)
+
+        # Readings for the current tick.
+        self.snapshot = SensorSnapshot()
 
     def run(self, precisely: bool = False):
+        for _ in self.task(precisely):
+            pass
+
+    def task(self, precisely: bool = False):
+
+        """
+        Returns the control loop of `run()` as a cooperative task: a generator that runs one iteration each time it is
+        resumed, and finishes once the turn is complete. Run it alongside other tasks with a TaskScheduler.
+        """
 
         ANGLE_TOLERANCE = 0 if precisely else 1
         EXIT_SPEED = 0 if precisely else 25
 
-        while not (abs(self.sensor.angle() - self.angle) <= ANGLE_TOLERANCE and \
-            abs(self.leftMotor.speed()) <= EXIT_SPEED and abs(self.rightMotor.speed()) <= EXIT_SPEED):
+        scheduler = LoopScheduler(self.loopRate)
+        snapshot = self.snapshot
+        self.resetMotorCommands()
+
+        recorder = FlightRecorder.ACTIVE
+        if recorder is not None:
+            recorder.begin("GyroTurn")
+
+        stats = LoopProfiler.stats("GyroTurn")
+
+        while True:
+
+            dt = scheduler.tick()
+            snapshot.next()
+            stats.tick()
+
+            # Motor speeds are only read once the angle is within tolerance.
+            error = snapshot.angle(self.sensor) - self.angle
+            if abs(error) <= ANGLE_TOLERANCE and abs(snapshot.speed(self.leftMotor)) <= EXIT_SPEED and \
+                abs(snapshot.speed(self.rightMotor)) <= EXIT_SPEED:
+                break
+
+            stats.read()
+
+            output = self.update(error, dt=dt)
+            leftSpeed, rightSpeed = self.leftDriven * output * -1, self.rightDriven * output
+
+            stats.computed()
+
+            self.runMotors(leftSpeed, rightSpeed)
+
+            stats.written()
 
-            output = self.update(self.sensor.angle() - self.angle)
+            if recorder is not None:
+                recorder.record(self, leftSpeed, rightSpeed)
 
-            self.leftMotor.run(self.leftDriven * output * -1)
-            self.rightMotor.run(self.rightDriven * output)
+            yield
 
         self.leftMotor.hold()
         self.rightMotor.hold()
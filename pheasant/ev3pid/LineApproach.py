@@ -0,0 +1,170 @@
+# LineApproach.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Implements fast gyro straight movement onto a line, correcting back to where the line was crossed.
+
+
+from pybricks.ev3devices import Motor, GyroSensor, ColorSensor
+
+from .GyroStraight import GyroStraight
+from .utils.Clock import Clock
+from .utils.DoubleColorInput import DoubleColorInput
+
+class LineApproach(GyroStraight, DoubleColorInput):
+
+    """
+    Drives straight at `speed` until both color sensors have crossed onto a line, then returns the wheels to where the
+    sensors crossed it.
+
+    ## Discussion
+    Detection latency makes the robot overshoot a line by a distance that grows with speed, which is why line
+    approaches were kept slow. Instead, each sensor's crossing is latched from the tick at which its reflection falls
+    below its threshold: the wheel angles are interpolated between that tick and the previous one by where the threshold
+    lies between their reflections. Once both sensors have crossed, the motors hold, and both wheels run back (plus
+    `offset`) to their angles at the later of the two crossings with a short `run_target`. That is the pose in which a
+    slow `GyroStraight` stopped once both sensors were on the line, and it does not depend on the approach speed.
+
+    After `run()`, `crossing` is the interpolated (left, right) wheel angle, and `overshoot` the mean distance (in wheel
+    degrees) that was corrected. `corrected` is False if the correction timed out before the wheels reached the
+    crossing, which `run()` and `correct()` also return.
+    """
+
+    SEGMENT_NAME = "LineApproach"
+
+    CORRECTION_SPEED_DEFAULT = 200      # In deg/s.
+    CORRECTION_TIMEOUT = 1000           # In ms.
+    POLL_TIME = 5                       # In ms.
+
+    def __init__(self,
+                 speed: float,
+                 angle: int,
+                 offset: float = 0,
+                 correctionSpeed: float = None,
+                 leftSensor: ColorSensor = None,
+                 rightSensor: ColorSensor = None,
+                 leftThreshold: int = None,
+                 rightThreshold: int = None,
+                 sensor: GyroSensor = None,
+                 leftMotor: Motor = None,
+                 rightMotor: Motor = None,
+                 kp: float = None,
+                 ki: float = None,
+                 kd: float = None,
+                 integralLimit: float = None,
+                 outputLimit: float = None,
+                 loopRate: float = None):
+
+        GyroStraight.__init__(self, speed, angle, sensor, leftMotor, rightMotor, kp, ki, kd, integralLimit, outputLimit,
+                              loopRate)
+        DoubleColorInput.__init__(self, leftSensor, rightSensor, leftThreshold, rightThreshold)
+
+        # Resolves optional arguments with default values.
+        self.correctionSpeed = correctionSpeed if correctionSpeed is not None else \
+            LineApproach.CORRECTION_SPEED_DEFAULT
+
+        self.offset = offset            # In wheel degrees, in the direction of travel.
+
+        # Latest and previous readings of each sensor: [reflection, left angle, right angle]
+        self.leftPrevious = None
+        self.rightPrevious = None
+
+        # Results of the latest run
+        self.leftCrossing = None        # (left, right) wheel angles at which each sensor crossed the line.
+        self.rightCrossing = None
+        self.crossing = None
+        self.overshoot = None
+        self.corrected = None
+
+    def __latch(self, sensor, threshold: int, previous: list):
+
+        """
+        Returns the interpolated (left, right) wheel angles if `sensor` crossed below `threshold` this tick, or None.
+        Updates `previous` with this tick's readings.
+        """
+
+        snapshot = self.snapshot
+        reflection = snapshot.reflection(sensor)
+        leftAngle = snapshot.motorAngle(self.leftMotor)
+        rightAngle = snapshot.motorAngle(self.rightMotor)
+
+        crossing = None
+
+        if reflection < threshold:
+            if previous[0] is None or previous[0] == reflection:
+                crossing = (leftAngle, rightAngle)
+            else:
+                fraction = (previous[0] - threshold) / (previous[0] - reflection)
+                crossing = (previous[1] + (leftAngle - previous[1]) * fraction,
+                            previous[2] + (rightAngle - previous[2]) * fraction)
+
+        previous[0] = reflection
+        previous[1] = leftAngle
+        previous[2] = rightAngle
+
+        return crossing
+
+    def __crossed(self) -> bool:
+
+        if self.leftCrossing is None:
+            self.leftCrossing = self.__latch(self.leftSensor, self.leftThreshold, self.leftPrevious)
+        if self.rightCrossing is None:
+            self.rightCrossing = self.__latch(self.rightSensor, self.rightThreshold, self.rightPrevious)
+
+        return self.leftCrossing is not None and self.rightCrossing is not None
+
+    def run(self) -> bool:
+
+        for _ in self.task():
+            pass
+
+        return self.correct()
+
+    def task(self):
+
+        """
+        Returns the approach of `run()` as a cooperative task, which finishes once both sensors have crossed the line.
+        Call `correct()` after the task.
+        """
+
+        self.leftPrevious = [None, None, None]
+        self.rightPrevious = [None, None, None]
+        self.leftCrossing = None
+        self.rightCrossing = None
+
+        return GyroStraight.task(self, self.__crossed)
+
+    def correct(self) -> bool:
+
+        """
+        Holds the motors, then returns the wheels to the later crossing. Returns True if they reached it before
+        `CORRECTION_TIMEOUT`.
+        """
+
+        self.leftMotor.hold()
+        self.rightMotor.hold()
+
+        # The later crossing is the one further along the direction of travel.
+        direction = 1 if self.speed >= 0 else -1
+        later = max(self.leftCrossing, self.rightCrossing, key=lambda crossing: (crossing[0] + crossing[1]) * direction)
+        leftTarget = later[0] + self.offset * direction
+        rightTarget = later[1] + self.offset * direction
+        self.crossing = (leftTarget, rightTarget)
+        self.overshoot = ((self.leftMotor.angle() - leftTarget) + (self.rightMotor.angle() - rightTarget)) / 2 * \
+            direction
+
+        self.leftMotor.run_target(self.correctionSpeed, leftTarget, wait=False)
+        self.rightMotor.run_target(self.correctionSpeed, rightTarget, wait=False)
+
+        self.corrected = True
+        start = Clock.now()
+        while not (self.leftMotor.control.done() and self.rightMotor.control.done()):
+            if Clock.diff(Clock.now(), start) >= LineApproach.CORRECTION_TIMEOUT * 1000:
+                self.corrected = False
+                break
+            Clock.sleep(LineApproach.POLL_TIME * 1000)
+
+        self.leftMotor.hold()
+        self.rightMotor.hold()
+
+        return self.corrected
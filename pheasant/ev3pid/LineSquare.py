@@ -11,6 +11,10 @@ from pybricks.tools import wait
 
 from ev3move import DoubleMotorBase
 from .utils.PIDController import PIDController
+from .utils.LoopScheduler import LoopScheduler
+from .utils.SensorSnapshot import SensorSnapshot
+from .utils.FlightRecorder import FlightRecorder
+from .utils.LoopProfiler import LoopProfiler
 from .utils.DoubleColorInput import DoubleColorInput
 
 class LinePosition:
@@ -34,7 +38,8 @@ class LineSquare(PIDController, DoubleColorInput, DoubleMotorBase):
                  ki: float = None,
                  kd: float = None,
                  integralLimit: float = None,
-                 outputLimit: float = None):
+                 outputLimit: float = None,
+                 loopRate: float = None):
 
         # Line parameters
         self.linePosition = linePosition
@@ -49,25 +54,74 @@ class LineSquare(PIDController, DoubleColorInput, DoubleMotorBase):
         kd = kd if kd is not None else LineSquare.kd_DEFAULT
         integralLimit = integralLimit if integralLimit is not None else LineSquare.INTEGRAL_LIMIT_DEFAULT
         outputLimit = outputLimit if outputLimit is not None else LineSquare.OUTPUT_LIMIT_DEFAULT
+        self.loopRate = loopRate if loopRate is not None else LineSquare.LOOP_RATE_DEFAULT
 
         # PID parameters
-        self.leftPid = PIDController(leftThreshold, kp, ki, kd, integralLimit, outputLimit)
-        self.rightPid = PIDController(rightThreshold, kp, ki, kd, integralLimit, outputLimit)
+        self.leftPid = PIDController(leftThreshold, kp, ki, kd, integralLimit, outputLimit, self.loopRate)
+        self.rightPid = PIDController(rightThreshold, kp, ki, kd, integralLimit, outputLimit, self.loopRate)
+
+        # Readings for the current tick.
+        self.snapshot = SensorSnapshot()
 
     def run(self):
 
+        for _ in self.task():
+            pass
+
+        wait(LineSquare.LINE_WAIT_TIME)
+
+    def task(self):
+
+        """
+        Returns the control loop of `run()` as a cooperative task: a generator that runs one iteration each time it is
+        resumed, and finishes once both sensors are on their thresholds. Run it alongside other tasks with a
+        TaskScheduler. Unlike `run()`, the task does not wait LINE_WAIT_TIME after squaring.
+        """
+
         directionMultiplier = 1 if self.linePosition == LinePosition.AHEAD else -1
 
-        while not (self.leftSensor.reflection() in range(self.leftThreshold - LineSquare.THRESHOLD_TOLERANCE, \
-                   self.leftThreshold + LineSquare.THRESHOLD_TOLERANCE + 1) \
-                   and self.rightSensor.reflection() in range(self.rightThreshold - LineSquare.THRESHOLD_TOLERANCE, \
-                   self.rightThreshold + LineSquare.THRESHOLD_TOLERANCE + 1)):
+        scheduler = LoopScheduler(self.loopRate)
+        snapshot = self.snapshot
+        self.resetMotorCommands()
+
+        # Each side is a separate segment.
+        recorder = FlightRecorder.ACTIVE
+        if recorder is not None:
+            leftSegment = recorder.begin("LineSquare left")
+            rightSegment = recorder.begin("LineSquare right")
+
+        stats = LoopProfiler.stats("LineSquare")
+
+        while True:
+
+            dt = scheduler.tick()
+            snapshot.next()
+            stats.tick()
 
-            self.leftMotor.run(self.leftPid.update(self.leftSensor.reflection() - self.leftThreshold) \
-                * directionMultiplier)
-            self.rightMotor.run(self.rightPid.update(self.rightSensor.reflection() - self.rightThreshold) \
-                * directionMultiplier)
+            leftError = snapshot.reflection(self.leftSensor) - self.leftThreshold
+            rightError = snapshot.reflection(self.rightSensor) - self.rightThreshold
+
+            if abs(leftError) <= LineSquare.THRESHOLD_TOLERANCE and abs(rightError) <= LineSquare.THRESHOLD_TOLERANCE:
+                break
+
+            stats.read()
+
+            leftSpeed = self.leftPid.update(leftError, dt=dt) * directionMultiplier
+            rightSpeed = self.rightPid.update(rightError, dt=dt) * directionMultiplier
+
+            stats.computed()
+
+            self.runMotors(leftSpeed, rightSpeed)
+
+            stats.written()
+
+            if recorder is not None:
+                recorder.segment = leftSegment
+                recorder.record(self.leftPid, leftSpeed, rightSpeed)
+                recorder.segment = rightSegment
+                recorder.record(self.rightPid, leftSpeed, rightSpeed)
+
+            yield
 
         self.leftMotor.hold()
         self.rightMotor.hold()
-        wait(LineSquare.LINE_WAIT_TIME)
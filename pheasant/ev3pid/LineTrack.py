@@ -9,6 +9,11 @@ from pybricks.ev3devices import Motor, ColorSensor
 
 from ev3move import DoubleMotorBase
 from .utils.PIDController import PIDController
+from .utils.LoopScheduler import LoopScheduler
+from .utils.SensorSnapshot import SensorSnapshot
+from .utils.FlightRecorder import FlightRecorder
+from .utils.LoopProfiler import LoopProfiler
+from .utils.StopCondition import StopCondition
 from .utils.ColorInput import ColorInput
 
 # The edge of the black line that the sensor follows.
@@ -29,7 +34,8 @@ class LineTrack(PIDController, ColorInput, DoubleMotorBase):
                  ki: float = None,
                  kd: float = None,
                  integralLimit: float = None,
-                 outputLimit: float = None):
+                 outputLimit: float = None,
+                 loopRate: float = None):
 
         # Movement parameters
         self.speed = speed
@@ -40,15 +46,67 @@ class LineTrack(PIDController, ColorInput, DoubleMotorBase):
         DoubleMotorBase.__init__(self, leftMotor, rightMotor)
 
         # PID parameters
-        PIDController.__init__(self, threshold, kp, ki, kd, integralLimit, outputLimit)
+        PIDController.__init__(self, threshold, kp, ki, kd, integralLimit, outputLimit, loopRate)
+
+        # Readings for the current tick, shared with stop conditions.
+        self.snapshot = SensorSnapshot()
 
     def runUntil(self, stopCondition):
-        while not stopCondition():
-            output = self.update(self.sensor.reflection() - self.threshold, 0.4) * \
-                (1 if self.trackingEdge == LineEdge.LEFT else -1)
+        for _ in self.task(stopCondition):
+            pass
+
+    def task(self, stopCondition):
+
+        """
+        Returns the control loop of `runUntil()` as a cooperative task: a generator that runs one iteration each time it
+        is resumed, and finishes once `stopCondition()` is true. Run it alongside other tasks with a TaskScheduler.
+        """
+
+        scheduler = LoopScheduler(self.loopRate)
+        snapshot = self.snapshot
+        self.resetMotorCommands()
+
+        if isinstance(stopCondition, StopCondition):
+            stopCondition.bind(snapshot)
+
+        recorder = FlightRecorder.ACTIVE
+        if recorder is not None:
+            recorder.begin("LineTrack")
+
+        stats = LoopProfiler.stats("LineTrack")
+
+        try:
+            while True:
+
+                dt = scheduler.tick()
+                snapshot.next()
+                stats.tick()
+
+                if stopCondition():
+                    break
+
+                error = snapshot.reflection(self.sensor) - self.threshold
+
+                stats.read()
+
+                output = self.update(error, 0.4, dt) * (1 if self.trackingEdge == LineEdge.LEFT else -1)
+                leftSpeed, rightSpeed = self.speed + output, self.speed - output
+
+                stats.computed()
+
+                self.runMotors(leftSpeed, rightSpeed)
+
+                stats.written()
+
+                if recorder is not None:
+                    recorder.record(self, leftSpeed, rightSpeed)
+
+                yield
 
-            self.leftMotor.run(self.speed + output)
-            self.rightMotor.run(self.speed - output)
+        finally:
+            # Unbinds the condition, so that later direct calls don't read this loop's last tick.
+            if isinstance(stopCondition, StopCondition):
+                stopCondition.unbind()
 
         self.reset()
 
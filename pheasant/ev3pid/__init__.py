@@ -6,8 +6,10 @@
 
 
 # Built-in modules
+from .ApproachSquare import *
 from .GyroStraight import *
 from .GyroTurn import *
+from .LineApproach import *
 from .LineSquare import *
 from .LineTrack import *
 
@@ -16,6 +18,17 @@ from .utils.ColorInput import *
 from .utils.DoubleColorInput import *
 from .utils.GyroInput import *
 from .utils.PIDController import *
+from .utils.LoopScheduler import *
+from .utils.SensorSnapshot import *
+from .utils.SysfsInput import *
+from .utils.SensorSampler import *
+from .utils.Clock import *
+from .utils.FlightRecorder import *
+from .utils.LoopProfiler import *
+from .utils.Settle import *
+from .utils.TaskScheduler import *
+from .utils.StopCondition import *
+from .utils.ColorModeManager import *
 
 # Dependencies
 from ev3move import DoubleMotorBase                                                  #pylint: disable=wrong-import-order
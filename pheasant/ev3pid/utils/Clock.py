@@ -0,0 +1,55 @@
+# Clock.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Microsecond time source for ev3pid control loops.
+
+
+try:
+    from time import ticks_us, ticks_add, ticks_diff, sleep_us     # MicroPython (pybricks-micropython)
+except ImportError:
+    from time import perf_counter, sleep                           # CPython, for running off the brick
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_add(ticks, delta):
+        return ticks + delta
+
+    def ticks_diff(new, old):
+        return new - old
+
+    def sleep_us(us):
+        sleep(us / 1000000)
+
+class Clock:
+
+    """
+    Time source used by ev3pid. All times are in microseconds. Use `add()` and `diff()` for arithmetic on times, as
+    MicroPython tick counts wrap around.
+
+    ## Discussion
+    The source can be replaced with `setSource()`, e.g. so that a simulator can drive the control loops with simulated
+    time instead of wall time.
+    """
+
+    now = staticmethod(ticks_us)
+    add = staticmethod(ticks_add)
+    diff = staticmethod(ticks_diff)
+    sleep = staticmethod(sleep_us)
+
+    @classmethod
+    def setSource(cls, now, sleep):
+
+        # Replacement sources use plain integers, which do not wrap around.
+        cls.now = staticmethod(now)
+        cls.sleep = staticmethod(sleep)
+        cls.add = staticmethod(lambda ticks, delta: ticks + delta)
+        cls.diff = staticmethod(lambda new, old: new - old)
+
+    @classmethod
+    def resetSource(cls):
+        cls.now = staticmethod(ticks_us)
+        cls.add = staticmethod(ticks_add)
+        cls.diff = staticmethod(ticks_diff)
+        cls.sleep = staticmethod(sleep_us)
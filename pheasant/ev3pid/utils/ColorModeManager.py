@@ -0,0 +1,182 @@
+# ColorModeManager.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Pins color sensors to one ev3dev mode per run phase, and counts and times the mode switches that remain.
+
+
+from pybricks.parameters import Color
+
+from .Clock import Clock                                                     # pylint: disable=relative-beyond-top-level
+
+class ColorMode:
+    REFLECTION = hash("REFLECTION")     #HACK: enum workaround.
+    COLOR = hash("COLOR")
+    AMBIENT = hash("AMBIENT")
+    RGB = hash("RGB")
+
+class ColorModeManager:
+
+    """
+    Wraps color sensors so that each stays in one ev3dev mode for a run phase.
+
+    ## Discussion
+    On ev3dev, a ColorSensor changes mode (COL-REFLECT, COL-COLOR, ...) whenever a reading of another kind is requested,
+    which takes tens of milliseconds and can return a stale value. Wrap each sensor with `sensor()`, then `pin()` a mode
+    at the start of each run phase.
+
+    While pinned to REFLECTION, `color()` is derived from the reflection, using thresholds from calibration: BLACK
+    below `black`, WHITE above `white`, and None otherwise. Other colors cannot be told apart this way, so a phase that
+    needs them, such as checking for green, should pin COLOR.
+
+    Readings that the pinned mode cannot serve still switch the mode. Every switch is counted and timed per sensor and
+    per phase; `report()` prints the totals.
+    """
+
+    def __init__(self):
+
+        self.sensors = []
+        self.mode = None                # Pinned mode, or None for no pinning.
+        self.phase = None
+        self.phases = {}                # Phase name -> [switches, total switch time in us]
+
+    def sensor(self, sensor, name: str, black: int, white: int):
+
+        """
+        Returns a managed wrapper for `sensor`, which reads black below reflection `black` and white above `white` when
+        its color is derived.
+        """
+
+        managed = ManagedColorSensor(self, sensor, name, black, white)
+        self.sensors.append(managed)
+
+        return managed
+
+    def pin(self, mode: ColorMode, phase: str = None):
+
+        """
+        Pins every managed sensor to `mode` (or none, if None) until the next `pin()`, and names the run phase.
+        """
+
+        self.mode = mode
+        self.phase = phase
+
+    def recordSwitch(self, time: int):
+
+        stats = self.phases.get(self.phase)
+        if stats is None:
+            stats = self.phases[self.phase] = [0, 0]
+
+        stats[0] += 1
+        stats[1] += time
+
+    def switches(self) -> int:
+        return sum(sensor.switches for sensor in self.sensors)
+
+    def report(self):
+
+        for sensor in self.sensors:
+            print(sensor.name, ":", sensor.switches, "mode switches,", round(sensor.switchTime / 1000), "ms total,",
+                  round(sensor.maxSwitchTime / 1000), "ms max")
+
+        for phase, (switches, time) in self.phases.items():
+            print("  in", phase, ":", switches, "mode switches,", round(time / 1000), "ms")
+
+class ManagedColorSensor:
+
+    """
+    A color sensor that tracks its ev3dev mode. Compares and hashes as the wrapped sensor, so that it can stand in for
+    it in ColorInput.KNOWN_THRESHOLDS.
+    """
+
+    def __init__(self, manager: ColorModeManager, sensor, name: str, black: int, white: int):
+
+        self.manager = manager
+        self.sensor = sensor
+        self.name = name
+        self.black = black
+        self.white = white
+
+        self.mode = None                # Mode of the latest reading; unknown at first.
+        self.switches = 0
+        self.switchTime = 0             # In us.
+        self.maxSwitchTime = 0
+
+    def __eq__(self, other):
+        return other is self or other is self.sensor
+
+    def __hash__(self):
+        return hash(self.sensor)
+
+    def __switched(self, mode: ColorMode, start: int):
+
+        if self.mode is not None:
+
+            time = Clock.diff(Clock.now(), start)
+
+            self.switches += 1
+            self.switchTime += time
+            self.maxSwitchTime = max(self.maxSwitchTime, time)
+            self.manager.recordSwitch(time)
+
+        self.mode = mode
+
+    def calibrate(self, black: int, white: int):
+        self.black = black
+        self.white = white
+
+    def reflection(self) -> int:
+
+        if self.mode == ColorMode.REFLECTION:
+            return self.sensor.reflection()
+
+        start = Clock.now()
+        value = self.sensor.reflection()
+        self.__switched(ColorMode.REFLECTION, start)
+
+        return value
+
+    def color(self):
+
+        # Derives black and white from the reflection, instead of switching modes.
+        if self.manager.mode == ColorMode.REFLECTION:
+
+            reflection = self.reflection()
+
+            if reflection < self.black:
+                return Color.BLACK
+            elif reflection > self.white:
+                return Color.WHITE
+            else:
+                return None
+
+        if self.mode == ColorMode.COLOR:
+            return self.sensor.color()
+
+        start = Clock.now()
+        value = self.sensor.color()
+        self.__switched(ColorMode.COLOR, start)
+
+        return value
+
+    def ambient(self) -> int:
+
+        if self.mode == ColorMode.AMBIENT:
+            return self.sensor.ambient()
+
+        start = Clock.now()
+        value = self.sensor.ambient()
+        self.__switched(ColorMode.AMBIENT, start)
+
+        return value
+
+    def rgb(self) -> tuple:
+
+        if self.mode == ColorMode.RGB:
+            return self.sensor.rgb()
+
+        start = Clock.now()
+        value = self.sensor.rgb()
+        self.__switched(ColorMode.RGB, start)
+
+        return value
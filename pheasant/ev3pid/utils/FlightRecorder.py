@@ -0,0 +1,202 @@
+# FlightRecorder.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Records control loop samples into a preallocated ring buffer, for analysis after a run.
+
+
+try:
+    from ustruct import pack, pack_into                         # MicroPython (pybricks-micropython)
+except ImportError:
+    from struct import pack, pack_into                          # CPython, for running off the brick
+
+from pybricks.tools import wait
+
+from .Clock import Clock                                                     # pylint: disable=relative-beyond-top-level
+
+class FlightRecorder:
+
+    """
+    A ring buffer of control loop samples: time, segment, dt, setpoint, error, P, I and D terms, output, and left and
+    right motor commands.
+
+    ## Discussion
+    Samples are packed into one preallocated bytearray as fixed-size little-endian records (`RECORD_FORMAT`), so
+    recording a sample allocates no buffers and takes constant time. When the buffer is full, the oldest samples are
+    overwritten and counted as dropped.
+
+    Each control loop run is a segment. Call `begin()` with a name at the start of the loop, then `record()` once per
+    tick with the controller after `update()` and the motor commands written. Segment names are prefixed with the
+    current `procedure`, if set, as "procedure/name". Segment numbers are 16-bit, so once MAX_SEGMENTS names have been
+    used, later runs reuse the number of an earlier segment with the same name, or share a final "overflow" segment.
+
+    `wait()` stands in for pybricks.tools.wait(), and records each wait as one sample of the procedure's "wait"
+    segment, with the requested time as the setpoint and the measured time as the output, both in ms. Settle waits
+    are recorded the same way by `recordWait()`, in "wait <name>" segments with the timeout as the setpoint, and an
+    error of 1 if they timed out. Waits reuse one segment per name, so polling loops don't use up segment numbers.
+
+    `activate()` makes a recorder the one that the ev3pid controllers record to. Call `dump()` at the end of the run,
+    including on abort, to write the buffer to a compact binary file:
+
+        header      HEADER_FORMAT: magic, version, record size, sample count, dropped samples, segment count, length of
+                    the segment name table
+        names       segment names, UTF-8, separated by newlines
+        records     sample records in chronological order
+    """
+
+    ACTIVE = None                       # Recorder that ev3pid controllers record to, or None.
+
+    MAGIC = b'PHFR'
+    VERSION = 2                         # 2 added dt, in place of a reserved field.
+    HEADER_FORMAT = '<4sHHIIII'
+    HEADER_SIZE = 24
+
+    # Time since the recorder started (us), segment, dt passed to the update (us; 0 for none, saturating at DT_MAX),
+    # then setpoint, error, P, I, D, output, left and right motor commands.
+    RECORD_FORMAT = '<IHH8f'
+    RECORD_SIZE = 40
+    FIELDS = ('time', 'segment', 'dt', 'setpoint', 'error', 'p', 'i', 'd', 'output', 'left', 'right')
+    DT_MAX = 0xFFFF
+    MAX_SEGMENTS = 0x10000              # Segment numbers are 16-bit.
+
+    def __init__(self, capacity: int = 32768):
+
+        self.capacity = capacity
+        self.buffer = bytearray(capacity * FlightRecorder.RECORD_SIZE)
+
+        self.head = 0                   # Index of the next record to write.
+        self.count = 0                  # Number of valid records.
+        self.dropped = 0                # Records overwritten because the buffer was full.
+
+        self.segments = []              # Segment names, by segment number.
+        self.numbers = {}               # Latest segment number, by segment name.
+        self.segment = 0
+        self.procedure = None           # Name of the mission procedure being run, or None.
+
+        self.start = Clock.now()
+
+    def activate(self):
+        FlightRecorder.ACTIVE = self
+
+    @classmethod
+    def deactivate(cls):
+        cls.ACTIVE = None
+
+    def begin(self, name: str, reuse: bool = False) -> int:
+
+        """
+        Starts a new segment, and returns its number. If `reuse` is True, continues the latest segment with the same
+        name instead, if there is one.
+        """
+
+        if self.procedure is not None:
+            name = self.procedure + "/" + name
+
+        segment = self.numbers.get(name) if reuse or len(self.segments) >= FlightRecorder.MAX_SEGMENTS - 1 else None
+        if segment is None:
+            if len(self.segments) < FlightRecorder.MAX_SEGMENTS - 1:
+                segment = len(self.segments)
+                self.segments.append(name)
+            else:
+                # Out of segment numbers, so new names share the last one.
+                segment = FlightRecorder.MAX_SEGMENTS - 1
+                if len(self.segments) < FlightRecorder.MAX_SEGMENTS:
+                    self.segments.append("overflow")
+            self.numbers[name] = segment
+
+        self.segment = segment
+        return segment
+
+    def record(self, controller, leftCommand: float, rightCommand: float):
+
+        """
+        Records a sample from a PIDController that has just been updated.
+        """
+
+        dt = controller.dt
+
+        self.__write(Clock.now(), min(round(dt * 1000), FlightRecorder.DT_MAX) if dt is not None else 0,
+                     controller.setpoint if controller.setpoint is not None else 0, controller.prevError,
+                     controller.pTerm, controller.iTerm, controller.dTerm, controller.output, leftCommand, rightCommand)
+
+    def wait(self, milliseconds: float):
+
+        start = Clock.now()
+        wait(milliseconds)
+        self.recordWait("wait", milliseconds, start, Clock.diff(Clock.now(), start) / 1000)
+
+    def recordWait(self, name: str, requested: float, start: int, elapsed: float, timedOut: bool = False):
+
+        """
+        Records a wait that started at Clock time `start` as a sample of the segment named `name`. `requested` and
+        `elapsed` are in ms.
+        """
+
+        segment = self.segment
+        self.begin(name, reuse=True)
+        self.__write(start, 0, requested, 1 if timedOut else 0, 0, 0, 0, elapsed, 0, 0)
+        self.segment = segment
+
+    def __write(self, time: int, dt: int, setpoint: float, error: float, p: float, i: float, d: float, output: float,
+                left: float, right: float):
+
+        """
+        Writes a record to the current segment at the head of the ring buffer, for Clock time `time`.
+        """
+
+        pack_into(FlightRecorder.RECORD_FORMAT, self.buffer, self.head * FlightRecorder.RECORD_SIZE,
+                  Clock.diff(time, self.start) & 0xFFFFFFFF, self.segment, dt, setpoint, error, p, i, d, output, left,
+                  right)
+
+        self.head += 1
+        if self.head == self.capacity:
+            self.head = 0
+
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.dropped += 1
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+        self.dropped = 0
+
+    def dump(self, path: str):
+
+        """
+        Writes the recorded samples to a binary file at `path`.
+        """
+
+        names = "\n".join(self.segments).encode()
+
+        with open(path, 'wb') as file:
+
+            file.write(pack(FlightRecorder.HEADER_FORMAT, FlightRecorder.MAGIC, FlightRecorder.VERSION,
+                            FlightRecorder.RECORD_SIZE, self.count, self.dropped, len(self.segments), len(names)))
+            file.write(names)
+
+            # Unrolls the ring buffer, oldest record first.
+            view = memoryview(self.buffer)
+            first = (self.head - self.count) % self.capacity
+            if first + self.count <= self.capacity:
+                file.write(view[first * FlightRecorder.RECORD_SIZE:(first + self.count) * FlightRecorder.RECORD_SIZE])
+            else:
+                file.write(view[first * FlightRecorder.RECORD_SIZE:])
+                file.write(view[:self.head * FlightRecorder.RECORD_SIZE])
+
+    @classmethod
+    def measureOverhead(cls, controller, samples: int = 1000) -> float:
+
+        """
+        Returns the mean time taken to record a sample from `controller`, in us, using a separate recorder.
+        """
+
+        recorder = cls(samples)
+        recorder.begin("overhead")
+
+        start = Clock.now()
+        for _ in range(samples):
+            recorder.record(controller, 0, 0)
+
+        return Clock.diff(Clock.now(), start) / samples
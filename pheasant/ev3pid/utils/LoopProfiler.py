@@ -0,0 +1,204 @@
+# LoopProfiler.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Measures control loop rate and jitter, and where each iteration's time goes.
+
+
+from .Clock import Clock                                                     # pylint: disable=relative-beyond-top-level
+
+class LoopStats:
+
+    """
+    Timing of one controller invocation: the iteration count, the period between iterations (minimum, mean and maximum,
+    and a histogram), and the total time spent reading sensors, computing, and writing to the motors.
+
+    ## Discussion
+    Call `tick()` at the start of every iteration, after the LoopScheduler tick, then `read()` once the sensors are
+    read, `computed()` once the motor commands are computed, and `written()` once they are written. Each call takes the
+    time since the previous one. The rest of each period (scheduler waits, FlightRecorder and other overheads) is
+    reported as other time.
+
+    The histogram has `LoopProfiler.BUCKET_COUNT` buckets of `LoopProfiler.BUCKET_WIDTH` us each; the last bucket
+    also counts all longer periods. Updating the statistics allocates no memory.
+    """
+
+    def __init__(self, name: str):
+
+        self.name = name
+
+        self.iterations = 0                 # Iterations that wrote to the motors.
+        self.periods = 0
+        self.periodMin = None               # In us.
+        self.periodMax = None
+        self.periodTotal = 0
+        self.histogram = [0] * LoopProfiler.BUCKET_COUNT
+
+        # Time per phase, in us
+        self.readTime = 0
+        self.mathTime = 0
+        self.writeTime = 0
+
+        self.start = None                   # Of the current iteration.
+        self.mark = None                    # Of the latest phase.
+
+    def tick(self):
+
+        now = Clock.now()
+
+        if self.start is not None:
+            period = Clock.diff(now, self.start)
+            self.periods += 1
+            self.periodTotal += period
+            if self.periodMin is None or period < self.periodMin:
+                self.periodMin = period
+            if self.periodMax is None or period > self.periodMax:
+                self.periodMax = period
+            self.histogram[min(period // LoopProfiler.BUCKET_WIDTH, LoopProfiler.BUCKET_COUNT - 1)] += 1
+
+        self.start = now
+        self.mark = now
+
+    def read(self):
+        now = Clock.now()
+        self.readTime += Clock.diff(now, self.mark)
+        self.mark = now
+
+    def computed(self):
+        now = Clock.now()
+        self.mathTime += Clock.diff(now, self.mark)
+        self.mark = now
+
+    def written(self):
+        now = Clock.now()
+        self.writeTime += Clock.diff(now, self.mark)
+        self.mark = now
+        self.iterations += 1
+
+    def periodMean(self) -> float:
+        return self.periodTotal / self.periods if self.periods else None
+
+    def rate(self) -> float:
+
+        """
+        Returns the mean loop rate, in Hz, over the periods measured so far, or None before the second tick.
+        """
+
+        return 1000000 * self.periods / self.periodTotal if self.periodTotal else None
+
+    def summary(self) -> str:
+
+        if not self.periods:
+            return self.name + ": " + str(self.iterations) + " iterations"
+
+        otherTime = max(self.periodTotal - self.readTime - self.mathTime - self.writeTime, 0)
+        phases = ("read", self.readTime), ("math", self.mathTime), ("write", self.writeTime), ("other", otherTime)
+
+        lines = [self.name + ": " + str(self.iterations) + " iterations, " + str(round(self.rate())) + " Hz; period " +
+                 str(self.periodMin) + "/" + str(round(self.periodMean())) + "/" + str(self.periodMax) +
+                 " us min/mean/max; " +
+                 ", ".join(phase + " " + str(round(100 * time / self.periodTotal)) + "%" for phase, time in phases)]
+
+        width = LoopProfiler.BUCKET_WIDTH
+        for i, count in enumerate(self.histogram):
+            if count:
+                lines.append("    " + str(i * width) + ("+" if i == len(self.histogram) - 1 else
+                                                          "-" + str((i + 1) * width)) + " us: " + str(count))
+
+        return "\n".join(lines)
+
+    def csv(self) -> str:
+        return ",".join([self.name, str(self.iterations), str(self.periodMin), str(self.periodMean()),
+                         str(self.periodMax), str(self.readTime), str(self.mathTime), str(self.writeTime)] +
+                        [str(count) for count in self.histogram])
+
+class NullLoopStats:
+
+    """
+    Stands in for LoopStats while no profiler is active.
+
+    ## Discussion
+    Controller loops report each phase unconditionally, without checking whether profiling is on; while it is off,
+    their calls land here and do nothing.
+    """
+
+    name = None
+
+    def tick(self):
+        pass
+
+    def read(self):
+        pass
+
+    def computed(self):
+        pass
+
+    def written(self):
+        pass
+
+class LoopProfiler:
+
+    """
+    Collects LoopStats for each invocation of the ev3pid control loops.
+
+    ## Discussion
+    `activate()` makes a profiler the one that the ev3pid controllers report to, and `deactivate()` turns profiling
+    off. Controllers get their statistics from `stats()` once per invocation, so switching takes effect from the next
+    invocation. While off, `stats()` returns the shared NULL_STATS, which costs an empty method call per phase.
+    Invocation names are prefixed with the current `procedure`, if set, as "procedure/name".
+
+    Print `report()`, or `dump()` the invocations to a CSV file with one row per invocation.
+    """
+
+    ACTIVE = None                       # Profiler that ev3pid controllers report to, or None.
+    NULL_STATS = NullLoopStats()        # Statistics for invocations while no profiler is active.
+
+    # Period histogram
+    BUCKET_WIDTH = 250                  # In us.
+    BUCKET_COUNT = 40
+
+    def __init__(self):
+        self.invocations = []
+        self.procedure = None           # Name of the mission procedure being run, or None.
+
+    def activate(self):
+        LoopProfiler.ACTIVE = self
+
+    @classmethod
+    def deactivate(cls):
+        cls.ACTIVE = None
+
+    @classmethod
+    def stats(cls, name: str):
+
+        """
+        Returns the statistics for a new invocation of the active profiler, or NULL_STATS if there is none.
+        """
+
+        return cls.ACTIVE.begin(name) if cls.ACTIVE is not None else cls.NULL_STATS
+
+    def begin(self, name: str) -> LoopStats:
+
+        """
+        Returns the statistics for a new invocation.
+        """
+
+        stats = LoopStats(name if self.procedure is None else self.procedure + "/" + name)
+        self.invocations.append(stats)
+
+        return stats
+
+    def clear(self):
+        self.invocations = []
+
+    def report(self) -> str:
+        return "\n".join(stats.summary() for stats in self.invocations)
+
+    def dump(self, path: str):
+
+        with open(path, 'w') as file:
+            buckets = ["bucket" + str(i * LoopProfiler.BUCKET_WIDTH) for i in range(LoopProfiler.BUCKET_COUNT)]
+            file.write(",".join(["name", "iterations", "periodMin", "periodMean", "periodMax", "readTime", "mathTime",
+                                 "writeTime"] + buckets) + "\n")
+            for stats in self.invocations:
+                file.write(stats.csv() + "\n")
@@ -0,0 +1,68 @@
+# LoopScheduler.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Runs control loops at a fixed rate.
+
+
+from .Clock import Clock                                                     # pylint: disable=relative-beyond-top-level
+
+class LoopScheduler:
+
+    """
+    Paces a control loop at a target rate, in Hz.
+
+    ## Discussion
+    Call `tick()` once at the start of every iteration. It blocks until the next period begins, then returns the
+    measured time since the previous tick, in ms, to be passed to `PIDController.update()` as `dt`.
+
+    If `rate` is None, the loop is free-running: `tick()` never blocks and always returns None, so controllers fall back
+    to fixed-step updates. `tick()` also returns None on the first iteration, as there is no previous tick.
+
+    If an iteration overruns its period, the schedule restarts from the current time instead of bursting to catch up.
+    """
+
+    def __init__(self, rate: float = None):
+
+        self.rate = rate
+        self.period = int(1000000 / rate) if rate is not None else None        # In us.
+
+        self.prevTick = None
+        self.nextTick = None
+
+        # Statistics
+        self.ticks = 0
+        self.overruns = 0
+
+    def tick(self) -> float:
+
+        self.ticks += 1
+
+        if self.period is None:
+            return None
+
+        now = Clock.now()
+
+        if self.nextTick is not None:
+
+            remaining = Clock.diff(self.nextTick, now)
+            if remaining > 0:
+                Clock.sleep(remaining)
+                now = Clock.now()
+            else:
+                self.overruns += 1
+
+        # Schedules the next tick; restarts the schedule if the loop has fallen behind.
+        if self.nextTick is None or Clock.diff(now, self.nextTick) >= self.period:
+            self.nextTick = Clock.add(now, self.period)
+        else:
+            self.nextTick = Clock.add(self.nextTick, self.period)
+
+        dt = Clock.diff(now, self.prevTick) / 1000 if self.prevTick is not None else None
+        self.prevTick = now
+
+        return dt
+
+    def reset(self):
+        self.prevTick = None
+        self.nextTick = None
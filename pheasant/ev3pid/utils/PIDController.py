@@ -13,6 +13,12 @@ class PIDController:
     kd_DEFAULT = None
     INTEGRAL_LIMIT_DEFAULT = None
     OUTPUT_LIMIT_DEFAULT = None
+    LOOP_RATE_DEFAULT = None
+
+    # The loop period (in ms) at which gains are tuned. When set, and update() is given a measured dt, the integral and
+    # differential terms are scaled relative to this period, so that existing tunings keep their meaning. It is None
+    # until the free-running period has been measured on the brick (see LoopProfiler); until then, dt is not used.
+    NOMINAL_PERIOD = None
 
     def __init__(self,
                  setpoint: int,
@@ -20,7 +26,8 @@ class PIDController:
                  ki: float,
                  kd: float,
                  integralLimit: float,
-                 outputLimit: float):
+                 outputLimit: float,
+                 loopRate: float = None):
 
         # Resolves optional arguments with default values.
         kp = kp if kp is not None else self.__class__.kp_DEFAULT
@@ -28,6 +35,7 @@ class PIDController:
         kd = kd if kd is not None else self.__class__.kd_DEFAULT
         integralLimit = integralLimit if integralLimit is not None else self.__class__.INTEGRAL_LIMIT_DEFAULT
         outputLimit = outputLimit if outputLimit is not None else self.__class__.OUTPUT_LIMIT_DEFAULT
+        loopRate = loopRate if loopRate is not None else self.__class__.LOOP_RATE_DEFAULT
 
         # PID parameters
         self.setpoint = setpoint
@@ -37,24 +45,48 @@ class PIDController:
         self.integralLimit = integralLimit
         self.outputLimit = outputLimit
 
+        # Loop parameters
+        self.loopRate = loopRate          # In Hz; None for a free-running loop.
+
         # PID loop terms
         self.prevError = 0
         self.integral = 0
 
-    def update(self, error: float, integralMultiplier: int = 1) -> float:
+        # Terms of the latest update, for FlightRecorder
+        self.pTerm = 0
+        self.iTerm = 0
+        self.dTerm = 0
+        self.output = 0
+        self.dt = None
+
+    def update(self, error: float, integralMultiplier: int = 1, dt: float = None) -> float:
+
+        """
+        Returns the controller output for `error`. If `dt` (the measured time since the previous update, in ms) is
+        given and `NOMINAL_PERIOD` is set, the integral and differential terms are scaled by `dt` relative to
+        `NOMINAL_PERIOD`; otherwise, a fixed step is assumed.
+        """
+
+        nominalPeriod = self.__class__.NOMINAL_PERIOD
 
         # Proportional term
         pTerm = error * self.kp
 
         # Integral term
-        self.integral = self.integral * integralMultiplier + error
+        if dt is None or nominalPeriod is None:
+            self.integral = self.integral * integralMultiplier + error
+        else:
+            self.integral = self.integral * integralMultiplier + error * (dt / nominalPeriod)
         if self.integralLimit is not None:          # Applies integral limit, if set.
             self.integral = min(self.integral, self.integralLimit)
             self.integral = max(self.integral, self.integralLimit * -1)
         iTerm = self.integral * self.ki
 
         # Differential term
-        dTerm = (error - self.prevError) * self.kd
+        if dt is None or nominalPeriod is None:
+            dTerm = (error - self.prevError) * self.kd
+        else:
+            dTerm = (error - self.prevError) * self.kd * (nominalPeriod / dt) if dt > 0 else 0
 
         self.prevError = error
 
@@ -63,6 +95,12 @@ class PIDController:
             output = min(output, self.outputLimit)
             output = max(output, self.outputLimit * -1)
 
+        self.pTerm = pTerm
+        self.iTerm = iTerm
+        self.dTerm = dTerm
+        self.output = output
+        self.dt = dt
+
         return output
 
     def reset(self):
@@ -82,3 +120,11 @@ class PIDController:
     @classmethod
     def setDefaultOutputLimit(cls, limit: float):
         cls.OUTPUT_LIMIT_DEFAULT = limit
+
+    @classmethod
+    def setDefaultLoopRate(cls, rate: float):
+        cls.LOOP_RATE_DEFAULT = rate
+
+    @classmethod
+    def setNominalPeriod(cls, period: float):
+        cls.NOMINAL_PERIOD = period
@@ -0,0 +1,273 @@
+# SensorSampler.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Background sensor sampling into timestamped ring buffers.
+
+
+from array import array
+import _thread
+
+from .Clock import Clock                                                     # pylint: disable=relative-beyond-top-level
+
+class SampleBuffer:
+
+    """
+    Fixed-size ring buffer of timestamped sensor samples. Storage is preallocated, so appending does not allocate.
+
+    ## Discussion
+    Each sample has `width` integer values (e.g. 1 for a gyro angle, 3 for an RGB reading). There is a single writer
+    (the sampler thread); readers only ever read the most recently completed sample, which the writer does not touch
+    until it has written `capacity - 1` newer samples.
+    """
+
+    def __init__(self, name: str, read, width: int = 1, capacity: int = 32):
+
+        self.name = name
+        self.read = read
+        self.width = width
+        self.capacity = capacity
+
+        self.times = array('l', [0] * capacity)                 # In us, from Clock.
+        self.values = array('l', [0] * (capacity * width))
+
+        self.count = 0                                          # Total samples written.
+
+    def append(self, time: int, value):
+
+        index = self.count % self.capacity
+        self.times[index] = time
+
+        if self.width == 1:
+            self.values[index] = value
+        else:
+            start = index * self.width
+            for i in range(self.width):
+                self.values[start + i] = value[i]
+
+        self.count += 1                                         # Publishes the sample.
+
+    def latest(self):
+
+        """
+        Returns the most recent sample, or None if there are no samples yet.
+        """
+
+        if self.count == 0:
+            return None
+
+        index = (self.count - 1) % self.capacity
+
+        if self.width == 1:
+            return self.values[index]
+
+        start = index * self.width
+        return tuple(self.values[start:start + self.width])
+
+    def latestTime(self) -> int:
+        return self.times[(self.count - 1) % self.capacity] if self.count > 0 else None
+
+    def sampleRate(self) -> float:
+
+        """
+        Returns the sample rate in Hz, measured over the samples currently in the buffer.
+        """
+
+        samples = min(self.count, self.capacity)
+        if samples < 2:
+            return 0
+
+        newest = (self.count - 1) % self.capacity
+        oldest = (self.count - samples) % self.capacity
+        span = Clock.diff(self.times[newest], self.times[oldest])
+
+        return (samples - 1) * 1000000 / span if span > 0 else 0
+
+    def staleness(self) -> int:
+
+        """
+        Returns the age of the most recent sample, in us.
+        """
+
+        return Clock.diff(Clock.now(), self.latestTime()) if self.count > 0 else None
+
+class SensorSampler:
+
+    """
+    Polls registered sensors on a background thread, round-robin, so that control loops can read the latest sample
+    without blocking on ev3dev.
+
+    ## Discussion
+    Register sensors with `register()`, or wrap them with `gyroSensor()`, `colorSensor()` and `ev3devSensor()` to get
+    drop-in replacements for the pybricks objects. Then call `start()`.
+
+    Wrapped sensors serve one reading (angle, reflection, or one Ev3devSensor mode) from the buffer. Other readings are
+    passed through to the sensor under `lock`, which the sampler thread also holds for each of its reads, so that a
+    pass-through read never interleaves with a sampled read of the same sensor in another mode. Each pass-through still
+    switches the ev3dev mode, and the sampler's next read of that sensor switches it back, so pass-through reads in a
+    control loop cost two mode switches each.
+    """
+
+    def __init__(self, capacity: int = 32, period: int = 0):
+
+        self.capacity = capacity
+        self.period = period                # Minimum time per round, in us. 0 polls as fast as possible.
+
+        self.buffers = []
+        self.running = False
+        self.stopped = True
+
+        self.lock = _thread.allocate_lock()     # Held for every sensor read, by the sampler thread and pass-throughs.
+
+    def register(self, name: str, read, width: int = 1) -> SampleBuffer:
+
+        buffer = SampleBuffer(name, read, width, self.capacity)
+        self.buffers.append(buffer)
+
+        return buffer
+
+    def start(self):
+
+        if self.running:
+            return
+
+        self.running = True
+        self.stopped = False
+        _thread.start_new_thread(self.__run, ())
+
+        # Waits for every sensor to have a sample, so that readers never see an empty buffer.
+        for buffer in self.buffers:
+            while buffer.count == 0 and self.running:
+                Clock.sleep(1000)
+
+    def stop(self):
+
+        self.running = False
+
+        while not self.stopped:
+            Clock.sleep(1000)
+
+    def __run(self):
+
+        buffers = self.buffers
+        lock = self.lock
+
+        try:
+            while self.running:
+
+                roundStart = Clock.now()
+
+                # Timestamps each sample when its read starts, under the lock, so that a sample stamped after a
+                # pass-through (e.g. a gyro reset) was also read after it.
+                for buffer in buffers:
+                    with lock:
+                        time = Clock.now()
+                        value = buffer.read()
+                    buffer.append(time, value)
+
+                if self.period > 0:
+                    remaining = self.period - Clock.diff(Clock.now(), roundStart)
+                    if remaining > 0:
+                        Clock.sleep(remaining)
+
+        finally:
+            self.running = False
+            self.stopped = True
+
+    def report(self):
+
+        for buffer in self.buffers:
+            print(buffer.name, ":", int(buffer.sampleRate()), "Hz,", buffer.staleness(), "us stale,",
+                  buffer.count, "samples")
+
+    # Drop-in sensor wrappers
+
+    def gyroSensor(self, sensor, name: str = "gyro"):
+        return SampledGyroSensor(self, sensor, name)
+
+    def colorSensor(self, sensor, name: str = "color"):
+        return SampledColorSensor(self, sensor, name)
+
+    def ev3devSensor(self, sensor, mode: str = 'RGB-RAW', width: int = 3, name: str = "ev3dev"):
+        return SampledEv3devSensor(self, sensor, mode, width, name)
+
+class SampledSensor:
+
+    """
+    Base class for sampled sensor wrappers. Compares and hashes as the wrapped sensor, so that it can stand in for it
+    in ColorInput.KNOWN_THRESHOLDS.
+    """
+
+    def __init__(self, sampler: SensorSampler, sensor):
+        self.sampler = sampler
+        self.sensor = sensor
+        self.buffer = None
+
+    def __eq__(self, other):
+        return other is self or other is self.sensor
+
+    def __hash__(self):
+        return hash(self.sensor)
+
+    def passThrough(self, read, *args):
+
+        """
+        Returns `read(*args)`, read from the wrapped sensor directly, without racing the sampler thread.
+        """
+
+        with self.sampler.lock:
+            return read(*args)
+
+    def waitForFreshSample(self):
+
+        """
+        Blocks until a sample taken after this call is available, e.g. after resetting the sensor.
+        """
+
+        requested = Clock.now()
+        while self.sampler.running and (self.buffer.count == 0 or Clock.diff(self.buffer.latestTime(), requested) < 0):
+            Clock.sleep(500)
+
+class SampledGyroSensor(SampledSensor):
+
+    def __init__(self, sampler: SensorSampler, sensor, name: str):
+        SampledSensor.__init__(self, sampler, sensor)
+        self.buffer = sampler.register(name, sensor.angle)
+
+    def angle(self) -> int:
+        return self.buffer.latest()
+
+    def speed(self) -> int:
+        return self.passThrough(self.sensor.speed)
+
+    def reset_angle(self, angle: int):
+        self.passThrough(self.sensor.reset_angle, angle)
+        self.waitForFreshSample()
+
+class SampledColorSensor(SampledSensor):
+
+    def __init__(self, sampler: SensorSampler, sensor, name: str):
+        SampledSensor.__init__(self, sampler, sensor)
+        self.buffer = sampler.register(name, sensor.reflection)
+
+    def reflection(self) -> int:
+        return self.buffer.latest()
+
+    def color(self):
+        return self.passThrough(self.sensor.color)
+
+    def ambient(self) -> int:
+        return self.passThrough(self.sensor.ambient)
+
+    def rgb(self) -> tuple:
+        return self.passThrough(self.sensor.rgb)
+
+class SampledEv3devSensor(SampledSensor):
+
+    def __init__(self, sampler: SensorSampler, sensor, mode: str, width: int, name: str):
+        SampledSensor.__init__(self, sampler, sensor)
+        self.mode = mode
+        self.buffer = sampler.register(name, lambda: sensor.read(mode), width)
+
+    def read(self, mode: str) -> tuple:
+        return self.buffer.latest() if mode == self.mode else self.passThrough(self.sensor.read, mode)
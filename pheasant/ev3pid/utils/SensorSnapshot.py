@@ -0,0 +1,107 @@
+# SensorSnapshot.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Per-tick cache of sensor and motor readings for ev3pid control loops.
+
+
+class SensorSnapshot:
+
+    """
+    Caches sensor and motor readings for one control loop tick.
+
+    ## Discussion
+    Each reading is taken from the hardware the first time it is requested in a tick, and served from the cache for the
+    rest of the tick. Call `next()` at the start of every tick. Stop conditions and control laws that read through the
+    same snapshot therefore share a single ev3dev read per value.
+
+    `reads` counts the hardware reads actually made, for measuring sensor traffic.
+    """
+
+    def __init__(self):
+
+        self.tick = 0
+        self.reads = 0
+
+        # Caches, keyed by the id of the device.
+        self.angles = {}
+        self.reflections = {}
+        self.colors = {}
+        self.rgbs = {}
+        self.speeds = {}
+        self.motorAngles = {}
+
+    def next(self):
+
+        self.tick += 1
+
+        self.angles.clear()
+        self.reflections.clear()
+        self.colors.clear()
+        self.rgbs.clear()
+        self.speeds.clear()
+        self.motorAngles.clear()
+
+    def angle(self, sensor) -> int:
+
+        key = id(sensor)
+
+        if key not in self.angles:
+            self.angles[key] = sensor.angle()
+            self.reads += 1
+
+        return self.angles[key]
+
+    def reflection(self, sensor) -> int:
+
+        key = id(sensor)
+
+        if key not in self.reflections:
+            self.reflections[key] = sensor.reflection()
+            self.reads += 1
+
+        return self.reflections[key]
+
+    def color(self, sensor):
+
+        key = id(sensor)
+
+        if key not in self.colors:
+            self.colors[key] = sensor.color()
+            self.reads += 1
+
+        return self.colors[key]
+
+    def rgb(self, sensor) -> tuple:
+
+        """
+        Returns the 'RGB-RAW' reading of an Ev3devSensor.
+        """
+
+        key = id(sensor)
+
+        if key not in self.rgbs:
+            self.rgbs[key] = sensor.read('RGB-RAW')
+            self.reads += 1
+
+        return self.rgbs[key]
+
+    def speed(self, motor) -> int:
+
+        key = id(motor)
+
+        if key not in self.speeds:
+            self.speeds[key] = motor.speed()
+            self.reads += 1
+
+        return self.speeds[key]
+
+    def motorAngle(self, motor) -> int:
+
+        key = id(motor)
+
+        if key not in self.motorAngles:
+            self.motorAngles[key] = motor.angle()
+            self.reads += 1
+
+        return self.motorAngles[key]
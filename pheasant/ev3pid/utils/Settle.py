@@ -0,0 +1,121 @@
+# Settle.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Waits until the robot has settled, instead of for a fixed time.
+
+
+from ev3move import DoubleMotorBase
+from .Clock import Clock                                                     # pylint: disable=relative-beyond-top-level
+from .FlightRecorder import FlightRecorder                                   # pylint: disable=relative-beyond-top-level
+from .GyroInput import GyroInput                                             # pylint: disable=relative-beyond-top-level
+
+class Settle:
+
+    """
+    A wait that ends once `condition()` has held for `settleTime` ms in a row, or after `timeout` ms.
+
+    ## Discussion
+    `wait()` polls the condition every `POLL_TIME` ms and returns whether it settled. It stores the time it actually
+    waited (in ms) as `elapsed`, and records it to the active FlightRecorder as a "wait <name>" segment, so that fixed
+    delays can be replaced by the shortest wait that is safe.
+
+    Use `motors()` and `gyro()` for the common conditions. A Settle can be created once and waited on many times.
+    """
+
+    POLL_TIME = 5                       # In ms.
+
+    # Defaults
+    SETTLE_TIME_DEFAULT = 30            # In ms.
+    TIMEOUT_DEFAULT = 1000              # In ms.
+    MOTOR_SPEED_DEFAULT = 10            # In deg/s.
+    GYRO_RATE_DEFAULT = 2               # In deg/s.
+
+    def __init__(self, name: str, condition, settleTime: float = None, timeout: float = None):
+
+        # Resolves optional arguments with default values.
+        settleTime = settleTime if settleTime is not None else Settle.SETTLE_TIME_DEFAULT
+        timeout = timeout if timeout is not None else Settle.TIMEOUT_DEFAULT
+
+        self.name = name
+        self.condition = condition
+        self.settleTime = settleTime
+        self.timeout = timeout
+
+        # Result of the latest wait
+        self.elapsed = None             # In ms.
+        self.settled = None
+
+    def wait(self) -> bool:
+
+        """
+        Waits until settled or timed out, and returns True if settled.
+        """
+
+        condition = self.condition
+        settleTime = self.settleTime * 1000
+        timeout = self.timeout * 1000
+
+        start = Clock.now()
+        since = None                    # Time from which the condition has held.
+
+        while True:
+
+            now = Clock.now()
+
+            if condition():
+                if since is None:
+                    since = now
+                if Clock.diff(now, since) >= settleTime:
+                    settled = True
+                    break
+            else:
+                since = None
+
+            if Clock.diff(now, start) >= timeout:
+                settled = False
+                break
+
+            Clock.sleep(Settle.POLL_TIME * 1000)
+
+        self.elapsed = Clock.diff(Clock.now(), start) / 1000
+        self.settled = settled
+
+        recorder = FlightRecorder.ACTIVE
+        if recorder is not None:
+            recorder.recordWait("wait " + self.name, self.timeout, start, self.elapsed, not settled)
+
+        return settled
+
+    @classmethod
+    def motors(cls, motors: tuple = None, speed: float = None, settleTime: float = None, timeout: float = None):
+
+        """
+        Settles once every motor (by default, the default ev3pid motors) turns slower than `speed`.
+        """
+
+        # Resolves optional arguments with default values.
+        motors = motors if motors is not None else (DoubleMotorBase.LEFT_MOTOR_DEFAULT,
+                                                    DoubleMotorBase.RIGHT_MOTOR_DEFAULT)
+        speed = speed if speed is not None else cls.MOTOR_SPEED_DEFAULT
+
+        def stopped():
+            for motor in motors:
+                if abs(motor.speed()) > speed:
+                    return False
+            return True
+
+        return cls("motors", stopped, settleTime, timeout)
+
+    @classmethod
+    def gyro(cls, sensor=None, rate: float = None, settleTime: float = None, timeout: float = None):
+
+        """
+        Settles once the gyro (by default, the default ev3pid gyro) turns slower than `rate`.
+        """
+
+        # Resolves optional arguments with default values.
+        sensor = sensor if sensor is not None else GyroInput.DEFAULT_GYRO
+        rate = rate if rate is not None else cls.GYRO_RATE_DEFAULT
+
+        return cls("gyro", lambda: abs(sensor.speed()) <= rate, settleTime, timeout)
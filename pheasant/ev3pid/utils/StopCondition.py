@@ -0,0 +1,271 @@
+# StopCondition.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Reusable stop conditions for ev3pid control loops, read through the loop's sensor snapshot.
+
+
+from ev3move import DoubleMotorBase
+from .Clock import Clock                                                     # pylint: disable=relative-beyond-top-level
+from .GyroInput import GyroInput                                             # pylint: disable=relative-beyond-top-level
+from .SensorSnapshot import SensorSnapshot                                   # pylint: disable=relative-beyond-top-level
+
+class Comparison:
+    ABOVE = hash("ABOVE")               #HACK: enum workaround.
+    BELOW = hash("BELOW")
+    AT_LEAST = hash("AT_LEAST")
+    AT_MOST = hash("AT_MOST")
+
+def compare(value, comparison: Comparison, threshold) -> bool:
+
+    if comparison == Comparison.ABOVE:
+        return value > threshold
+    elif comparison == Comparison.BELOW:
+        return value < threshold
+    elif comparison == Comparison.AT_LEAST:
+        return value >= threshold
+    else:
+        return value <= threshold
+
+class StopCondition:
+
+    """
+    Base class for stop conditions, which can be passed to `runUntil()` in place of a lambda.
+
+    ## Discussion
+    A controller binds the condition to its SensorSnapshot when its loop starts, so that the condition reads the same
+    tick's readings as the control law, and a value that both use is read from the hardware once, and unbinds it when
+    the loop ends. Conditions that are not bound, e.g. when called directly, read through a snapshot of their own that
+    is refreshed on every call.
+
+    Conditions are meant to be created once, e.g. as constants in main.py, and reused: checking one does not allocate.
+    Threshold conditions can be retargeted with `above()`, `below()`, `atLeast()` and `atMost()`, which return the
+    condition itself rather than a copy, so a condition can only be used by one loop at a time: binding a condition that
+    is already bound, or retargeting one that is bound, raises a RuntimeError. Combine conditions with `&` and `|` (or
+    All and Any), which evaluate the cheapest conditions first, by `COST`, and short-circuit.
+    """
+
+    COST = 1                            # Relative cost of a check; roughly the number of hardware reads.
+
+    def __init__(self):
+        self.snapshot = None
+
+    def bind(self, snapshot: SensorSnapshot):
+
+        """
+        Reads through `snapshot` from now on (or a snapshot of its own, if None), and starts the condition afresh.
+        """
+
+        if snapshot is not None and self.snapshot is not None:
+            raise RuntimeError("Stop condition is already in use by another loop.")
+
+        self.snapshot = snapshot
+        self.reset()
+
+    def unbind(self):
+
+        """
+        Reads through a snapshot of its own from now on, without starting the condition afresh.
+        """
+
+        self.snapshot = None
+
+    def reset(self):
+        pass
+
+    def cost(self) -> int:
+        return self.COST
+
+    def check(self, snapshot: SensorSnapshot) -> bool:
+
+        """
+        Returns whether the condition is met, reading through `snapshot`. Implemented by subclasses; the base condition
+        is never met.
+        """
+
+        return False
+
+    def __call__(self) -> bool:
+
+        snapshot = self.snapshot
+
+        if snapshot is None:
+            snapshot = UNBOUND_SNAPSHOT
+            snapshot.next()
+
+        return self.check(snapshot)
+
+    def __and__(self, other):
+        return All(self, other)
+
+    def __or__(self, other):
+        return Any(self, other)
+
+# Refreshed on every check of an unbound condition.
+UNBOUND_SNAPSHOT = SensorSnapshot()
+
+class ThresholdCondition(StopCondition):
+
+    """
+    Base class for conditions that compare one reading against a threshold.
+    """
+
+    def __init__(self, comparison: Comparison = None, threshold=None):
+
+        StopCondition.__init__(self)
+
+        self.comparison = comparison
+        self.threshold = threshold
+
+    def retarget(self, comparison: Comparison, threshold):
+
+        if self.snapshot is not None:
+            raise RuntimeError("Stop condition cannot be retargeted while a loop is using it.")
+
+        self.comparison = comparison
+        self.threshold = threshold
+
+        return self
+
+    def above(self, threshold):
+        return self.retarget(Comparison.ABOVE, threshold)
+
+    def below(self, threshold):
+        return self.retarget(Comparison.BELOW, threshold)
+
+    def atLeast(self, threshold):
+        return self.retarget(Comparison.AT_LEAST, threshold)
+
+    def atMost(self, threshold):
+        return self.retarget(Comparison.AT_MOST, threshold)
+
+class EncoderAngle(ThresholdCondition):
+
+    """
+    Compares the mean angle of two motors (by default, the default ev3pid motors), like TwoWheelDrive.angle().
+    """
+
+    COST = 2
+
+    def __init__(self, comparison: Comparison = None, threshold: float = None, leftMotor=None, rightMotor=None):
+
+        ThresholdCondition.__init__(self, comparison, threshold)
+
+        # Resolves optional arguments with default values.
+        self.leftMotor = leftMotor if leftMotor is not None else DoubleMotorBase.LEFT_MOTOR_DEFAULT
+        self.rightMotor = rightMotor if rightMotor is not None else DoubleMotorBase.RIGHT_MOTOR_DEFAULT
+
+    def check(self, snapshot: SensorSnapshot) -> bool:
+
+        # Compares the sum against twice the threshold, which avoids a float for the mean.
+        return compare(snapshot.motorAngle(self.leftMotor) + snapshot.motorAngle(self.rightMotor),
+                       self.comparison, self.threshold * 2)
+
+class GyroAngle(ThresholdCondition):
+
+    def __init__(self, comparison: Comparison = None, threshold: int = None, sensor=None):
+
+        ThresholdCondition.__init__(self, comparison, threshold)
+
+        # Resolves optional arguments with default values.
+        self.sensor = sensor if sensor is not None else GyroInput.DEFAULT_GYRO
+
+    def check(self, snapshot: SensorSnapshot) -> bool:
+        return compare(snapshot.angle(self.sensor), self.comparison, self.threshold)
+
+class Reflection(ThresholdCondition):
+
+    def __init__(self, sensor, comparison: Comparison = None, threshold: int = None):
+        ThresholdCondition.__init__(self, comparison, threshold)
+        self.sensor = sensor
+
+    def check(self, snapshot: SensorSnapshot) -> bool:
+        return compare(snapshot.reflection(self.sensor), self.comparison, self.threshold)
+
+class ColorIs(StopCondition):
+
+    """
+    True while a color sensor sees `color`.
+
+    ## Discussion
+    Reading the color can switch the sensor out of reflection mode, which is slow on ev3dev, so it is checked last.
+    """
+
+    COST = 3
+
+    def __init__(self, sensor, color):
+        StopCondition.__init__(self)
+        self.sensor = sensor
+        self.color = color
+
+    def check(self, snapshot: SensorSnapshot) -> bool:
+        return snapshot.color(self.sensor) == self.color
+
+class Timeout(StopCondition):
+
+    """
+    True once `time` ms have passed since the condition was bound or reset.
+    """
+
+    COST = 0
+
+    def __init__(self, time: float):
+
+        StopCondition.__init__(self)
+
+        self.time = time
+        self.start = Clock.now()
+
+    def reset(self):
+        self.start = Clock.now()
+
+    def check(self, snapshot: SensorSnapshot) -> bool:
+        return Clock.diff(Clock.now(), self.start) >= self.time * 1000
+
+class All(StopCondition):
+
+    """
+    True when every one of its conditions is true.
+    """
+
+    def __init__(self, *conditions):
+
+        StopCondition.__init__(self)
+
+        # Flattens nested Alls, and checks the cheapest conditions first.
+        flattened = []
+        for condition in conditions:
+            if type(condition) is type(self):
+                flattened.extend(condition.conditions)
+            else:
+                flattened.append(condition)
+        self.conditions = tuple(sorted(flattened, key=lambda condition: condition.cost()))
+
+    def cost(self) -> int:
+        return sum(condition.cost() for condition in self.conditions)
+
+    def reset(self):
+        for condition in self.conditions:
+            condition.reset()
+
+    def check(self, snapshot: SensorSnapshot) -> bool:
+
+        for condition in self.conditions:
+            if not condition.check(snapshot):
+                return False
+
+        return True
+
+class Any(All):
+
+    """
+    True when at least one of its conditions is true.
+    """
+
+    def check(self, snapshot: SensorSnapshot) -> bool:
+
+        for condition in self.conditions:
+            if condition.check(snapshot):
+                return True
+
+        return False
@@ -0,0 +1,196 @@
+# SysfsInput.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Fast-path sensor input that reads ev3dev sysfs attributes directly.
+
+
+import os
+
+try:
+    from pybricks.parameters import Color
+except ImportError:                                 # Allows use (and testing) without pybricks.
+    Color = None
+
+class SysfsAttribute:
+
+    """
+    A sysfs attribute file that is kept open and re-read from the start on every read.
+
+    ## Discussion
+    Uses `os.pread()` on a raw file descriptor where available. MicroPython has no `os.pread()`, so a file object is
+    rewound with `seek()` instead. Either way, the file is opened only once.
+    """
+
+    BUFFER_SIZE = 32
+
+    def __init__(self, path: str):
+
+        self.path = path
+
+        if hasattr(os, 'pread'):
+            self.fd = os.open(path, os.O_RDONLY)
+            self.file = None
+        else:
+            self.fd = None
+            self.file = open(path, 'rb')                                           # pylint: disable=consider-using-with
+
+    def read(self) -> bytes:
+
+        if self.fd is not None:
+            return os.pread(self.fd, SysfsAttribute.BUFFER_SIZE, 0)
+
+        self.file.seek(0)
+        return self.file.read(SysfsAttribute.BUFFER_SIZE)
+
+    def readInt(self) -> int:
+        return int(self.read())
+
+    def close(self):
+
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+        elif self.file is not None:
+            self.file.close()
+            self.file = None
+
+class SysfsSensor:
+
+    """
+    Direct reader for an ev3dev lego-sensor device, identified by its address (e.g. 'ev3-ports:in2').
+
+    ## Discussion
+    The `value0` ... `valueN` attribute files are opened once and kept open. The sensor mode is tracked locally and
+    only written when it changes, so a sensor should not be read through both this class and pybricks at the same time.
+    """
+
+    ROOT = '/sys/class/lego-sensor'
+
+    MAX_VALUES = 8
+
+    def __init__(self, address: str, root: str = None):
+
+        self.root = root if root is not None else self.__class__.ROOT
+        self.address = address
+        self.path = self.__class__.findDevice(address, self.root)
+
+        self.values = [None] * SysfsSensor.MAX_VALUES          # Opened on first use.
+        self.currentMode = self.__readAttribute('mode')
+        self.numValues = int(self.__readAttribute('num_values'))
+
+    @classmethod
+    def findDevice(cls, address: str, root: str = None) -> str:
+
+        root = root if root is not None else cls.ROOT
+
+        for device in sorted(os.listdir(root)):
+            path = root + '/' + device
+            try:
+                with open(path + '/address') as file:
+                    if file.read().strip() == address:
+                        return path
+            except OSError:
+                continue
+
+        raise OSError("No sensor found at address " + address)
+
+    def __readAttribute(self, name: str) -> str:
+        with open(self.path + '/' + name) as file:
+            return file.read().strip()
+
+    def setMode(self, mode: str):
+
+        if mode == self.currentMode:
+            return
+
+        with open(self.path + '/mode', 'w') as file:
+            file.write(mode)
+
+        self.currentMode = mode
+        self.numValues = int(self.__readAttribute('num_values'))
+
+    def value(self, index: int) -> int:
+
+        attribute = self.values[index]
+        if attribute is None:
+            attribute = self.values[index] = SysfsAttribute(self.path + '/value' + str(index))
+
+        return attribute.readInt()
+
+    def close(self):
+
+        for attribute in self.values:
+            if attribute is not None:
+                attribute.close()
+
+        self.values = [None] * SysfsSensor.MAX_VALUES
+
+class SysfsColorSensor(SysfsSensor):
+
+    """
+    Emulates the reading methods of pybricks.ev3devices.ColorSensor, for use with ColorInput and DoubleColorInput.
+    """
+
+    # ev3dev COL-COLOR values, in order.
+    COLORS = (None, Color.BLACK, Color.BLUE, Color.GREEN, Color.YELLOW, Color.RED, Color.WHITE, Color.BROWN) \
+        if Color is not None else (None, 1, 2, 3, 4, 5, 6, 7)
+
+    def reflection(self) -> int:
+        self.setMode('COL-REFLECT')
+        return self.value(0)
+
+    def ambient(self) -> int:
+        self.setMode('COL-AMBIENT')
+        return self.value(0)
+
+    def color(self):
+        self.setMode('COL-COLOR')
+        return SysfsColorSensor.COLORS[self.value(0)]
+
+    def rgb(self) -> tuple:
+        self.setMode('RGB-RAW')
+        return (self.value(0), self.value(1), self.value(2))
+
+class SysfsGyroSensor(SysfsSensor):
+
+    """
+    Emulates the reading methods of pybricks.ev3devices.GyroSensor, for use with GyroInput.
+
+    ## Discussion
+    Uses the GYRO-G&A mode, which reports both angle and rate, so that angle() and speed() never switch modes. Set
+    `counterclockwise` to match `Direction.COUNTERCLOCKWISE`.
+    """
+
+    def __init__(self, address: str, counterclockwise: bool = False, root: str = None):
+
+        SysfsSensor.__init__(self, address, root)
+
+        self.sign = -1 if counterclockwise else 1
+        self.offset = 0
+
+        self.setMode('GYRO-G&A')
+
+    def angle(self) -> int:
+        return self.value(0) * self.sign - self.offset
+
+    def speed(self) -> int:
+        return self.value(1) * self.sign
+
+    def reset_angle(self, angle: int):
+        self.offset = self.value(0) * self.sign - angle
+
+class SysfsEv3devSensor(SysfsSensor):
+
+    """
+    Emulates pybricks.iodevices.Ev3devSensor, for use with SideScan.
+    """
+
+    def read(self, mode: str) -> tuple:
+
+        self.setMode(mode)
+
+        if self.numValues == 3:                                 # Fast path for RGB-RAW.
+            return (self.value(0), self.value(1), self.value(2))
+
+        return tuple(self.value(i) for i in range(self.numValues))
@@ -0,0 +1,74 @@
+# TaskScheduler.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Interleaves cooperative tasks, such as controller loops and sensor scans, in one loop.
+
+
+from .LoopScheduler import LoopScheduler                                     # pylint: disable=relative-beyond-top-level
+
+class TaskScheduler:
+
+    """
+    Runs cooperative tasks round-robin: each iteration resumes every task once, in the order they were added.
+
+    ## Discussion
+    A task is a generator that does one iteration of work each time it is resumed, and yields. The ev3pid controllers
+    provide their loops as tasks through `task()`; other work, such as scanning a sensor or logging, is written as a
+    generator function with a `yield` in its loop.
+
+    `run()` returns as soon as the last foreground task finishes, without resuming the tasks after it, and closes the
+    remaining background tasks, so background tasks may loop forever. With a `rate`, each iteration is paced by a
+    LoopScheduler; otherwise the loop is free-running and the tasks pace themselves, e.g. with their controllers' loop
+    rates.
+
+    Tasks are plain generators rather than uasyncio coroutines, so they need no event loop, and resuming one allocates
+    no memory.
+    """
+
+    def __init__(self, rate: float = None):
+
+        self.rate = rate
+        self.tasks = []                 # [task, is background]
+        self.iterations = 0
+
+    def add(self, task, background: bool = False):
+        self.tasks.append([task, background])
+
+    def run(self):
+
+        scheduler = LoopScheduler(self.rate)
+        tasks = self.tasks
+        foreground = 0
+        for _, background in tasks:
+            if not background:
+                foreground += 1
+
+        try:
+
+            while foreground:
+
+                scheduler.tick()
+
+                index = 0
+                while index < len(tasks):
+
+                    try:
+                        next(tasks[index][0])
+                    except StopIteration:
+                        if not tasks[index][1]:
+                            foreground -= 1
+                            if not foreground:
+                                break
+                        del tasks[index]
+                        continue
+
+                    index += 1
+
+                self.iterations += 1
+
+        finally:
+
+            for task, _ in tasks:
+                task.close()
+            self.tasks = []
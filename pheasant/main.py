@@ -22,12 +22,41 @@ LEFT_THRESHOLD = 47
 RIGHT_THRESHOLD = 42
 BLACK_VALUE = 10
 WHITE_VALUE = 65
+LINE_APPROACH_SPEED = 800           # In deg/s; LineApproach corrects back to where 400 deg/s stopped.
+USE_SYSFS_SENSORS = False           # Reads sensors directly from ev3dev sysfs instead of through pybricks.
+USE_SENSOR_SAMPLER = False          # Samples sensors on a background thread.
+USE_FLIGHT_RECORDER = False         # Records control loop samples, dumped to FLIGHT_LOG_PATH by run.py.
+FLIGHT_LOG_PATH = "flight.bin"
+USE_LOOP_PROFILER = False           # Times ev3pid control loops, dumped to LOOP_PROFILE_PATH by run.py.
+LOOP_PROFILE_PATH = "loops.csv"
+USE_MISSION_PROFILER = False        # Times procedures and deposition steps, dumped to MISSION_PROFILE_PATH by run.py.
+MISSION_PROFILE_PATH = "mission.csv"
+MISSION_GRAPHS = []                 # MissionGraphs run so far, for their reports; printed by run.py with the profile.
+APPROACH_SQUARES = []               # ApproachSquare runs so far, for their reports; printed by run.py with the profile.
+REAR_CLAW_LEAD = 0.75               # Progress of the rear claw lowering before reversing into blocks.
+SIDE_SCAN_TABLE_PATH = "sidescan.bin"   # Saved by testware/CalibrateSideScan.py; without it, SideScan uses fixed rules.
+USE_COLOR_MODE_MANAGER = False      # Derives color() from reflection: BLACK/WHITE stops become reflection thresholds.
 
 # Initialize hardware
 BRICK = EV3Brick()
-LEFT_COLOR = ColorSensor(Port.S2)
-RIGHT_COLOR = ColorSensor(Port.S3)
-GYRO = GyroSensor(Port.S4, Direction.COUNTERCLOCKWISE)
+if USE_SYSFS_SENSORS:
+    LEFT_COLOR = ev3pid.SysfsColorSensor('ev3-ports:in2')
+    RIGHT_COLOR = ev3pid.SysfsColorSensor('ev3-ports:in3')
+    GYRO = ev3pid.SysfsGyroSensor('ev3-ports:in4', counterclockwise=True)
+else:
+    LEFT_COLOR = ColorSensor(Port.S2)
+    RIGHT_COLOR = ColorSensor(Port.S3)
+    GYRO = GyroSensor(Port.S4, Direction.COUNTERCLOCKWISE)
+if USE_SENSOR_SAMPLER:
+    SAMPLER = ev3pid.SensorSampler()
+    LEFT_COLOR = SAMPLER.colorSensor(LEFT_COLOR, "left color")
+    RIGHT_COLOR = SAMPLER.colorSensor(RIGHT_COLOR, "right color")
+    GYRO = SAMPLER.gyroSensor(GYRO)
+if USE_COLOR_MODE_MANAGER:
+    COLOR_MODES = ev3pid.ColorModeManager()
+    LEFT_COLOR = COLOR_MODES.sensor(LEFT_COLOR, "left color", BLACK_VALUE, WHITE_VALUE)
+    RIGHT_COLOR = COLOR_MODES.sensor(RIGHT_COLOR, "right color", BLACK_VALUE, WHITE_VALUE)
+    COLOR_MODES.pin(ev3pid.ColorMode.REFLECTION, "start-up")
 LEFT_MOTOR = Motor(Port.B, positive_direction=Direction.COUNTERCLOCKWISE)
 LEFT_MOTOR.control.limits(speed=1500)
 RIGHT_MOTOR = Motor(Port.C, positive_direction=Direction.CLOCKWISE)
@@ -49,18 +78,87 @@ ev3pid.LineSquare.setDefaultOutputLimit(60)
 ev3pid.LineSquare.setDefaultIntegralLimit(60)
 ev3pid.LineTrack.setDefaultTuning(1.2, 0.0008, 200)
 # ev3pid.LineTrack.setDefaultIntegralLimit(10000)
+ev3pid.PIDController.setNominalPeriod(0.9)                      # Free-running loop period (ms), from LoopProfiler.
+ev3pid.PIDController.setDefaultLoopRate(500)                    # Fixed-rate loops.
+if USE_FLIGHT_RECORDER:
+    RECORDER = ev3pid.FlightRecorder()
+    RECORDER.activate()
+    wait = RECORDER.wait                                        # Records time spent in wait().
+if USE_LOOP_PROFILER:
+    PROFILER = ev3pid.LoopProfiler()
+    PROFILER.activate()
+if USE_MISSION_PROFILER:
+    MISSION_PROFILER = utils.MissionProfiler()
+    MISSION_PROFILER.activate()
+    utils.MissionProfiler.instrument(ev3pid.GyroStraight, 'runUntil', "drive")
+    utils.MissionProfiler.instrument(ev3pid.LineTrack, 'runUntil', "drive")
+    utils.MissionProfiler.instrument(ev3pid.LineApproach, 'run', "drive")
+    utils.MissionProfiler.instrument(ev3pid.LineSquare, 'run', "drive")
+    utils.MissionProfiler.instrument(ev3pid.ApproachSquare, 'run', "drive")
+    utils.MissionProfiler.instrument(ev3pid.GyroTurn, 'run', "turn")
+    utils.MissionProfiler.instrument(ev3pid.TaskScheduler, 'run', "drive")     # Driving while scanning.
+    for method in ('run_time', 'run_angle', 'run_target'):
+        utils.MissionProfiler.instrument(ev3move.TwoWheelDrive, method, "drive")
+    for claw in (utils.FrontClaw, utils.RearClaw):
+        utils.MissionProfiler.instrument(claw, 'moveTo', "claw")
+    utils.MissionProfiler.instrument(utils.ClawMove, 'wait', "claw")
+    wait = utils.MissionProfiler.timed("wait")(wait)                # Fixed delays in procedures.
+    utils.MissionProfiler.instrument(ev3pid.Settle, 'wait', "wait")
 
 # Initialize pheasant_utils package settings
 utils.FrontClaw.MOTOR = Motor(Port.A)
 utils.FrontClaw.MOTOR.reset_angle(utils.FrontClaw.ANGLE_RANGE)
 utils.RearClaw.MOTOR = Motor(Port.D, positive_direction=Direction.COUNTERCLOCKWISE)
 utils.RearClaw.MOTOR.reset_angle(utils.RearClaw.ANGLE_RANGE)
-utils.SideScan.sensor = Ev3devSensor(Port.S1)
+utils.SideScan.sensor = ev3pid.SysfsEv3devSensor('ev3-ports:in1') if USE_SYSFS_SENSORS else Ev3devSensor(Port.S1)
+utils.SideScan.loadTable(SIDE_SCAN_TABLE_PATH)
+if USE_SENSOR_SAMPLER:
+    utils.SideScan.enableSampling(SAMPLER)
+    SAMPLER.start()
+
+# Settle waits, in place of fixed delays
+DRIVE_BASE_SETTLE = ev3pid.Settle.motors()
+GYRO_SETTLE = ev3pid.Settle.gyro()
+FRONT_CLAW_SETTLE = utils.FrontClaw.settle()
+REAR_CLAW_SETTLE = utils.RearClaw.settle()
+
+# Stop conditions, reused and retargeted for each segment
+DRIVE_ANGLE = ev3pid.EncoderAngle()                             # Same as DRIVE_BASE.angle().
+LEFT_REFLECTION = ev3pid.Reflection(LEFT_COLOR)
+RIGHT_REFLECTION = ev3pid.Reflection(RIGHT_COLOR)
+BOTH_ON_WHITE = ev3pid.Reflection(LEFT_COLOR).above(WHITE_VALUE) & ev3pid.Reflection(RIGHT_COLOR).above(WHITE_VALUE)
+LEFT_ON_BLACK = ev3pid.ColorIs(LEFT_COLOR, Color.BLACK)
+RIGHT_ON_BLACK = ev3pid.ColorIs(RIGHT_COLOR, Color.BLACK)
+RIGHT_ON_WHITE = ev3pid.ColorIs(RIGHT_COLOR, Color.WHITE)
+EITHER_ON_BLACK = LEFT_ON_BLACK | RIGHT_ON_BLACK
 
 #endregion
 
 #region Procedures
 
+def startProcedure(name: str):
+
+    print("-" * 10, name)
+
+    # Labels flight log segments, loop profiles and mission profiles with the procedure.
+    if ev3pid.FlightRecorder.ACTIVE is not None:
+        ev3pid.FlightRecorder.ACTIVE.procedure = name
+    if ev3pid.LoopProfiler.ACTIVE is not None:
+        ev3pid.LoopProfiler.ACTIVE.procedure = name
+    if utils.MissionProfiler.ACTIVE is not None:
+        utils.MissionProfiler.ACTIVE.startProcedure(name)
+
+    # Each procedure is a phase in reflection mode, unless it pins another mode.
+    if USE_COLOR_MODE_MANAGER:
+        COLOR_MODES.pin(ev3pid.ColorMode.REFLECTION, name)
+
+def scanHouseBlocksTask(detector: utils.BlockDetector):
+
+    # Scans house blocks with every side scanner reading, using one reading for both presence and color.
+    while True:
+        detector.update(utils.SideScan.read(), DRIVE_BASE.angle())
+        yield
+
 def scanHouseBlocksProcedure(thisHouse: utils.DepositPoint,
                              gyroAngle: int,
                              stopCondition,
@@ -68,33 +166,26 @@ def scanHouseBlocksProcedure(thisHouse: utils.DepositPoint,
                              speed: int = 600):
 
     # Drives to top house while scanning.
-    gyroStraightController = ev3pid.GyroStraight(None, gyroAngle)
-
-    previouslyNextToHouseBlock = False
-    while not stopCondition():
-
-        # Control gyro straight
-        gyroStraightControllerOutput = gyroStraightController.rawControllerOutput()
-        LEFT_MOTOR.run(speed - gyroStraightControllerOutput)
-        RIGHT_MOTOR.run(speed + gyroStraightControllerOutput)
-
-        # Scans house blocks.
-        currentlyNextToHouseBlock = utils.SideScan.presence()
-        if (not previouslyNextToHouseBlock) and currentlyNextToHouseBlock:
-            utils.RunLogic.houses[thisHouse].append(utils.RunLogic.convertEv3ColorToBlockColor(utils.SideScan.color()))
-            previouslyNextToHouseBlock = True
-        elif previouslyNextToHouseBlock and not currentlyNextToHouseBlock:
-            previouslyNextToHouseBlock = False
+    detector = utils.BlockDetector()
+    tasks = ev3pid.TaskScheduler()
+    tasks.add(ev3pid.GyroStraight(speed, gyroAngle).task(stopCondition))
+    tasks.add(scanHouseBlocksTask(detector), background=True)
+    tasks.run()
+    detector.finish(DRIVE_BASE.angle())
 
     if thenHoldMotors:
         DRIVE_BASE.hold()
-        wait(50)
-
-    # To handle the case where there are more than two blocks detected. If this happenes, it's likely that .presence()
-    # returned False erroneously. Keeping the first and last two colors is the best simple approach.
-    if len(utils.RunLogic.houses[thisHouse]) > 2:
-        print("Error while scanning: unexpected number of blocks;", utils.RunLogic.houses[thisHouse])
-        utils.RunLogic.houses[thisHouse] = [utils.RunLogic.houses[thisHouse][0], utils.RunLogic.houses[thisHouse][-1]]
+        DRIVE_BASE_SETTLE.wait()
+
+    # Each house has two blocks. If more are detected, the two seen for longest are most likely to be real. If fewer
+    # are, only those are added to the house, as before the detector; depositions use their preprogrammed colors, so
+    # the run carries on.
+    if len(detector.blocks) > 2:
+        print("Error while scanning: unexpected number of blocks;", detector.report())
+    elif len(detector.blocks) < 2:
+        print("Warning: only", len(detector.blocks), "blocks seen while scanning; keeping those.")
+    utils.RunLogic.houses[thisHouse] += [utils.RunLogic.convertEv3ColorToBlockColor(color)
+                                         for color in detector.colors(2)]
 
     print("House colors:", utils.RunLogic.houses[thisHouse])       #FIXME: Prints numbers; implement str representation.
 
@@ -104,7 +195,7 @@ def driveBackAndCollectGreenBlocksProcedure(moveBackDegrees, finalClawPosition):
     utils.RearClaw.collect()
 
     DRIVE_BASE.reset_angle()
-    ev3pid.GyroStraight(-300, 180).runUntil(lambda: DRIVE_BASE.angle() < -1 * moveBackDegrees)
+    ev3pid.GyroStraight(-300, 180).runUntil(DRIVE_ANGLE.below(-1 * moveBackDegrees))
     DRIVE_BASE.hold()
 
     utils.RearClaw.loads += 1
@@ -112,6 +203,32 @@ def driveBackAndCollectGreenBlocksProcedure(moveBackDegrees, finalClawPosition):
 
     wait(50)
 
+def collectGreenEnergyBlocksProcedure(gyroAngle: int, distance: int):
+
+    # Turns to the blocks, then reverses into them while lowering the rear claw, and collects them once both are done.
+    graph = utils.MissionGraph("collectGreenEnergyBlocks " + str(gyroAngle))
+
+    def reverseIntoBlocks():
+        DRIVE_BASE.reset_angle()
+        ev3pid.GyroStraight(-350, gyroAngle).runUntil(DRIVE_ANGLE.below(-distance))
+        DRIVE_BASE.hold()
+
+    def collectBlocks():
+        utils.RearClaw.loads += 1
+        utils.RearClaw.closeGate()
+
+    # The claw is mostly lowered before reversing, as the fixed lead before the graph ensured.
+    turn = graph.add("turn", lambda: ev3pid.GyroTurn(gyroAngle, True, True).run(precisely=True),
+                     (utils.Resource.DRIVE_BASE,))
+    lower = graph.add("lowerRearClaw", lambda: utils.RearClaw.collect(wait=False), (utils.Resource.REAR_CLAW,),
+                      after=(turn,))
+    reverse = graph.add("reverseIntoBlocks", reverseIntoBlocks, (utils.Resource.DRIVE_BASE,),
+                        after=((lower, REAR_CLAW_LEAD),))
+    graph.add("collectBlocks", collectBlocks, (utils.Resource.REAR_CLAW,), after=(reverse,))
+    graph.run()
+
+    MISSION_GRAPHS.append(graph)
+
 def gyroStraightToBlackLineWithSensorCheckProcedure(speed: int, gyroAngle: int):
 
     # # Checks which sensors can be used to find the black line.
@@ -132,17 +249,19 @@ def gyroStraightToBlackLineWithSensorCheckProcedure(speed: int, gyroAngle: int):
     #         BLACK_VALUE) or (useRightSensor and RIGHT_COLOR.reflection() < BLACK_VALUE))
     #     DRIVE_BASE.hold()
 
-    # TEST CODE
-    if speed < 0:
-        speed = -400
-    else:
-        speed = 400
-
-    ev3pid.GyroStraight(speed, gyroAngle).runUntil(lambda: LEFT_COLOR.reflection() < LEFT_THRESHOLD and \
-        RIGHT_COLOR.reflection() < RIGHT_THRESHOLD)
-    DRIVE_BASE.hold()
+    # Approaches at LINE_APPROACH_SPEED, then corrects back to where both sensors crossed the line.
+    if not ev3pid.LineApproach(LINE_APPROACH_SPEED if speed >= 0 else -LINE_APPROACH_SPEED, gyroAngle).run():
+        print("WARNING: gyroStraightToBlackLineWithSensorCheckProcedure did not finish correcting.")
     wait(10)
 
+def approachSquareProcedure(speed: int, gyroAngle: int, linePosition: ev3pid.LinePosition):
+
+    # Drives onto the line and squares on it, without stopping in between.
+    approachSquare = ev3pid.ApproachSquare(speed, gyroAngle, linePosition)
+    approachSquare.run()
+
+    APPROACH_SQUARES.append(approachSquare)
+
 def preciseLineSquaringProcedure(linePosition: ev3pid.LinePosition):
 
     for _ in range(3):
@@ -194,15 +313,17 @@ class EnergyBlockDeposition:
 
         DRIVE_BASE.reset_angle()
 
+    @utils.MissionProfiler.step("returnToNeutralPoint")
     def __returnToNeutralPoint(self):
 
         if self.currentlyFacing == EnergyBlockDeposition.FacingDirection.TOWARDS:
-            ev3pid.GyroStraight(-650, self.gyroAngle).runUntil(lambda: DRIVE_BASE.angle() < 0)
+            ev3pid.GyroStraight(-650, self.gyroAngle).runUntil(DRIVE_ANGLE.below(0))
         else:
-            ev3pid.GyroStraight(650, self.gyroAngle).runUntil(lambda: DRIVE_BASE.angle() > 0)
+            ev3pid.GyroStraight(650, self.gyroAngle).runUntil(DRIVE_ANGLE.above(0))
 
         DRIVE_BASE.hold()
 
+    @utils.MissionProfiler.step("turnAround")
     def __turnAround(self):
 
         multiplier = 1 if self.currentlyFacing == EnergyBlockDeposition.FacingDirection.TOWARDS else -1
@@ -217,7 +338,7 @@ class EnergyBlockDeposition:
             EnergyBlockDeposition.FacingDirection.TOWARDS
 
         DRIVE_BASE.reset_angle()
-        ev3pid.GyroStraight(-400, self.gyroAngle).runUntil(lambda: DRIVE_BASE.angle() < -130)
+        ev3pid.GyroStraight(-400, self.gyroAngle).runUntil(DRIVE_ANGLE.below(-130))
 
         DRIVE_BASE.reset_angle()
 
@@ -234,13 +355,14 @@ class EnergyBlockDeposition:
             claw.goTo(amount)
             claw.SINGLE_LOAD_SPEED = int(claw.SINGLE_LOAD_SPEED / speedMultiple)
 
+    @utils.MissionProfiler.step("getGreenClaw")
     def __getGreenClaw(self, count: int):
 
         # Drives to the deposition zone.
-        ev3pid.GyroStraight(-400, self.gyroAngle).runUntil(lambda: DRIVE_BASE.angle() <= -200)
+        ev3pid.GyroStraight(-400, self.gyroAngle).runUntil(DRIVE_ANGLE.atMost(-200))
         DRIVE_BASE.hold()
         utils.RearClaw.drop()
-        wait(250)
+        REAR_CLAW_SETTLE.wait()
 
         # If only 1 of 2 blocks is needed, the robot must pick up one set of blocks.
         if count == 1 and utils.RearClaw.loads == 2:
@@ -252,6 +374,7 @@ class EnergyBlockDeposition:
         self.__returnToNeutralPoint()
         utils.RearClaw.closeGate()
 
+    @utils.MissionProfiler.step("getBlueClaw")
     def __getBlueClaw(self, count: int):
 
         if self.point == utils.DepositPoint.STORAGE_BATTERY:
@@ -260,7 +383,7 @@ class EnergyBlockDeposition:
             self.__moveClawAtCustomSpeed(utils.FrontClaw, 0.95, 0.25)
 
         # Drives to the deposition zone.
-        ev3pid.GyroStraight(300, self.gyroAngle).runUntil(lambda: DRIVE_BASE.angle() >= 240)
+        ev3pid.GyroStraight(300, self.gyroAngle).runUntil(DRIVE_ANGLE.atLeast(240))
         DRIVE_BASE.hold()
 
         if self.point == utils.DepositPoint.STORAGE_BATTERY:
@@ -268,7 +391,7 @@ class EnergyBlockDeposition:
         else:
             utils.FrontClaw.drop()
 
-        wait(250)
+        FRONT_CLAW_SETTLE.wait()
 
         utils.FrontClaw.loads -= count
 
@@ -280,6 +403,7 @@ class EnergyBlockDeposition:
 
         self.__returnToNeutralPoint()
 
+    @utils.MissionProfiler.step("getFrontStore")
     def __getFrontStore(self, count: int):
 
         #FIXME: Doesn't work with wall at storage battery.
@@ -291,23 +415,23 @@ class EnergyBlockDeposition:
 
         # Drives backwards to realign blocks in undercarriage storage.
         totalBackDist = -40 - 45 * (5 - len(utils.RunLogic.undercarriageStorage))
-        gyroStraightBackwardsToGrabBlocks.runUntil(lambda: DRIVE_BASE.angle() < totalBackDist)
+        gyroStraightBackwardsToGrabBlocks.runUntil(DRIVE_ANGLE.below(totalBackDist))
         DRIVE_BASE.hold()
-        wait(50)
+        DRIVE_BASE_SETTLE.wait()
 
         # Drives backwards and grabs blocks.
         utils.FrontClaw.rubberUp()
         totalBackDist += -85 - 45 * (count - 1)
         gyroStraightBackwardsToGrabBlocks.speed = -250
-        gyroStraightBackwardsToGrabBlocks.runUntil(lambda: DRIVE_BASE.angle() < totalBackDist)
+        gyroStraightBackwardsToGrabBlocks.runUntil(DRIVE_ANGLE.below(totalBackDist))
         DRIVE_BASE.hold()
-        wait(50)
+        DRIVE_BASE_SETTLE.wait()
         utils.FrontClaw.rubberDown()
 
         # Deposits blocks
-        ev3pid.GyroStraight(450, self.gyroAngle).runUntil(lambda: DRIVE_BASE.angle() >= 300)
+        ev3pid.GyroStraight(450, self.gyroAngle).runUntil(DRIVE_ANGLE.atLeast(300))
         DRIVE_BASE.hold()
-        wait(50)
+        DRIVE_BASE_SETTLE.wait()
         utils.FrontClaw.rubberUp()
 
         # Secures subsequent blocks
@@ -323,6 +447,7 @@ class EnergyBlockDeposition:
         for _ in range(count):
             utils.RunLogic.undercarriageStorage.pop()
 
+    @utils.MissionProfiler.step("getRearStore")
     def __getRearStore(self, count: int):
 
         #FIXME: Doesn't work with wall at storage battery.
@@ -333,9 +458,9 @@ class EnergyBlockDeposition:
 
         # Drives forwards to realign blocks in undercarriage storage.
         totalForwardsDist = 40 + 45 * (5 - len(utils.RunLogic.undercarriageStorage))
-        gyroStraightForwardsToGrabBlocks.runUntil(lambda: DRIVE_BASE.angle() > totalForwardsDist)
+        gyroStraightForwardsToGrabBlocks.runUntil(DRIVE_ANGLE.above(totalForwardsDist))
         DRIVE_BASE.hold()
-        wait(50)
+        DRIVE_BASE_SETTLE.wait()
         DRIVE_BASE.run_angle(-100, 10)
 
         # Drives forwards and grabs blocks.
@@ -343,13 +468,13 @@ class EnergyBlockDeposition:
         wait(50)
         totalForwardsDist += 40 + 45 * (count - 1)
         gyroStraightForwardsToGrabBlocks.speed = 200
-        gyroStraightForwardsToGrabBlocks.runUntil(lambda: DRIVE_BASE.angle() > totalForwardsDist)
+        gyroStraightForwardsToGrabBlocks.runUntil(DRIVE_ANGLE.above(totalForwardsDist))
         DRIVE_BASE.hold()
-        wait(50)
+        DRIVE_BASE_SETTLE.wait()
         utils.RearClaw.closeGate()
 
         # Deposits blocks
-        ev3pid.GyroStraight(-400, self.gyroAngle).runUntil(lambda: DRIVE_BASE.angle() <= -320)
+        ev3pid.GyroStraight(-400, self.gyroAngle).runUntil(DRIVE_ANGLE.atMost(-320))
         DRIVE_BASE.hold()
         utils.RearClaw.openGate()
 
@@ -444,13 +569,13 @@ class EnergyBlockDeposition:
 
 def scanBlocksAtLeftHouse():
 
-    print("-" * 10, "scanBlocksAtLeftHouse")
+    startProcedure("scanBlocksAtLeftHouse")
 
     # Moves forward.
     gyroStraightForwardsToLeftHouse = ev3pid.GyroStraight(1000, 0)
-    gyroStraightForwardsToLeftHouse.runUntil(lambda: DRIVE_BASE.angle() > 600)
+    gyroStraightForwardsToLeftHouse.runUntil(DRIVE_ANGLE.above(600))
     gyroStraightForwardsToLeftHouse.speed = 700
-    gyroStraightForwardsToLeftHouse.runUntil(lambda: DRIVE_BASE.angle() > 890)
+    gyroStraightForwardsToLeftHouse.runUntil(DRIVE_ANGLE.above(890))
     LEFT_MOTOR.hold()
 
     # Turns around to align with blocks at left house.
@@ -459,12 +584,12 @@ def scanBlocksAtLeftHouse():
 
     DRIVE_BASE.reset_angle()
     GYRO.reset_angle(-90)
-    scanHouseBlocksProcedure(utils.DepositPoint.LEFT_HOUSE, -90, lambda: DRIVE_BASE.angle() > 100, False)
-    ev3pid.GyroStraight(450, -90).runUntil(lambda: LEFT_COLOR.color() == Color.BLACK)
+    scanHouseBlocksProcedure(utils.DepositPoint.LEFT_HOUSE, -90, DRIVE_ANGLE.above(100), False)
+    ev3pid.GyroStraight(450, -90).runUntil(LEFT_ON_BLACK)
 
 def collectYellowSurplusAndLeftEnergy():
 
-    print("-" * 10, "collectYellowSurplusAndLeftEnergy")
+    startProcedure("collectYellowSurplusAndLeftEnergy")
 
     # Drives forward to align with blocks.
     targetAngle = DRIVE_BASE.angle() + 130
@@ -472,35 +597,34 @@ def collectYellowSurplusAndLeftEnergy():
 
     # Turns, then aligns to black line.
     ev3pid.GyroTurn(-180, False, True).run()
-    ev3pid.GyroStraight(-350, -180).runUntil(lambda: LEFT_COLOR.color() == Color.BLACK or \
-        RIGHT_COLOR.color() == Color.BLACK)
+    ev3pid.GyroStraight(-350, -180).runUntil(EITHER_ON_BLACK)
     DRIVE_BASE.hold()
     utils.RearClaw.closeGate(wait=False)
 
     # Drives forwards to collect the blocks.
     DRIVE_BASE.reset_angle()
     gyroStraightForwardsUntilLeftEnergy = ev3pid.GyroStraight(700, -180)
-    gyroStraightForwardsUntilLeftEnergy.runUntil(lambda: DRIVE_BASE.angle() > 600)      # Moves off the black line.
+    gyroStraightForwardsUntilLeftEnergy.runUntil(DRIVE_ANGLE.above(600))      # Moves off the black line.
     gyroStraightForwardsUntilLeftEnergy.speed = 400
-    gyroStraightForwardsUntilLeftEnergy.runUntil(lambda: DRIVE_BASE.angle() > 820)
+    gyroStraightForwardsUntilLeftEnergy.runUntil(DRIVE_ANGLE.above(820))
     DRIVE_BASE.hold()
     utils.FrontClaw.closeGate()
 
     # Returns to the line.
-    ev3pid.GyroStraight(-300, -180).runUntil(lambda: DRIVE_BASE.angle() < 620)
+    ev3pid.GyroStraight(-300, -180).runUntil(DRIVE_ANGLE.below(620))
     DRIVE_BASE.hold()
     wait(25)
 
 def rotateSolarPanels():
 
-    print("-" * 10, "rotateSolarPanels")
+    startProcedure("rotateSolarPanels")
 
     # Turns to align to black line for line tracking.
     ev3pid.GyroTurn(-90, True, True).run()
     DRIVE_BASE.reset_angle()
 
     # Travels to solar panels.
-    ev3pid.LineTrack(300, ev3pid.LineEdge.RIGHT, LEFT_COLOR).runUntil(lambda: RIGHT_COLOR.color() == Color.BLACK)
+    ev3pid.LineTrack(300, ev3pid.LineEdge.RIGHT, LEFT_COLOR).runUntil(RIGHT_ON_BLACK)
     GYRO.reset_angle(-90)
     targetAngle = DRIVE_BASE.angle() + 110
     DRIVE_BASE.run_target(75, targetAngle)
@@ -516,12 +640,11 @@ def rotateSolarPanels():
     utils.RearClaw.closeGate()
 
     # Returns to line.
-    ev3pid.GyroStraight(-300, -180).runUntil(lambda: LEFT_COLOR.color() == Color.BLACK or \
-        RIGHT_COLOR.color() == Color.BLACK)
+    ev3pid.GyroStraight(-300, -180).runUntil(EITHER_ON_BLACK)
 
 def collectYellowRightEnergy():
 
-    print("-" * 10, "collectYellowRightEnergy")
+    startProcedure("collectYellowRightEnergy")
 
     # Turns to align to black line for line tracking.
     DRIVE_BASE.reset_angle()
@@ -529,36 +652,37 @@ def collectYellowRightEnergy():
     ev3pid.GyroTurn(-90, True, True).run()
 
     # Reverses to align with vertical line.
-    ev3pid.GyroStraight(-300, -90).runUntil(lambda: RIGHT_COLOR.color() == Color.BLACK)
+    ev3pid.GyroStraight(-300, -90).runUntil(RIGHT_ON_BLACK)
     DRIVE_BASE.hold()
-    wait(50)
+    DRIVE_BASE_SETTLE.wait()
     DRIVE_BASE.reset_angle()
-    utils.FrontClaw.maximum(wait=False)
-    wait(50)
+    frontClawMove = utils.FrontClaw.maximum(wait=False)         # Overlaps with travelling to the blocks.
+    frontClawMove.wait(progress=0.15)                           # Lead that wait(50) gave: ~45 of 275 deg.
 
     # Travels to yellow blocks.
-    ev3pid.LineTrack(500, ev3pid.LineEdge.RIGHT, LEFT_COLOR).runUntil(lambda: DRIVE_BASE.angle() > 390)
+    ev3pid.LineTrack(500, ev3pid.LineEdge.RIGHT, LEFT_COLOR).runUntil(DRIVE_ANGLE.above(390))
     DRIVE_BASE.run_target(400, 575)
     DRIVE_BASE.hold()
+    frontClawMove.wait()
 
     # Turns and collects.
     ev3pid.GyroTurn(-180, True, True).run(precisely=True)
     DRIVE_BASE.reset_angle()
-    ev3pid.GyroStraight(400, -180).runUntil(lambda: DRIVE_BASE.angle() > 180)
+    ev3pid.GyroStraight(400, -180).runUntil(DRIVE_ANGLE.above(180))
     DRIVE_BASE.hold()
     utils.FrontClaw.closeGate()
 
 def collectGreenSurplus():
 
-    print("-" * 10, "collectGreenSurplus")
+    startProcedure("collectGreenSurplus")
 
     # Aligns to green surplus blocks.
     ev3pid.GyroTurn(-90, False, True).run()
     DRIVE_BASE.reset_angle()
     gyroStraightForwardsToAlignGreenSurplus = ev3pid.GyroStraight(600, -90)
-    gyroStraightForwardsToAlignGreenSurplus.runUntil(lambda: DRIVE_BASE.angle() > 290)
+    gyroStraightForwardsToAlignGreenSurplus.runUntil(DRIVE_ANGLE.above(290))
     gyroStraightForwardsToAlignGreenSurplus.speed = 250
-    gyroStraightForwardsToAlignGreenSurplus.runUntil(lambda: DRIVE_BASE.angle() > 370)
+    gyroStraightForwardsToAlignGreenSurplus.runUntil(DRIVE_ANGLE.above(370))
     DRIVE_BASE.hold()
     wait(25)
     ev3pid.GyroTurn(0, False, True).run()
@@ -571,9 +695,9 @@ def collectGreenSurplus():
     # Drives forwards to collect.
     utils.FrontClaw.maximum(wait=False)
     gyroStraightForwardsToCollectGreenSurplus = ev3pid.GyroStraight(700, 0)
-    gyroStraightForwardsToCollectGreenSurplus.runUntil(lambda: DRIVE_BASE.angle() > 400)
+    gyroStraightForwardsToCollectGreenSurplus.runUntil(DRIVE_ANGLE.above(400))
     gyroStraightForwardsToCollectGreenSurplus.speed = 400
-    gyroStraightForwardsToCollectGreenSurplus.runUntil(lambda: RIGHT_COLOR.reflection() < BLACK_VALUE)
+    gyroStraightForwardsToCollectGreenSurplus.runUntil(RIGHT_REFLECTION.below(BLACK_VALUE))
     DRIVE_BASE.hold()
     utils.FrontClaw.closeGate()
     # preciseLineSquaringProcedure(ev3pid.LinePosition.BEHIND)
@@ -584,49 +708,34 @@ def collectGreenSurplus():
 
 def collectGreenEnergy():
 
-    print("-" * 10,  "collectGreenEnergy")
+    startProcedure("collectGreenEnergy")
 
     # Moves to neutral position to collect green energy blocks.
     DRIVE_BASE.run_angle(250, -65)
     ev3pid.GyroTurn(90, True, False).run()
-    wait(5000)
+    GYRO_SETTLE.wait()
     lineTrackToGreenEnergy = ev3pid.LineTrack(400, ev3pid.LineEdge.RIGHT, LEFT_COLOR)
-    lineTrackToGreenEnergy.runUntil(lambda: RIGHT_COLOR.reflection() > WHITE_VALUE)
-    lineTrackToGreenEnergy.runUntil(lambda: RIGHT_COLOR.reflection() < BLACK_VALUE)
+    lineTrackToGreenEnergy.runUntil(RIGHT_REFLECTION.above(WHITE_VALUE))
+    lineTrackToGreenEnergy.runUntil(RIGHT_REFLECTION.below(BLACK_VALUE))
     # DRIVE_BASE.run_angle(200, 20)
     DRIVE_BASE.reset_angle()
     wait(50)
     ev3pid.GyroTurn(180, False, True).run()
-    ev3pid.GyroStraight(-200, 180).runUntil(lambda: LEFT_COLOR.color() == Color.BLACK or \
-        RIGHT_COLOR.color() == Color.BLACK)
+    ev3pid.GyroStraight(-200, 180).runUntil(EITHER_ON_BLACK)
     DRIVE_BASE.hold()
     DRIVE_BASE.reset_angle()
-    ev3pid.GyroStraight(350, 180).runUntil(lambda: DRIVE_BASE.angle() > 200)
+    ev3pid.GyroStraight(350, 180).runUntil(DRIVE_ANGLE.above(200))
     DRIVE_BASE.hold()
 
     # Collects left green energy blocks.
-    ev3pid.GyroTurn(195, True, True).run(precisely=True)
-    DRIVE_BASE.reset_angle()
-    utils.RearClaw.collect(wait=False)
-    wait(125)
-    ev3pid.GyroStraight(-350, 195).runUntil(lambda: DRIVE_BASE.angle() < -240)
-    DRIVE_BASE.hold()
-    utils.RearClaw.loads += 1
-    utils.RearClaw.closeGate()
+    collectGreenEnergyBlocksProcedure(195, 240)
 
     # Returns to neutral position.
-    ev3pid.GyroStraight(500, 195).runUntil(lambda: DRIVE_BASE.angle() > 0)
+    ev3pid.GyroStraight(500, 195).runUntil(DRIVE_ANGLE.above(0))
     DRIVE_BASE.hold()
 
     # Collects right green energy blocks.
-    ev3pid.GyroTurn(163, True, True).run(precisely=True)
-    DRIVE_BASE.reset_angle()
-    utils.RearClaw.collect(wait=False)
-    wait(125)
-    ev3pid.GyroStraight(-350, 163).runUntil(lambda: DRIVE_BASE.angle() < -265)
-    DRIVE_BASE.hold()
-    utils.RearClaw.loads += 1
-    utils.RearClaw.closeGate()
+    collectGreenEnergyBlocksProcedure(163, 265)
 
     # Aligns to black line.
     DRIVE_BASE.run_angle(400, 70)
@@ -634,16 +743,16 @@ def collectGreenEnergy():
 
 def scanBlocksAtRightHouse():
 
-    print("-" * 10, "collectBlueSurplus")
+    startProcedure("scanBlocksAtRightHouse")
 
-    wait(5000)
+    GYRO_SETTLE.wait()
 
     # Travels to blue area.
     DRIVE_BASE.reset_angle()
     # lineTrackGreenZoneToBlue = ev3pid.LineTrack(600, ev3pid.LineEdge.RIGHT, LEFT_COLOR)
     lineTrackGreenZoneToBlue = ev3pid.GyroStraight(800, 270)
-    lineTrackGreenZoneToBlue.runUntil(lambda: DRIVE_BASE.angle() > 900)
-    lineTrackGreenZoneToBlue.runUntil(lambda: RIGHT_COLOR.color() == Color.BLACK)
+    lineTrackGreenZoneToBlue.runUntil(DRIVE_ANGLE.above(900))
+    lineTrackGreenZoneToBlue.runUntil(RIGHT_ON_BLACK)
     DRIVE_BASE.run_angle(200, 20)
     wait(50)
 
@@ -659,6 +768,8 @@ def scanBlocksAtRightHouse():
 
 def collectBlueSurplus():
 
+    startProcedure("collectBlueSurplus")
+
     # # Aligns with blue surplus blocks.
     # DRIVE_BASE.reset_angle()
     # DRIVE_BASE.run_angle(-200, 190)
@@ -680,9 +791,9 @@ def collectBlueSurplus():
     # wait(50)
     DRIVE_BASE.reset_angle()
     gyroStraightForwardsToCollectBlueSurplus = ev3pid.GyroStraight(600, 180)
-    gyroStraightForwardsToCollectBlueSurplus.runUntil(lambda: DRIVE_BASE.angle() > 300)
+    gyroStraightForwardsToCollectBlueSurplus.runUntil(DRIVE_ANGLE.above(300))
     gyroStraightForwardsToCollectBlueSurplus.speed = 400
-    gyroStraightForwardsToCollectBlueSurplus.runUntil(lambda: DRIVE_BASE.angle() > 625)
+    gyroStraightForwardsToCollectBlueSurplus.runUntil(DRIVE_ANGLE.above(625))
     DRIVE_BASE.hold()
     wait(25)
     utils.FrontClaw.collect()
@@ -695,31 +806,31 @@ def collectBlueSurplus():
 
 def collectBlueEnergy():
 
-    print("-" * 10, "collectBlueEnergy")
+    startProcedure("collectBlueEnergy")
 
     # Collects upper blue energy blocks.
     ev3pid.GyroTurn(255, True, True).run(precisely=True)
     DRIVE_BASE.reset_angle()
-    ev3pid.GyroStraight(400, 255).runUntil(lambda: DRIVE_BASE.angle() >= 190)
+    ev3pid.GyroStraight(400, 255).runUntil(DRIVE_ANGLE.atLeast(190))
     DRIVE_BASE.hold()
     utils.FrontClaw.loads += 1
     utils.FrontClaw.lift()
 
     # Returns to center.
-    ev3pid.GyroStraight(-400, 255).runUntil(lambda: DRIVE_BASE.angle() <= 0)
+    ev3pid.GyroStraight(-400, 255).runUntil(DRIVE_ANGLE.atMost(0))
     DRIVE_BASE.hold()
-    wait(50)
+    DRIVE_BASE_SETTLE.wait()
 
     # Collects lower blue energy blocks.
     utils.FrontClaw.collect(wait=False)
     ev3pid.GyroTurn(283, True, True).run(precisely=True)
     DRIVE_BASE.reset_angle()
-    ev3pid.GyroStraight(400, 285).runUntil(lambda: DRIVE_BASE.angle() >= 180)
+    ev3pid.GyroStraight(400, 285).runUntil(DRIVE_ANGLE.atLeast(180))
     DRIVE_BASE.hold()
 
 def scanBlocksAtTopHouse():
 
-    print("-" * 10, "scanBlocksAtTopHouse")
+    startProcedure("scanBlocksAtTopHouse")
 
     # Lifts claw to collect lower blue energy blocks.
     utils.FrontClaw.loads += 1
@@ -737,13 +848,8 @@ def scanBlocksAtTopHouse():
     # utils.RunLogic.houses[utils.DepositPoint.TOP_HOUSE].reverse()       # Because the robot is scanning in reverse.
 
     # Move to top house
-    gyroStraightForwardsToTopHouse = ev3pid.GyroStraight(900, 450)
-    gyroStraightForwardsToTopHouse.runUntil(lambda: DRIVE_BASE.angle() > 400)
-    gyroStraightForwardsToTopHouse.speed = 500
-    gyroStraightForwardsToTopHouse.runUntil(lambda: LEFT_COLOR.color() == Color.BLACK or \
-        RIGHT_COLOR.color() == Color.BLACK)
-    wait(25)
-    preciseLineSquaringProcedure(ev3pid.LinePosition.BEHIND)
+    ev3pid.GyroStraight(900, 450).runUntil(DRIVE_ANGLE.above(400))
+    approachSquareProcedure(500, 450, ev3pid.LinePosition.BEHIND)
     GYRO.reset_angle(450)
     DRIVE_BASE.run_angle(-400, 100)
 
@@ -751,54 +857,56 @@ def scanBlocksAtTopHouse():
     ev3pid.GyroTurn(540, True, False).run()
     utils.RearClaw.closeGate(wait=False)
     DRIVE_BASE.reset_angle()
-    ev3pid.GyroStraight(-400, 540).runUntil(lambda: DRIVE_BASE.angle() < -250)
+    ev3pid.GyroStraight(-400, 540).runUntil(DRIVE_ANGLE.below(-250))
     DRIVE_BASE.hold()
-    wait(50)
+    DRIVE_BASE_SETTLE.wait()
 
 def depositBlocksAtTopHouse():
 
-    print("-" * 10, "depositBlocksAtTopHouse")
+    startProcedure("depositBlocksAtTopHouse")
 
     EnergyBlockDeposition(utils.DepositPoint.TOP_HOUSE, 540, EnergyBlockDeposition.FacingDirection.AWAY).run()
 
     # Drives to storage battery.
     # gyroStraightToBlackLineWithSensorCheckProcedure(speed=500, gyroAngle=720)
-    ev3pid.GyroStraight(400, 720).runUntil(lambda: LEFT_COLOR.reflection() > WHITE_VALUE and \
-        RIGHT_COLOR.reflection() > WHITE_VALUE)
+    ev3pid.GyroStraight(400, 720).runUntil(BOTH_ON_WHITE)
+    if USE_COLOR_MODE_MANAGER:
+        COLOR_MODES.pin(ev3pid.ColorMode.COLOR, "depositBlocksAtTopHouse green check")     # Green needs color mode.
     if LEFT_COLOR.color() == Color.GREEN or RIGHT_COLOR.color() == Color.GREEN:
         while not (LEFT_COLOR.color() == Color.BLACK or RIGHT_COLOR.color() == Color.BLACK):
             DRIVE_BASE.run(-300)
+    if USE_COLOR_MODE_MANAGER:
+        COLOR_MODES.pin(ev3pid.ColorMode.REFLECTION, "depositBlocksAtTopHouse")
     DRIVE_BASE.hold()
-    wait(50)
+    DRIVE_BASE_SETTLE.wait()
 
 def depositBlocksAtStorageBattery():
 
-    print("-" * 10, "depositBlocksAtStorageBattery")
+    startProcedure("depositBlocksAtStorageBattery")
 
     # Moves to neutral position for block deposition.
     DRIVE_BASE.reset_angle()
-    ev3pid.GyroStraight(-200, 720).runUntil(lambda: DRIVE_BASE.angle() < -165)
+    ev3pid.GyroStraight(-200, 720).runUntil(DRIVE_ANGLE.below(-165))
     DRIVE_BASE.hold()
 
     EnergyBlockDeposition(utils.DepositPoint.STORAGE_BATTERY, 720, EnergyBlockDeposition.FacingDirection.TOWARDS).run()
 
     utils.FrontClaw.goTo(0.79)
-    gyroStraightToBlackLineWithSensorCheckProcedure(speed=400, gyroAngle=720)
-    preciseLineSquaringProcedure(ev3pid.LinePosition.BEHIND)
+    approachSquareProcedure(400, 720, ev3pid.LinePosition.BEHIND)
     GYRO.reset_angle(720)
 
 def depositBlocksAtRightHouse():
 
-    print("-" * 10, "depositBlocksAtRightHouse")
+    startProcedure("depositBlocksAtRightHouse")
 
     # Turns and tracks the black line to the right house.
     ev3pid.GyroTurn(630, False, True).run()
     DRIVE_BASE.reset_angle()
     # lineTrackToRightHouse = ev3pid.LineTrack(800, ev3pid.LineEdge.RIGHT, LEFT_COLOR)
     lineTrackToRightHouse = ev3pid.GyroStraight(800, 630)
-    lineTrackToRightHouse.runUntil(lambda: DRIVE_BASE.angle() > 360)
+    lineTrackToRightHouse.runUntil(DRIVE_ANGLE.above(360))
     lineTrackToRightHouse.speed = 400
-    lineTrackToRightHouse.runUntil(lambda: RIGHT_COLOR.color() == Color.BLACK)
+    lineTrackToRightHouse.runUntil(RIGHT_ON_BLACK)
     DRIVE_BASE.hold()
     wait(25)
 
@@ -814,23 +922,23 @@ def depositBlocksAtRightHouse():
 
 def depositBlocksAtLeftHouse():
 
-    print("-" * 10, "depositBlocksAtLeftHouse")
+    startProcedure("depositBlocksAtLeftHouse")
 
     # Turns and tracks the black line to the left house.
     DRIVE_BASE.run_angle(-400, -100)
     wait(50)
     ev3pid.GyroTurn(810, False, True).run()
-    wait(5000)
+    GYRO_SETTLE.wait()
     DRIVE_BASE.reset_angle()
     # lineTrackToLeftHouse = ev3pid.LineTrack(600, ev3pid.LineEdge.RIGHT, LEFT_COLOR)
     lineTrackToLeftHouse = ev3pid.GyroStraight(700, 810)
-    lineTrackToLeftHouse.runUntil(lambda: DRIVE_BASE.angle() > 360)
-    lineTrackToLeftHouse.runUntil(lambda: RIGHT_COLOR.color() == Color.BLACK)
-    lineTrackToLeftHouse.runUntil(lambda: RIGHT_COLOR.color() == Color.WHITE)
-    lineTrackToLeftHouse.runUntil(lambda: RIGHT_COLOR.color() == Color.BLACK)
+    lineTrackToLeftHouse.runUntil(DRIVE_ANGLE.above(360))
+    lineTrackToLeftHouse.runUntil(RIGHT_ON_BLACK)
+    lineTrackToLeftHouse.runUntil(RIGHT_ON_WHITE)
+    lineTrackToLeftHouse.runUntil(RIGHT_ON_BLACK)
     lineTrackTargetAngle = DRIVE_BASE.angle() + 550
     lineTrackToLeftHouse.speed = 600
-    lineTrackToLeftHouse.runUntil(lambda: DRIVE_BASE.angle() >= lineTrackTargetAngle)
+    lineTrackToLeftHouse.runUntil(DRIVE_ANGLE.atLeast(lineTrackTargetAngle))
     LEFT_MOTOR.hold()
 
     # Moves to neutral position for block deposition.
@@ -842,7 +950,7 @@ def depositBlocksAtLeftHouse():
 
 def returnToStartZone():
 
-    print("-" * 10, "returnToBase")
+    startProcedure("returnToStartZone")
 
     utils.FrontClaw.goTo(1, wait=False)
     utils.RearClaw.goTo(1, wait=False)
@@ -0,0 +1,129 @@
+# BlockDetector.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Streaming detection of house blocks from side scanner readings taken while driving past.
+
+
+from pybricks.parameters import Color
+
+from .SideScan import SideScan
+
+class DetectedBlock:
+
+    def __init__(self, color, start: float, end: float, votes: list, samples: int):
+
+        self.color = color              # Majority color, or None if no sample had a color.
+        self.start = start              # Drive base angle at the leading and trailing edges.
+        self.end = end
+        self.votes = votes              # Samples of each of BlockDetector.COLORS.
+        self.samples = samples          # Samples in the window, with or without a color.
+
+    def width(self) -> float:
+        return abs(self.end - self.start)
+
+class BlockDetector:
+
+    """
+    Detects blocks from every side scanner reading taken while driving past them, and votes on each block's color.
+
+    ## Discussion
+    Call `update()` with every reading and the drive base angle, then `finish()` once past the blocks. A block starts
+    after `ON_SAMPLES` present readings in a row and ends after `OFF_SAMPLES` absent readings in a row, so that a
+    single noisy reading neither creates nor splits a block. The edges are the angles of the first reading of each
+    run, so debouncing does not shift them.
+
+    Every present reading in a block's window votes for its color, and the block takes the majority, so one pass at
+    full speed gives the colors without relying on a single reading at the leading edge.
+    """
+
+    ON_SAMPLES = 2
+    OFF_SAMPLES = 3
+
+    # Colors that are voted on, in order of precedence for ties.
+    COLORS = (Color.BLUE, Color.GREEN, Color.YELLOW)
+
+    def __init__(self):
+
+        self.blocks = []
+
+        self.inBlock = False
+        self.run = 0                    # Readings in a row that disagree with inBlock.
+        self.start = None
+        self.end = None
+        self.votes = [0] * len(BlockDetector.COLORS)
+        self.samples = 0
+
+    def update(self, rgb: tuple, position: float):
+
+        present = SideScan.presence(rgb)
+
+        if present:
+
+            # A new run of present readings may be a new block.
+            if not self.inBlock and self.run == 0:
+                self.start = position
+                self.votes = [0] * len(BlockDetector.COLORS)
+                self.samples = 0
+
+            color = SideScan.color(rgb)
+            if color in BlockDetector.COLORS:
+                self.votes[BlockDetector.COLORS.index(color)] += 1
+            self.samples += 1
+
+        if present != self.inBlock:
+
+            if self.run == 0:
+                self.end = position
+
+            self.run += 1
+
+            if self.run >= (BlockDetector.ON_SAMPLES if present else BlockDetector.OFF_SAMPLES):
+                self.inBlock = present
+                self.run = 0
+                if not present:
+                    self.__close()
+
+        else:
+            self.run = 0
+
+    def finish(self, position: float):
+
+        """
+        Ends a block that is still in view, at `position`.
+        """
+
+        if self.inBlock:
+            if self.run == 0:
+                self.end = position
+            self.inBlock = False
+            self.run = 0
+            self.__close()
+
+    def __close(self):
+
+        votes = self.votes
+        best = max(votes)
+        color = BlockDetector.COLORS[votes.index(best)] if best > 0 else None
+
+        self.blocks.append(DetectedBlock(color, self.start, self.end, votes, self.samples))
+
+    def colors(self, count: int = None) -> list:
+
+        """
+        Returns the colors of the detected blocks, in the order passed. With `count`, keeps only the `count` blocks
+        with the most samples.
+        """
+
+        blocks = self.blocks
+
+        if count is not None and len(blocks) > count:
+            strongest = sorted(blocks, key=lambda block: block.samples, reverse=True)[:count]
+            blocks = [block for block in blocks if block in strongest]
+
+        return [block.color for block in blocks]
+
+    def report(self) -> str:
+
+        return "; ".join(str(block.color) + " at " + str(round(block.start)) + "-" + str(round(block.end)) + " deg, " +
+                         str(max(block.votes)) + "/" + str(block.samples) + " votes" for block in self.blocks)
@@ -8,8 +8,23 @@
 from pybricks.ev3devices import Motor                                                     #pylint: disable=unused-import
 from pybricks.tools import wait
 
+from ev3pid import Settle
+from .ClawMove import ClawMove
+
 class Claw:
 
+    """
+    Base class for claws, which are positioned by `amount`: a fraction of ANGLE_RANGE, scaled up by LOAD_MULTIPLIER per
+    load above LIFTING_THRESHOLD.
+
+    ## Discussion
+    Moves return a ClawMove handle. With `wait=False`, poll or wait on the handle to overlap the move with driving, and
+    check the result of its `wait()` for stalls.
+
+    The motor angle for each (amount, loads) pair is computed on first use and kept in TARGETS, so that moves do not
+    evaluate the load multiplier each time.
+    """
+
     ANGLE_RANGE = None               # Use measureAngleRange() to find angle range.
     LOAD_MULTIPLIER = None
     LIFTING_THRESHOLD = None
@@ -17,23 +32,74 @@ class Claw:
     SINGLE_LOAD_SPEED = None         # Speeds defined in subclasses.
     DOUBLE_LOAD_SPEED = None
 
+    TARGET_TOLERANCE = 5             # In deg, for settle().
+    MAX_LOADS = 2
+
     MOTOR = None
 
+    TARGETS = None                   # Motor angles by amount, then by loads; set per subclass on first use.
+
     loads = 0
+    target = None                    # Motor angle of the latest move.
+
+    @classmethod
+    def targetAngle(cls, amount: float, loads: int = None) -> float:
+
+        # Resolves optional arguments with default values.
+        loads = loads if loads is not None else cls.loads
+
+        if cls.TARGETS is None:
+            cls.TARGETS = {}
+
+        angles = cls.TARGETS.get(amount)
+        if angles is None:
+            angles = [cls.ANGLE_RANGE * amount * (1 if amount <= cls.LIFTING_THRESHOLD else cls.LOAD_MULTIPLIER ** n)
+                      for n in range(cls.MAX_LOADS + 1)]
+            cls.TARGETS[amount] = angles
+
+        if 0 <= loads <= cls.MAX_LOADS:
+            return angles[loads]
+
+        return cls.ANGLE_RANGE * amount * (1 if amount <= cls.LIFTING_THRESHOLD else cls.LOAD_MULTIPLIER ** loads)
 
     @classmethod
-    def goTo(cls, amount: float, wait: bool = True):
-        cls.MOTOR.run_target((cls.SINGLE_LOAD_SPEED if cls.loads < 2 else cls.DOUBLE_LOAD_SPEED), \
-            cls.ANGLE_RANGE * amount * (1 if amount <= cls.LIFTING_THRESHOLD else cls.LOAD_MULTIPLIER ** cls.loads), \
-            wait=wait)
+    def goTo(cls, amount: float, wait: bool = True) -> ClawMove:
+        return cls.moveTo(cls.targetAngle(amount), wait)
+
+    @classmethod
+    def moveTo(cls, angle: float, wait: bool = True) -> ClawMove:
+
+        """
+        Moves the claw motor to `angle`, without the load multiplier, and returns the move. With `wait=True`, blocks in
+        the motor's own `run_target()` until the claw arrives, as before moves returned handles.
+        """
+
+        move = ClawMove(cls.MOTOR, angle)
+        cls.target = angle
+        cls.MOTOR.run_target((cls.SINGLE_LOAD_SPEED if cls.loads < 2 else cls.DOUBLE_LOAD_SPEED), angle, wait=wait)
+
+        return move
+
+    @classmethod
+    def settle(cls, tolerance: float = None, settleTime: float = None, timeout: float = None) -> Settle:
+
+        """
+        Returns a Settle that waits until the claw is within `tolerance` of the target of its latest move.
+        """
+
+        # Resolves optional arguments with default values.
+        tolerance = tolerance if tolerance is not None else cls.TARGET_TOLERANCE
+
+        return Settle(cls.__name__, lambda: cls.target is None or abs(cls.MOTOR.angle() - cls.target) <= tolerance,
+                      settleTime, timeout)
 
     @classmethod
-    def maximum(cls, wait: bool = True):
-        cls.goTo(0.95, wait)
+    def maximum(cls, wait: bool = True) -> ClawMove:
+        return cls.goTo(0.95, wait)
 
     @classmethod
-    def minimum(cls, wait: bool = True):
-        cls.goTo(0.05, wait)
+    def minimum(cls, wait: bool = True) -> ClawMove:
+        return cls.goTo(0.05, wait)
 
     @classmethod
     def measureAngleRange(cls, moveTime):
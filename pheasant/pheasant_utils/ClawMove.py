@@ -0,0 +1,111 @@
+# ClawMove.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Handles for claw moves, for overlapping claw motion with driving.
+
+
+from pybricks.ev3devices import Motor                                                     #pylint: disable=unused-import
+
+from ev3pid import Clock
+
+class ClawMove:
+
+    """
+    A claw move started by `Claw.goTo()`, which can be polled or waited on.
+
+    ## Discussion
+    Poll `done()`, `progress()` and `stalled()` while doing other work, e.g. in a control loop's stop condition, or
+    call `wait()` to block until the claw arrives.
+
+    A move is stalled when the motor reports a stall, or when it is short of its target and has not moved by
+    `STALL_ANGLE` in `STALL_TIME`; stall detection is only updated while the move is polled. On a stall, `wait()` (and
+    a MissionGraph running the move) calls `hold()`, so that the motor stops pushing against the jam.
+    """
+
+    TOLERANCE = 5                       # In deg.
+    STALL_ANGLE = 2                     # In deg.
+    STALL_TIME = 200                    # In ms.
+    POLL_TIME = 5                       # In ms.
+
+    def __init__(self, motor: Motor, target: float):
+
+        self.motor = motor
+        self.start = motor.angle()
+        self.target = target
+        self.startTime = Clock.now()
+
+        self.elapsed = None             # Time the move took (in ms), once wait() has seen it complete.
+        self.jammed = False
+
+        # Latest movement, for stall detection
+        self.lastAngle = self.start
+        self.lastMoved = self.startTime
+
+    def done(self) -> bool:
+        return self.motor.control.done()
+
+    def progress(self) -> float:
+
+        """
+        Returns the fraction of the travel that has been covered, from 0 to 1.
+        """
+
+        travel = self.target - self.start
+        if travel == 0:
+            return 1.0
+
+        return min(max((self.motor.angle() - self.start) / travel, 0.0), 1.0)
+
+    def stalled(self) -> bool:
+
+        if self.jammed:
+            return True
+
+        now = Clock.now()
+        angle = self.motor.angle()
+
+        if abs(angle - self.lastAngle) >= ClawMove.STALL_ANGLE:
+            self.lastAngle = angle
+            self.lastMoved = now
+        elif abs(angle - self.target) > ClawMove.TOLERANCE and \
+                Clock.diff(now, self.lastMoved) >= ClawMove.STALL_TIME * 1000:
+            self.jammed = True
+
+        if self.motor.control.stalled():
+            self.jammed = True
+
+        return self.jammed
+
+    def hold(self):
+
+        """
+        Holds the motor where it is after a stall, so that it stops pushing against the jam, and reports where it
+        stopped.
+        """
+
+        self.motor.hold()
+        print("Claw stalled at", self.motor.angle(), "deg; target", self.target, "deg.")
+
+    def wait(self, progress: float = 1, timeout: float = None) -> bool:
+
+        """
+        Waits until the move is done, or until `progress` of the travel is covered if less than 1. Returns False if the
+        claw stalled, or `timeout` (in ms, from the start of the move) ran out first.
+        """
+
+        while True:
+
+            if (self.done() if progress >= 1 else self.progress() >= progress):
+                if progress >= 1 and self.elapsed is None:
+                    self.elapsed = Clock.diff(Clock.now(), self.startTime) / 1000
+                return True
+
+            if self.stalled():
+                self.hold()
+                return False
+
+            if timeout is not None and Clock.diff(Clock.now(), self.startTime) >= timeout * 1000:
+                return False
+
+            Clock.sleep(ClawMove.POLL_TIME * 1000)
@@ -0,0 +1,124 @@
+# ColorTable.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Lookup table from raw side scanner RGB readings to block colors, built from calibration samples.
+
+
+from pybricks.parameters import Color
+
+class ColorTable:
+
+    """
+    A quantised RGB lookup table that classifies a 'RGB-RAW' reading as no block, or a blue, green or yellow block.
+
+    ## Discussion
+    Each channel is shifted right by `shift` and clamped to `LEVELS` levels, so classifying a reading is one index
+    into a bytearray of class indices (into `CLASSES`). Readings beyond the calibrated range clamp to the edge of the
+    table.
+
+    `build()` makes the table from labelled samples, e.g. recorded by testware/CalibrateSideScan.py. Record each color
+    over the range of distances and speeds seen in a run: every quantised cell takes the majority label of the samples
+    in it, and every other cell takes the label of the nearest such cell. The table is saved and loaded as raw bytes, so
+    loading it does no computation.
+    """
+
+    CLASSES = (None, Color.BLUE, Color.GREEN, Color.YELLOW)
+    LEVELS = 16                         # Per channel.
+    HEADER = b"PCT1"                    # File format marker and version.
+
+    def __init__(self, shift: int, table: bytearray):
+        self.shift = shift
+        self.table = table
+
+    def index(self, rgb: tuple) -> int:
+
+        r, g, b = rgb
+        shift = self.shift
+        top = ColorTable.LEVELS - 1
+
+        return (min(r >> shift, top) * ColorTable.LEVELS + min(g >> shift, top)) * ColorTable.LEVELS + \
+            min(b >> shift, top)
+
+    def classify(self, rgb: tuple):
+
+        """
+        Returns the Color of the block in `rgb`, or None if there is no block.
+        """
+
+        return ColorTable.CLASSES[self.table[self.index(rgb)]]
+
+    @classmethod
+    def build(cls, samples: dict):
+
+        """
+        Returns a table built from `samples`, which maps each of CLASSES to a list of 'RGB-RAW' readings.
+        """
+
+        # Chooses the smallest shift that fits the brightest sample in the table, with headroom for brighter readings.
+        brightest = max(max(rgb) for readings in samples.values() for rgb in readings)
+        shift = 0
+        while (brightest * 3 // 2) >> shift >= cls.LEVELS:
+            shift += 1
+
+        table = cls(shift, bytearray(cls.LEVELS ** 3))
+
+        # Counts the labels of the samples in each cell.
+        counts = {}                     # Cell index -> label counts
+        for color, readings in samples.items():
+            label = cls.CLASSES.index(color)
+            for rgb in readings:
+                cellCounts = counts.setdefault(table.index(rgb), [0] * len(cls.CLASSES))
+                cellCounts[label] += 1
+
+        # Prototypes are (r, g, b, label) cells, labelled by majority.
+        prototypes = []
+        for index, cellCounts in counts.items():
+            prototypes.append((index // cls.LEVELS ** 2, index // cls.LEVELS % cls.LEVELS, index % cls.LEVELS,
+                               cellCounts.index(max(cellCounts))))
+
+        # Labels every cell by its nearest prototype.
+        index = 0
+        for r in range(cls.LEVELS):
+            for g in range(cls.LEVELS):
+                for b in range(cls.LEVELS):
+
+                    nearest = None
+                    label = 0
+                    for pr, pg, pb, prototypeLabel in prototypes:
+                        distance = (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2
+                        if nearest is None or distance < nearest:
+                            nearest = distance
+                            label = prototypeLabel
+
+                    table.table[index] = label
+                    index += 1
+
+        return table
+
+    def save(self, path: str):
+
+        with open(path, 'wb') as file:
+            file.write(ColorTable.HEADER)
+            file.write(bytes((self.shift, ColorTable.LEVELS)))
+            file.write(self.table)
+
+    @classmethod
+    def load(cls, path: str):
+
+        """
+        Returns the table saved at `path`, or None if there is none.
+        """
+
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        header = len(cls.HEADER)
+        if len(data) != header + 2 + cls.LEVELS ** 3 or data[:header] != cls.HEADER or data[header + 1] != cls.LEVELS:
+            print("WARNING: ignoring side scan color table at", path, "as it is not a valid table.")
+            return None
+
+        return cls(data[header], bytearray(data[header + 2:]))
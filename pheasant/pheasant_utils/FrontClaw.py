@@ -6,6 +6,7 @@
 
 
 from .Claw import Claw
+from .ClawMove import ClawMove
 
 class FrontClaw(Claw):
 
@@ -17,32 +18,31 @@ class FrontClaw(Claw):
     DOUBLE_LOAD_SPEED = 700
 
     @classmethod
-    def lift(cls, wait: bool = True):
+    def lift(cls, wait: bool = True) -> ClawMove:
         if cls.loads > 0:
-            cls.goTo(0.81, wait)
-        else:
-            cls.closeGate(wait)
+            return cls.goTo(0.81, wait)
+        return cls.closeGate(wait)
 
     @classmethod
-    def drop(cls, wait: bool = True):
-        cls.goTo(0.74, wait)
+    def drop(cls, wait: bool = True) -> ClawMove:
+        return cls.goTo(0.74, wait)
 
     @classmethod
-    def collect(cls, wait: bool = True):
-        cls.drop(wait)
+    def collect(cls, wait: bool = True) -> ClawMove:
+        return cls.drop(wait)
 
     @classmethod
-    def openGate(cls, wait: bool = True):
-        cls.goTo(0.02, wait)
+    def openGate(cls, wait: bool = True) -> ClawMove:
+        return cls.goTo(0.02, wait)
 
     @classmethod
-    def closeGate(cls, wait: bool = True):
-        cls.goTo(0.66, wait)
+    def closeGate(cls, wait: bool = True) -> ClawMove:
+        return cls.goTo(0.66, wait)
 
     @classmethod
-    def rubberDown(cls, wait: bool = True):
-        cls.goTo(0.83, wait)
+    def rubberDown(cls, wait: bool = True) -> ClawMove:
+        return cls.goTo(0.83, wait)
 
     @classmethod
-    def rubberUp(cls, wait: bool = True):
-        cls.goTo(0.9, wait)
+    def rubberUp(cls, wait: bool = True) -> ClawMove:
+        return cls.goTo(0.9, wait)
@@ -0,0 +1,253 @@
+# MissionGraph.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Runs mission steps by their dependencies and resources, overlapping steps that do not conflict.
+
+
+from ev3pid import Clock
+
+# Hardware that mission steps can claim.
+class Resource:
+    DRIVE_BASE = hash("DRIVE_BASE")         #HACK: enum workaround.
+    FRONT_CLAW = hash("FRONT_CLAW")
+    REAR_CLAW = hash("REAR_CLAW")
+    SIDE_SCAN = hash("SIDE_SCAN")
+
+class MissionStep:
+
+    def __init__(self, name: str, function, resources: tuple, after: tuple):
+
+        self.name = name
+        self.function = function
+        self.resources = resources
+
+        # Steps that must finish first, and the progress of each that suffices (1 for finishing).
+        self.after = [dependency[0] if isinstance(dependency, tuple) else dependency for dependency in after]
+        self.afterProgress = [dependency[1] if isinstance(dependency, tuple) else 1 for dependency in after]
+
+        self.handle = None              # Returned by function, for steps that run in the background.
+        self.start = None               # In us since the graph started running.
+        self.finish = None
+        self.stalled = False            # Whether the step's handle stalled.
+
+    def started(self) -> bool:
+        return self.start is not None
+
+    def finished(self) -> bool:
+        return self.finish is not None
+
+    def duration(self) -> int:
+        return self.finish - self.start
+
+    def reached(self, progress: float) -> bool:
+
+        """
+        Returns whether the step has finished, or is running in the background and has reached `progress`.
+        """
+
+        if self.finished():
+            return True
+
+        return progress < 1 and self.handle is not None and hasattr(self.handle, 'progress') and \
+            self.handle.progress() >= progress
+
+    def conflicts(self, other) -> bool:
+
+        for resource in self.resources:
+            if resource in other.resources:
+                return True
+
+        return False
+
+class MissionGraph:
+
+    """
+    Mission steps, each with the resources it uses and the steps it must follow, run as early as they can be.
+
+    ## Discussion
+    `add()` a step for each action, then `run()` the graph. A step starts once the steps it is `after` have finished
+    and no running step uses any of its resources. Steps that share a resource also run in the order they were added.
+    A dependency on a background step can instead be given as `(step, progress)`, to start once its handle's
+    `progress()` reaches `progress`, e.g. to drive off once a claw is mostly lowered.
+
+    Steps run on the calling thread. A step whose function returns a handle (an object with `done()`, such as a
+    ClawMove from a claw move with `wait=False`) keeps running in the background, and keeps its resources, until the
+    handle is done or stalled; the graph meanwhile starts other steps. Any other step finishes when its function
+    returns. Background steps are polled between steps, so their finish times can be late by up to the blocking step
+    that ran meanwhile. A stalled handle is held (with its `hold()`, if it has one) so that it stops pushing against the
+    jam, and its step is marked `stalled`; `run()` then returns False, but the rest of the graph still runs.
+
+    After the run, `criticalPath()` gives the longest chain of steps through dependencies and resource order, by
+    measured duration. It is the shortest the run could be with unlimited overlap; `report()` compares it with the
+    elapsed and fully sequential times.
+    """
+
+    POLL_TIME = 5                       # In ms.
+
+    def __init__(self, name: str = None):
+        self.name = name
+        self.steps = []
+        self.elapsed = None             # In us, once run.
+        self.criticalLength = None      # Length of the latest criticalPath(), in us.
+
+    def add(self, name: str, function, resources: tuple = (), after: tuple = ()) -> MissionStep:
+
+        """
+        Adds a step that calls `function()` using `resources` (Resource values), after the steps or (step, progress)
+        pairs in `after`, which must already have been added.
+        """
+
+        step = MissionStep(name, function, resources, after)
+        self.steps.append(step)
+
+        return step
+
+    def __ready(self, index: int) -> bool:
+
+        step = self.steps[index]
+
+        for other, progress in zip(step.after, step.afterProgress):
+            if not other.reached(progress):
+                return False
+
+        # Conflicting steps run in the order they were added.
+        for other in self.steps[:index]:
+            if not other.finished() and step.conflicts(other):
+                return False
+
+        return True
+
+    def __poll(self, start: int) -> bool:
+
+        """
+        Finishes background steps whose handles are done or stalled, holding stalled ones, and returns whether any did.
+        """
+
+        finished = False
+
+        for step in self.steps:
+            if step.started() and not step.finished():
+
+                handle = step.handle
+                if handle.done():
+                    step.finish = Clock.diff(Clock.now(), start)
+                    finished = True
+
+                elif hasattr(handle, 'stalled') and handle.stalled():
+                    if hasattr(handle, 'hold'):
+                        handle.hold()
+                    print("WARNING: Mission step", step.name, "stalled.")
+                    step.stalled = True
+                    step.finish = Clock.diff(Clock.now(), start)
+                    finished = True
+
+        return finished
+
+    def run(self) -> bool:
+
+        """
+        Runs the steps, and returns False if any background step stalled.
+        """
+
+        start = Clock.now()
+
+        while True:
+
+            progressed = self.__poll(start)
+            remaining = False
+
+            for index, step in enumerate(self.steps):
+
+                if step.started():
+                    continue
+                remaining = True
+
+                if not self.__ready(index):
+                    continue
+
+                step.start = Clock.diff(Clock.now(), start)
+                handle = step.function()
+                if handle is not None and hasattr(handle, 'done'):
+                    step.handle = handle
+                else:
+                    step.finish = Clock.diff(Clock.now(), start)
+                progressed = True
+
+                # Earlier steps may have been freed while this one ran.
+                break
+
+            running = False
+            for step in self.steps:
+                if step.started() and not step.finished():
+                    running = True
+
+            if not remaining and not running:
+                break
+
+            if not progressed:
+                if not running:
+                    raise ValueError("Mission steps can never start; steps in `after` must belong to the graph.")
+                Clock.sleep(MissionGraph.POLL_TIME * 1000)
+
+        self.elapsed = Clock.diff(Clock.now(), start)
+
+        for step in self.steps:
+            if step.stalled:
+                return False
+
+        return True
+
+    def criticalPath(self) -> list:
+
+        """
+        Returns the steps on the critical path of the latest run, in order.
+        """
+
+        # Steps are added in an order compatible with dependencies and resources, so one pass in that order suffices.
+        # Ties go to the latest added step, as background steps that finish during a blocking step are timed as
+        # finishing with it. A progress dependency only chains through the other step up to when this one started.
+        lengths = []                    # Longest chain ending at each step, in us.
+        previous = []                   # Index of the previous step on that chain, or None.
+
+        for index, step in enumerate(self.steps):
+
+            best = 0
+            bestIndex = None
+            for otherIndex in range(index):
+                other = self.steps[otherIndex]
+                if step.conflicts(other) or (other in step.after and step.afterProgress[step.after.index(other)] >= 1):
+                    length = lengths[otherIndex]
+                elif other in step.after:
+                    length = lengths[otherIndex] - other.duration() + step.start - other.start
+                else:
+                    continue
+                if length >= best:
+                    best = length
+                    bestIndex = otherIndex
+
+            lengths.append(best + step.duration())
+            previous.append(bestIndex)
+
+        if not lengths:
+            self.criticalLength = 0
+            return []
+
+        self.criticalLength = max(lengths)
+        index = lengths.index(self.criticalLength)
+        path = []
+        while index is not None:
+            path.append(self.steps[index])
+            index = previous[index]
+        path.reverse()
+
+        return path
+
+    def report(self) -> str:
+
+        path = self.criticalPath()
+        sequential = sum(step.duration() for step in self.steps)
+        critical = self.criticalLength
+
+        return "Elapsed " + str(round(self.elapsed / 1000)) + " ms; sequential " + str(round(sequential / 1000)) + \
+            " ms; critical path " + str(round(critical / 1000)) + " ms: " + " > ".join(step.name for step in path)
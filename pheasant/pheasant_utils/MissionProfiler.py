@@ -0,0 +1,186 @@
+# MissionProfiler.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Times mission procedures and their steps, broken down into driving, turning, claw moves and waits.
+
+
+from ev3pid import Clock
+
+class MissionProfiler:
+
+    """
+    Times each mission procedure and each step within it, and how much of that time is spent driving, turning, moving
+    the claws and in fixed waits.
+
+    ## Discussion
+    `activate()` makes a profiler the one that procedures and timed functions report to. `startProcedure()` ends the
+    previous procedure and starts timing the next; steps within it are timed by decorating them with `step()`, and are
+    named "procedure/step". Steps may be nested.
+
+    Functions are assigned to a category (one of `CATEGORIES`) by decorating them with `timed()`, or by wrapping
+    existing methods with `instrument()`. Their time is added to every procedure and step that is running. Calls made
+    from within another timed call count only towards the outer call's category, so nothing is counted twice. The rest
+    of each procedure's time is reported as other time.
+
+    Print `report()`, or `dump()` the rows to a CSV file with one row per procedure or step, in the order they started,
+    so that runs can be diffed.
+    """
+
+    ACTIVE = None                       # Profiler that procedures and timed functions report to, or None.
+
+    CATEGORIES = ("drive", "turn", "claw", "wait")
+
+    def __init__(self):
+
+        self.rows = []                  # [name, start, duration, *category times], in us since the profiler started.
+        self.running = []               # Rows of the running procedure and its steps, outermost first.
+        self.category = None            # Category of the timed call in progress, or None.
+        self.start = Clock.now()
+
+    def activate(self):
+        MissionProfiler.ACTIVE = self
+
+    @classmethod
+    def deactivate(cls):
+        cls.ACTIVE = None
+
+    def startProcedure(self, name: str):
+        self.finish()
+        self.begin(name)
+
+    def begin(self, name: str):
+
+        if self.running:
+            name = self.running[-1][0] + "/" + name
+
+        row = [name, Clock.diff(Clock.now(), self.start), None] + [0] * len(MissionProfiler.CATEGORIES)
+        self.rows.append(row)
+        self.running.append(row)
+
+    def end(self):
+        row = self.running.pop()
+        row[2] = Clock.diff(Clock.now(), self.start) - row[1]
+
+    def finish(self):
+
+        """
+        Ends the running procedure and its steps.
+        """
+
+        while self.running:
+            self.end()
+
+    def measure(self, category: str, function, *args, **kwargs):
+
+        """
+        Calls `function` with the arguments, and adds its time to `category` of the running procedure and steps.
+        """
+
+        if self.category is not None or not self.running:
+            return function(*args, **kwargs)
+
+        self.category = category
+        start = Clock.now()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = Clock.diff(Clock.now(), start)
+            self.category = None
+            index = 3 + MissionProfiler.CATEGORIES.index(category)
+            for row in self.running:
+                row[index] += elapsed
+
+    @staticmethod
+    def timed(category: str):
+
+        """
+        Decorator that times the function under `category` while a profiler is active.
+        """
+
+        def decorator(function):
+
+            def timedFunction(*args, **kwargs):
+                profiler = MissionProfiler.ACTIVE
+                if profiler is None:
+                    return function(*args, **kwargs)
+                return profiler.measure(category, function, *args, **kwargs)
+
+            return timedFunction
+
+        return decorator
+
+    @staticmethod
+    def instrument(owner, name: str, category: str):
+
+        """
+        Replaces the attribute `name` of `owner` (a class or module) with a version timed under `category`.
+
+        ## Discussion
+        Class methods are bound to the class they are looked up on, so instrument them on each subclass that uses them,
+        not on the base class.
+        """
+
+        setattr(owner, name, MissionProfiler.timed(category)(getattr(owner, name)))
+
+    @staticmethod
+    def step(name: str):
+
+        """
+        Decorator that times each call of the function as a step named `name` while a profiler is active.
+        """
+
+        def decorator(function):
+
+            def profiledStep(*args, **kwargs):
+
+                profiler = MissionProfiler.ACTIVE
+                if profiler is None:
+                    return function(*args, **kwargs)
+
+                profiler.begin(name)
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    profiler.end()
+
+            return profiledStep
+
+        return decorator
+
+    def table(self) -> list:
+
+        """
+        Returns a row per procedure or step of [name, start, duration, *category times, other time], in ms.
+        """
+
+        table = []
+        for row in self.rows:
+            duration = row[2] if row[2] is not None else Clock.diff(Clock.now(), self.start) - row[1]
+            times = [row[1], duration] + row[3:] + [max(duration - sum(row[3:]), 0)]
+            table.append([row[0]] + [round(time / 1000) for time in times])
+
+        return table
+
+    def report(self) -> str:
+
+        # MicroPython strings have no ljust() or rjust().
+        def pad(text, width):
+            return text + " " * (width - len(text))
+
+        columns = ("start", "duration") + MissionProfiler.CATEGORIES + ("other",)
+        table = self.table()
+        width = max([len("name")] + [len(row[0]) for row in table]) + 2
+
+        lines = [pad("name", width) + "".join(pad(column, 10) for column in columns)]
+        for row in table:
+            lines.append(pad(row[0], width) + "".join(pad(str(value), 10) for value in row[1:]))
+
+        return "\n".join(lines)
+
+    def dump(self, path: str):
+
+        with open(path, 'w') as file:
+            file.write(",".join(("name", "start", "duration") + MissionProfiler.CATEGORIES + ("other",)) + "\n")
+            for row in self.table():
+                file.write(",".join(str(value) for value in row) + "\n")
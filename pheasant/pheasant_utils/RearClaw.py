@@ -6,6 +6,7 @@
 
 
 from .Claw import Claw
+from .ClawMove import ClawMove
 
 class RearClaw(Claw):
 
@@ -17,23 +18,21 @@ class RearClaw(Claw):
     DOUBLE_LOAD_SPEED = 150
 
     @classmethod
-    def lift(cls, wait: bool = True):
-        cls.goTo(0.39, wait)
+    def lift(cls, wait: bool = True) -> ClawMove:
+        return cls.goTo(0.39, wait)
 
     @classmethod
-    def drop(cls, wait: bool = True):
-        cls.goTo(0.21, wait)
+    def drop(cls, wait: bool = True) -> ClawMove:
+        return cls.goTo(0.21, wait)
 
     @classmethod
-    def collect(cls, wait: bool = True):
-        cls.goTo(0.34, wait)
+    def collect(cls, wait: bool = True) -> ClawMove:
+        return cls.goTo(0.34, wait)
 
     @classmethod
-    def openGate(cls, wait: bool = True):
-        cls.MOTOR.run_target((cls.SINGLE_LOAD_SPEED if cls.loads < 2 else cls.DOUBLE_LOAD_SPEED), \
-            cls.ANGLE_RANGE * 0.65, wait=wait)                                  # To bypass load multiplier.
+    def openGate(cls, wait: bool = True) -> ClawMove:
+        return cls.moveTo(cls.ANGLE_RANGE * 0.65, wait)                        # To bypass load multiplier.
 
     @classmethod
-    def closeGate(cls, wait: bool = True):
-        cls.MOTOR.run_target((cls.SINGLE_LOAD_SPEED if cls.loads < 2 else cls.DOUBLE_LOAD_SPEED),
-            cls.ANGLE_RANGE * 0.44, wait=wait)                                  # To bypass load multiplier.
+    def closeGate(cls, wait: bool = True) -> ClawMove:
+        return cls.moveTo(cls.ANGLE_RANGE * 0.44, wait)                        # To bypass load multiplier.
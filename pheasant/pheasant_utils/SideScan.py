@@ -8,14 +8,49 @@
 from pybricks.iodevices import Ev3devSensor                                               #pylint: disable=unused-import
 from pybricks.parameters import Color
 
+from .ColorTable import ColorTable
+
 class SideScan:
 
     sensor = None
+    table = None                        # Calibrated ColorTable; without one, fixed channel rules are used.
+
+    # color() and presence() accept a reading from read(), so that both can be evaluated from a single sensor read.
+
+    @classmethod
+    def read(cls) -> tuple:
+        return cls.sensor.read('RGB-RAW')
+
+    @classmethod
+    def enableSampling(cls, sampler):
+
+        """
+        Reads the side sensor through an ev3pid.SensorSampler. Call before `sampler.start()`.
+        """
+
+        cls.sensor = sampler.ev3devSensor(cls.sensor, 'RGB-RAW', 3, "side scan")
+
+    @classmethod
+    def loadTable(cls, path: str) -> bool:
+
+        """
+        Classifies readings with the ColorTable saved at `path` by calibration, if there is one. Returns whether there
+        was.
+        """
+
+        cls.table = ColorTable.load(path)
+
+        return cls.table is not None
 
     @classmethod
-    def color(cls):
+    def color(cls, rgb: tuple = None):
+
+        rgb = rgb if rgb is not None else cls.read()
 
-        r, g, b = cls.sensor.read('RGB-RAW')
+        if cls.table is not None:
+            return cls.table.classify(rgb)
+
+        r, g, b = rgb
 
         if r - b >= 3 and r - g >= 3:
             return Color.YELLOW
@@ -25,6 +60,12 @@ class SideScan:
             return Color.GREEN
 
     @classmethod
-    def presence(cls):
-        r, g, b = cls.sensor.read('RGB-RAW')
+    def presence(cls, rgb: tuple = None):
+
+        rgb = rgb if rgb is not None else cls.read()
+
+        if cls.table is not None:
+            return cls.table.classify(rgb) is not None
+
+        r, g, b = rgb
         return r + g + b > 15
@@ -5,7 +5,12 @@
 # Pheasant-specific utilities.
 
 
+from .BlockDetector import *
+from .ClawMove import *
+from .ColorTable import *
 from .FrontClaw import *
+from .MissionGraph import *
+from .MissionProfiler import *
 from .RearClaw import *
 from .RunLogic import *
 from .SideScan import *
@@ -13,6 +13,7 @@
 
 
 from pybricks.tools import StopWatch
+from pybricks.tools import wait as pollWait                     # Not recorded or profiled, unlike main's wait().
 from main import *                                              #pylint: disable=wildcard-import, unused-wildcard-import
 
 def preflightChecks():
@@ -58,12 +59,42 @@ def partialRunStartupProcedure():
 def waitForButtonPress():
 
     while not BRICK.buttons.pressed():
-        wait(100)
+        pollWait(100)
 
     while BRICK.buttons.pressed():
-        wait(100)
+        pollWait(100)
 
-    wait(500)
+    pollWait(500)
+
+def dumpFlightLog():
+
+    if USE_FLIGHT_RECORDER and FLIGHT_LOG_PATH is not None:
+        RECORDER.dump(FLIGHT_LOG_PATH)
+        print("Flight log:", RECORDER.count, "samples,", RECORDER.dropped, "dropped")
+
+def dumpLoopProfile():
+
+    if USE_LOOP_PROFILER and LOOP_PROFILE_PATH is not None:
+        PROFILER.dump(LOOP_PROFILE_PATH)
+        print("Loop profile:", len(PROFILER.invocations), "invocations")
+
+def dumpMissionProfile():
+
+    if USE_MISSION_PROFILER:
+        MISSION_PROFILER.finish()
+        print(MISSION_PROFILER.report())
+        for graph in MISSION_GRAPHS:
+            print(graph.name + ":", graph.report())
+        for approachSquare in APPROACH_SQUARES:
+            print("Approach and square:", approachSquare.report())
+        if MISSION_PROFILE_PATH is not None:
+            MISSION_PROFILER.dump(MISSION_PROFILE_PATH)
+
+def stopSensorSampler():
+
+    if USE_SENSOR_SAMPLER:
+        SAMPLER.stop()
+        SAMPLER.report()
 
 #region Function calls
 
@@ -75,26 +106,37 @@ waitForButtonPress()
 
 runTimer = StopWatch()
 
-scanBlocksAtLeftHouse()
-collectYellowSurplusAndLeftEnergy()
-rotateSolarPanels()
-collectYellowRightEnergy()
-collectGreenSurplus()
-collectGreenEnergy()
-scanBlocksAtRightHouse()
-collectBlueSurplus()
-collectBlueEnergy()
-scanBlocksAtTopHouse()
-depositBlocksAtTopHouse()
-depositBlocksAtStorageBattery()
-depositBlocksAtRightHouse()
-depositBlocksAtLeftHouse()
-returnToStartZone()
-
-runTimer.pause()
+# The flight log and profiles are also dumped, and the sensor sampler stopped, if the run is aborted.
+try:
+    scanBlocksAtLeftHouse()
+    collectYellowSurplusAndLeftEnergy()
+    rotateSolarPanels()
+    collectYellowRightEnergy()
+    collectGreenSurplus()
+    collectGreenEnergy()
+    scanBlocksAtRightHouse()
+    collectBlueSurplus()
+    collectBlueEnergy()
+    scanBlocksAtTopHouse()
+    depositBlocksAtTopHouse()
+    depositBlocksAtStorageBattery()
+    depositBlocksAtRightHouse()
+    depositBlocksAtLeftHouse()
+    returnToStartZone()
+
+finally:
+    runTimer.pause()
+    dumpFlightLog()
+    dumpLoopProfile()
+    dumpMissionProfile()
+    stopSensorSampler()
 
 wait(1000)
 
 print("Runtime:", runTimer.time() / 1000)
+print("Motor writes:", ev3move.DoubleMotorBase.motorWrites, "written,",
+      ev3move.DoubleMotorBase.skippedWrites, "skipped")
+if USE_COLOR_MODE_MANAGER:
+    COLOR_MODES.report()
 
 #endregion
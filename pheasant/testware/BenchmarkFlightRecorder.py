@@ -0,0 +1,34 @@
+#!/usr/bin/env pybricks-micropython
+
+# BenchmarkFlightRecorder.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Measures the loop time that ev3pid.FlightRecorder adds per sample, against a budget.
+
+
+import ev3pid
+
+SAMPLES = 2000
+OVERHEAD_BUDGET = 100               # In us per sample; about 5% of a 2 ms control loop.
+
+controller = ev3pid.PIDController(0, 22, 0, 100, None, None)
+controller.update(5)
+
+overhead = ev3pid.FlightRecorder.measureOverhead(controller, SAMPLES)
+print("FlightRecorder.record():", overhead, "us/sample")
+print("Within budget." if overhead <= OVERHEAD_BUDGET else "Over budget of " + str(OVERHEAD_BUDGET) + " us/sample.")
+
+# Checks that recording allocates no heap memory once the recorder is created.
+try:
+    import gc                                                    #pylint: disable=wrong-import-position
+
+    recorder = ev3pid.FlightRecorder(SAMPLES)
+    gc.collect()
+    before = gc.mem_free()
+    for _ in range(SAMPLES):
+        recorder.record(controller, 0, 0)
+    print("Heap used while recording:", before - gc.mem_free(), "bytes")
+
+except AttributeError:              # gc.mem_free() is MicroPython only.
+    pass
@@ -0,0 +1,47 @@
+#!/usr/bin/env pybricks-micropython
+
+# BenchmarkSensorReads.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Compares sensor read rates through pybricks and through the ev3pid sysfs fast path.
+
+
+from pybricks.ev3devices import ColorSensor, GyroSensor
+from pybricks.iodevices import Ev3devSensor
+from pybricks.parameters import Port
+from pybricks.tools import StopWatch
+
+import ev3pid
+
+READS = 2000
+
+def benchmark(name, read):
+
+    # Warms up the sensor mode before timing.
+    read()
+
+    stopWatch = StopWatch()
+    for _ in range(READS):
+        read()
+    elapsed = stopWatch.time()
+
+    print(name, ":", READS * 1000 // max(elapsed, 1), "reads/s,", elapsed * 1000 // READS, "us/read")
+
+# pybricks path
+color = ColorSensor(Port.S2)
+gyro = GyroSensor(Port.S4)
+side = Ev3devSensor(Port.S1)
+
+benchmark("pybricks ColorSensor.reflection()", color.reflection)
+benchmark("pybricks GyroSensor.angle()", gyro.angle)
+benchmark("pybricks Ev3devSensor.read('RGB-RAW')", lambda: side.read('RGB-RAW'))
+
+# Fast path
+fastColor = ev3pid.SysfsColorSensor('ev3-ports:in2')
+fastGyro = ev3pid.SysfsGyroSensor('ev3-ports:in4')
+fastSide = ev3pid.SysfsEv3devSensor('ev3-ports:in1')
+
+benchmark("sysfs SysfsColorSensor.reflection()", fastColor.reflection)
+benchmark("sysfs SysfsGyroSensor.angle()", fastGyro.angle)
+benchmark("sysfs SysfsEv3devSensor.read('RGB-RAW')", lambda: fastSide.read('RGB-RAW'))
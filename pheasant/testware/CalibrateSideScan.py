@@ -0,0 +1,57 @@
+#!/usr/bin/env pybricks-micropython
+
+# CalibrateSideScan.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Records labelled side scanner readings and saves the ColorTable that SideScan loads at start-up.
+
+
+from pybricks.hubs import EV3Brick
+from pybricks.iodevices import Ev3devSensor
+from pybricks.parameters import Port, Button, Color
+from pybricks.tools import wait
+
+import pheasant_utils as utils
+
+TABLE_PATH = "sidescan.bin"         # Same as SIDE_SCAN_TABLE_PATH in main.py.
+SAMPLES = 200                       # Per color.
+SAMPLE_TIME = 10                    # In ms.
+
+BRICK = EV3Brick()
+SENSOR = Ev3devSensor(Port.S1)
+
+def waitForCenterButton():
+
+    while Button.CENTER not in BRICK.buttons.pressed():
+        wait(20)
+
+    while Button.CENTER in BRICK.buttons.pressed():
+        wait(20)
+
+samples = {}
+
+for color, name in ((None, "nothing"), (Color.BLUE, "blue"), (Color.GREEN, "green"), (Color.YELLOW, "yellow")):
+
+    # Move the block across the range of distances from the scanner seen in a run while recording.
+    print("Place", name, "by the side scanner, then press the center button.")
+    waitForCenterButton()
+
+    readings = []
+    for _ in range(SAMPLES):
+        readings.append(SENSOR.read('RGB-RAW'))
+        wait(SAMPLE_TIME)
+    samples[color] = readings
+
+    print("Recorded", SAMPLES, "samples.")
+
+print("Building table...")
+table = utils.ColorTable.build(samples)
+table.save(TABLE_PATH)
+
+# Reports how well the table classifies the samples it was built from.
+for color, readings in samples.items():
+    correct = sum(1 for rgb in readings if table.classify(rgb) == color)
+    print(color, ":", correct, "of", len(readings), "classified correctly")
+
+print("Saved to", TABLE_PATH)
@@ -0,0 +1,90 @@
+# FlightLog.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Loads flight logs written by ev3pid.FlightRecorder.
+
+
+import struct
+
+import numpy
+
+# Matches FlightRecorder.RECORD_FORMAT ('<IHH8f').
+RECORD_DTYPE = numpy.dtype([('time', '<u4'),            # Since the recorder started, in us.
+                            ('segment', '<u2'),
+                            ('dt', '<u2'),              # Passed to the update, in us; 0 for none.
+                            ('setpoint', '<f4'),
+                            ('error', '<f4'),
+                            ('p', '<f4'),
+                            ('i', '<f4'),
+                            ('d', '<f4'),
+                            ('output', '<f4'),
+                            ('left', '<f4'),
+                            ('right', '<f4')])
+
+# Matches FlightRecorder.HEADER_FORMAT.
+HEADER_FORMAT = '<4sHHIIII'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b'PHFR'
+VERSIONS = (1, 2)                   # 1 has no dt.
+
+class FlightLogError(Exception):
+    pass
+
+class FlightLog:
+
+    """
+    A flight log file, with its records memory-mapped (read-only, without copying) as a NumPy structured array of
+    RECORD_DTYPE.
+
+    ## Discussion
+    Segment names are "procedure/controller" when the recorder had a procedure set, and "controller" otherwise.
+    LineSquare records its sides as "LineSquare left" and "LineSquare right"; `controllers` holds the class name
+    alone. Waits recorded by FlightRecorder.wait() are segments of the controller "wait".
+    """
+
+    def __init__(self, path: str):
+
+        self.path = path
+
+        with open(path, 'rb') as file:
+            header = file.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE:
+                raise FlightLogError("Truncated flight log header: " + path)
+
+            magic, version, recordSize, count, dropped, segmentCount, namesLength = struct.unpack(HEADER_FORMAT, header)
+            if magic != MAGIC:
+                raise FlightLogError("Not a flight log: " + path)
+            if version not in VERSIONS or recordSize != RECORD_DTYPE.itemsize:
+                raise FlightLogError("Unsupported flight log version " + str(version) + ": " + path)
+
+            names = file.read(namesLength).decode()
+
+        self.count = count
+        self.dropped = dropped
+
+        self.segmentNames = names.split("\n") if segmentCount else []
+        self.procedures = []
+        self.controllers = []
+        for name in self.segmentNames:
+            procedure, _, controller = name.rpartition("/")
+            self.procedures.append(procedure if procedure else None)
+            self.controllers.append(controller.split(" ")[0])
+
+        offset = HEADER_SIZE + namesLength
+        if count:
+            self.records = numpy.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=offset, shape=(count,))
+        else:
+            self.records = numpy.zeros(0, dtype=RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def segmentName(self, segment: int) -> str:
+        return self.segmentNames[segment] if segment < len(self.segmentNames) else "segment " + str(segment)
+
+    def duration(self) -> float:
+        """Returns the time covered by the log, in s."""
+        if not self.count:
+            return 0.0
+        return (int(self.records['time'][-1]) - int(self.records['time'][0])) / 1000000
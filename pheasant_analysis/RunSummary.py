@@ -0,0 +1,103 @@
+# RunSummary.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Summarises controller metrics over many flight logs, per mission procedure and per controller class.
+
+
+import numpy
+
+from .FlightLog import FlightLog
+from .SegmentMetrics import METRICS_DTYPE, segmentMetrics
+
+class RunSummary:
+
+    """
+    Segment metrics of many flight logs, grouped by mission procedure and by controller class.
+
+    ## Discussion
+    `metrics` holds every segment of every log (see SegmentMetrics.METRICS_DTYPE). `byProcedure()` and
+    `byController()` reduce it with `numpy.bincount` over group indices, without Python loops over segments.
+    """
+
+    GROUP_DTYPE = numpy.dtype([('name', 'U64'),
+                               ('segments', '<i8'),
+                               ('samples', '<i8'),
+                               ('duration', '<f8'),                 # Mean time per log, in s.
+                               ('loopRate', '<f8'),                 # Mean over segments, in Hz.
+                               ('settleTime', '<f8'),               # Mean over segments, in s.
+                               ('overshoot', '<f8'),                # Mean over segments.
+                               ('maxOvershoot', '<f8'),
+                               ('steadyStateError', '<f8'),         # Mean over segments.
+                               ('waitTime', '<f8')])                # Mean time per log, in s.
+
+    def __init__(self, paths: list):
+
+        self.logs = [FlightLog(path) for path in paths]
+        metrics = [segmentMetrics(log, i) for i, log in enumerate(self.logs)]
+        self.metrics = numpy.concatenate(metrics) if metrics else numpy.zeros(0, dtype=METRICS_DTYPE)
+
+    def __group(self, keys: numpy.ndarray) -> numpy.ndarray:
+
+        metrics = self.metrics
+        names, group = numpy.unique(keys, return_inverse=True)
+        logs = max(len(self.logs), 1)
+        isWait = metrics['controller'] == "wait"
+        isControl = ~isWait
+
+        def total(values, mask):
+            return numpy.bincount(group, weights=numpy.where(mask, values, 0), minlength=len(names))
+
+        def mean(values):
+            valid = isControl & ~numpy.isnan(values)
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                return total(values, valid) / numpy.bincount(group, weights=valid, minlength=len(names))
+
+        summary = numpy.zeros(len(names), dtype=RunSummary.GROUP_DTYPE)
+        summary['name'] = names
+        summary['segments'] = numpy.bincount(group, weights=isControl, minlength=len(names))
+        summary['samples'] = total(metrics['samples'], isControl)
+        summary['duration'] = total(metrics['duration'], isControl) / logs
+        summary['loopRate'] = mean(metrics['loopRate'])
+        summary['settleTime'] = mean(metrics['settleTime'])
+        summary['overshoot'] = mean(metrics['overshoot'])
+        summary['steadyStateError'] = mean(metrics['steadyStateError'])
+        summary['waitTime'] = total(metrics['waitTime'], isWait) / logs
+
+        maxOvershoot = numpy.full(len(names), numpy.nan)
+        valid = isControl & ~numpy.isnan(metrics['overshoot'])
+        numpy.fmax.at(maxOvershoot, group[valid], metrics['overshoot'][valid])
+        summary['maxOvershoot'] = maxOvershoot
+
+        return summary
+
+    def byProcedure(self) -> numpy.ndarray:
+        procedures = self.metrics['procedure']
+        return self.__group(numpy.where(procedures == "", "(none)", procedures))
+
+    def byController(self) -> numpy.ndarray:
+        return self.__group(self.metrics['controller'])
+
+    def table(self, groups: numpy.ndarray, title: str) -> str:
+
+        columns = ('segments', 'duration', 'loopRate', 'settleTime', 'overshoot', 'maxOvershoot', 'steadyStateError',
+                   'waitTime')
+        width = max([len(title)] + [len(name) for name in groups['name']])
+
+        lines = [title.ljust(width) + "".join(column.rjust(17) for column in columns)]
+        for row in groups:
+            lines.append(str(row['name']).ljust(width) +
+                         "".join(("%.3f" % row[column] if column != 'segments' else str(row[column])).rjust(17)
+                                 for column in columns))
+
+        return "\n".join(lines)
+
+    def summary(self) -> str:
+
+        samples = sum(len(log) for log in self.logs)
+        dropped = sum(log.dropped for log in self.logs)
+
+        return "\n\n".join(("Logs: " + str(len(self.logs)) + "; samples: " + str(samples) + "; dropped: " +
+                            str(dropped) + ". Durations and wait times are means per log.",
+                            self.table(self.byProcedure(), "procedure"),
+                            self.table(self.byController(), "controller")))
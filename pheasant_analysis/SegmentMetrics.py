@@ -0,0 +1,106 @@
+# SegmentMetrics.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Vectorised per-segment controller metrics for flight logs.
+
+
+import numpy
+
+from .FlightLog import FlightLog
+
+# Error within which each controller counts as settled, in its error units.
+TOLERANCES = {'GyroTurn': 1, 'GyroStraight': 1, 'LineTrack': 5, 'LineSquare': 1, 'scanHouseBlocksProcedure': 1}
+DEFAULT_TOLERANCE = 1
+
+# Fraction of each segment, at its end, over which steady-state error is averaged.
+STEADY_STATE_FRACTION = 0.2
+
+METRICS_DTYPE = numpy.dtype([('log', '<i4'),
+                             ('segment', '<i4'),
+                             ('procedure', 'U64'),
+                             ('controller', 'U32'),
+                             ('samples', '<i8'),
+                             ('start', '<f8'),                      # In s since the recorder started.
+                             ('duration', '<f8'),                   # In s.
+                             ('loopRate', '<f8'),                   # In Hz.
+                             ('settleTime', '<f8'),                 # In s.
+                             ('overshoot', '<f8'),                  # In error units.
+                             ('steadyStateError', '<f8'),           # Mean absolute error, in error units.
+                             ('waitTime', '<f8')])                  # Measured time in wait(), in s.
+
+def segmentMetrics(log: FlightLog, logIndex: int = 0) -> numpy.ndarray:
+
+    """
+    Returns one METRICS_DTYPE row per segment of `log`, in segment order.
+
+    ## Discussion
+    Samples are grouped by segment with a stable sort, so segments that interleave (LineSquare's sides) are separated,
+    and every metric is computed over all segments at once with `reduceat`.
+
+    Settle time is measured from the first sample of the segment to the last sample outside the controller's
+    tolerance. Overshoot is the largest error past the setpoint, on the opposite side from the first sample. For wait
+    segments, only `waitTime` is set.
+    """
+
+    records = log.records
+    if not len(records):
+        return numpy.zeros(0, dtype=METRICS_DTYPE)
+
+    segments = records['segment'].astype(numpy.int64)
+    order = numpy.argsort(segments, kind='stable')
+    segments = segments[order]
+    times = records['time'][order].astype(numpy.float64) / 1000000
+    errors = records['error'][order].astype(numpy.float64)
+    outputs = records['output'][order].astype(numpy.float64)
+
+    # Group boundaries
+    starts = numpy.flatnonzero(numpy.concatenate(([True], segments[1:] != segments[:-1])))
+    counts = numpy.diff(numpy.append(starts, len(segments)))
+    group = numpy.repeat(numpy.arange(len(starts)), counts)
+    ids = segments[starts]
+
+    controllers = numpy.array([log.controllers[i] if i < len(log.controllers) else "" for i in ids], dtype='U32')
+    procedures = numpy.array([log.procedures[i] or "" if i < len(log.procedures) else "" for i in ids], dtype='U64')
+    tolerances = numpy.array([TOLERANCES.get(controller, DEFAULT_TOLERANCE) for controller in controllers])
+    isWait = controllers == "wait"
+
+    firstTimes = times[starts]
+    duration = times[starts + counts - 1] - firstTimes
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        loopRate = numpy.where(duration > 0, (counts - 1) / duration, numpy.nan)
+
+    # Overshoot, relative to the side of the first sample
+    initialSign = numpy.where(errors[starts] >= 0, 1.0, -1.0)
+    overshoot = numpy.maximum(numpy.maximum.reduceat(-initialSign[group] * errors, starts), 0)
+
+    # Settle time: the last sample outside tolerance
+    outside = numpy.abs(errors) > tolerances[group]
+    lastOutside = numpy.maximum.reduceat(numpy.where(outside, times, firstTimes[group]), starts)
+    settleTime = lastOutside - firstTimes
+
+    # Steady-state error: mean absolute error over the end of the segment
+    position = numpy.arange(len(segments)) - starts[group]
+    tail = position >= numpy.floor(counts[group] * (1 - STEADY_STATE_FRACTION))
+    steadyStateError = numpy.add.reduceat(numpy.abs(errors) * tail, starts) / \
+        numpy.maximum(numpy.add.reduceat(tail.astype(numpy.float64), starts), 1)
+
+    # Waits record their measured time (in ms) as the output.
+    waitTime = numpy.where(isWait, numpy.add.reduceat(outputs, starts) / 1000, 0.0)
+
+    metrics = numpy.zeros(len(starts), dtype=METRICS_DTYPE)
+    metrics['log'] = logIndex
+    metrics['segment'] = ids
+    metrics['procedure'] = procedures
+    metrics['controller'] = controllers
+    metrics['samples'] = counts
+    metrics['start'] = firstTimes
+    metrics['duration'] = numpy.where(isWait, waitTime, duration)
+    metrics['loopRate'] = numpy.where(isWait, numpy.nan, loopRate)
+    metrics['settleTime'] = numpy.where(isWait, numpy.nan, settleTime)
+    metrics['overshoot'] = numpy.where(isWait, numpy.nan, overshoot)
+    metrics['steadyStateError'] = numpy.where(isWait, numpy.nan, steadyStateError)
+    metrics['waitTime'] = waitTime
+
+    return metrics
@@ -0,0 +1,10 @@
+# __init__.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Host-side analysis of flight logs recorded on the robot by ev3pid.FlightRecorder. Requires NumPy.
+
+
+from .FlightLog import *
+from .SegmentMetrics import *
+from .RunSummary import *
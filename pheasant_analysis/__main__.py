@@ -0,0 +1,17 @@
+# __main__.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Summarises flight logs: python -m pheasant_analysis flight.bin [...]
+
+
+import argparse
+
+from . import RunSummary
+
+parser = argparse.ArgumentParser(prog="python -m pheasant_analysis",
+                                 description="Summarises flight logs per mission procedure and per controller class.")
+parser.add_argument("logs", nargs='+', help="flight log files written by FlightRecorder.dump()")
+arguments = parser.parse_args()
+
+print(RunSummary(arguments.logs).summary())
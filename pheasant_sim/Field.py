@@ -0,0 +1,268 @@
+# Field.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Rasterised field map for the simulator.
+
+
+from array import array
+from itertools import accumulate
+import math
+
+class FieldColor:
+
+    """
+    Surface colors on the field mat, with the reflected light intensity (in %) that an EV3 color sensor reads on each.
+    """
+
+    WHITE = 0               #HACK: enum workaround, kept as ints so they fit in a bytearray raster.
+    BLACK = 1
+    BLUE = 2
+    GREEN = 3
+    YELLOW = 4
+    RED = 5
+
+    REFLECTIONS = (85, 8, 20, 16, 72, 60)
+
+    # Approximate RGB of each color, for loading mat images.
+    RGBS = ((255, 255, 255), (0, 0, 0), (0, 90, 200), (0, 160, 80), (250, 220, 0), (220, 30, 40))
+
+class Block:
+
+    """
+    An energy block standing on the field, as seen by the side-facing RGB sensor.
+    """
+
+    SIZE = 50               # In mm.
+
+    # Raw RGB readings ('RGB-RAW') of each block color, at scanning distance.
+    RGB_RAW = {FieldColor.BLUE: (8, 14, 40),
+               FieldColor.GREEN: (10, 35, 12),
+               FieldColor.YELLOW: (40, 30, 10)}
+
+    def __init__(self, x: float, y: float, color: int):
+        self.x = x                  # Centre, in mm.
+        self.y = y
+        self.color = color
+
+    def contains(self, x: float, y: float) -> bool:
+        return abs(x - self.x) <= Block.SIZE / 2 and abs(y - self.y) <= Block.SIZE / 2
+
+class FieldMap:
+
+    """
+    A field mat rasterised at `resolution` mm per cell. The origin is at the bottom-left corner of the mat, with x to
+    the right and y upwards.
+
+    ## Discussion
+    Draw the mat with `fillRect()` (or load an image with `fromImage()`), then call `finalize()`. Reflection readings
+    are bilinearly interpolated from a raster blurred over the sensor's light spot, so that line edges give the
+    continuous readings that PID line tracking and squaring depend on.
+    """
+
+    WIDTH = 2362            # WRO mat size, in mm.
+    HEIGHT = 1143
+
+    LINE_WIDTH = 20
+
+    SPOT_RADIUS = 1         # Blur radius of the sensor light spot, in cells.
+
+    DEFAULT = None          # Cached default field.
+    GRID = None             # Cached grid field.
+
+    # House -> block centres on the default field, in scanning order, in mm. Only the left house is scanned by run.py.
+    HOUSE_SLOTS = {'LEFT_HOUSE': ((2262, 800), (2205, 800)),
+                   'TOP_HOUSE': ((1500, 1080), (1560, 1080)),
+                   'RIGHT_HOUSE': ((1100, 1080), (1040, 1080))}
+
+    def __init__(self, width: int = None, height: int = None, resolution: int = 5):
+
+        self.width = width if width is not None else FieldMap.WIDTH
+        self.height = height if height is not None else FieldMap.HEIGHT
+        self.resolution = resolution
+
+        self.columns = int(math.ceil(self.width / resolution))
+        self.rows = int(math.ceil(self.height / resolution))
+
+        self.colors = bytearray(self.columns * self.rows)           # FieldColor.WHITE
+        self.reflections = None
+
+    def fillRect(self, x0: float, y0: float, x1: float, y1: float, color: int):
+
+        c0 = max(0, int(min(x0, x1) / self.resolution))
+        c1 = min(self.columns, int(math.ceil(max(x0, x1) / self.resolution)))
+        r0 = max(0, int(min(y0, y1) / self.resolution))
+        r1 = min(self.rows, int(math.ceil(max(y0, y1) / self.resolution)))
+
+        for row in range(r0, r1):
+            start = row * self.columns
+            self.colors[start + c0:start + c1] = bytes([color]) * (c1 - c0)
+
+    def horizontalLine(self, y: float, x0: float, x1: float, color: int = FieldColor.BLACK):
+        self.fillRect(x0, y - FieldMap.LINE_WIDTH / 2, x1, y + FieldMap.LINE_WIDTH / 2, color)
+
+    def verticalLine(self, x: float, y0: float, y1: float, color: int = FieldColor.BLACK):
+        self.fillRect(x - FieldMap.LINE_WIDTH / 2, y0, x + FieldMap.LINE_WIDTH / 2, y1, color)
+
+    def finalize(self):
+
+        # Box-blurs the reflection raster over the sensor spot, as separate horizontal and vertical passes.
+        columns, rows, radius = self.columns, self.rows, FieldMap.SPOT_RADIUS
+        raw = [FieldColor.REFLECTIONS[color] for color in self.colors]
+
+        def blur(values, count, stride, lines, lineStride):
+            # Moving average along each line, from prefix sums.
+            result = [0.0] * len(values)
+            for line in range(lines):
+                start = line * lineStride
+                prefix = [0]
+                prefix.extend(accumulate(values[start:start + count * stride:stride]))
+                for i in range(count):
+                    low, high = max(0, i - radius), min(count, i + radius + 1)
+                    result[start + i * stride] = (prefix[high] - prefix[low]) / (high - low)
+            return result
+
+        horizontal = blur(raw, columns, 1, rows, columns)
+        self.reflections = array('f', blur(horizontal, rows, columns, columns, 1))
+
+        return self
+
+    def colorAt(self, x: float, y: float) -> int:
+
+        column = min(max(int(x / self.resolution), 0), self.columns - 1)
+        row = min(max(int(y / self.resolution), 0), self.rows - 1)
+
+        return self.colors[row * self.columns + column]
+
+    def reflectionAt(self, x: float, y: float) -> float:
+
+        # Cell centres are at (i + 0.5) * resolution.
+        fx = min(max(x / self.resolution - 0.5, 0), self.columns - 1.001)
+        fy = min(max(y / self.resolution - 0.5, 0), self.rows - 1.001)
+        column, row = int(fx), int(fy)
+        tx, ty = fx - column, fy - row
+
+        i = row * self.columns + column
+        reflections = self.reflections
+        bottom = reflections[i] * (1 - tx) + reflections[i + 1] * tx
+        top = reflections[i + self.columns] * (1 - tx) + reflections[i + self.columns + 1] * tx
+
+        return bottom * (1 - ty) + top * ty
+
+    @classmethod
+    def fromImage(cls, path: str, resolution: int = 5):
+
+        """
+        Loads a field from a binary PPM (P6) image of the mat, scaled to the full mat size. Each pixel is mapped to the
+        nearest FieldColor.
+        """
+
+        with open(path, 'rb') as file:
+            data = file.read()
+
+        # Parses the header: magic, width, height, maximum value; comments are not supported.
+        fields = data.split(None, 4)
+        if fields[0] != b'P6':
+            raise ValueError("Not a binary PPM image: " + path)
+        imageWidth, imageHeight, maxValue = int(fields[1]), int(fields[2]), int(fields[3])
+        pixels = fields[4][-imageWidth * imageHeight * 3:]
+
+        field = cls(resolution=resolution)
+
+        def nearest(rgb):
+            return min(range(len(FieldColor.RGBS)),
+                       key=lambda i: sum((rgb[k] * 255 // maxValue - FieldColor.RGBS[i][k]) ** 2 for k in range(3)))
+
+        cache = {}
+        for row in range(field.rows):
+            # Image rows run top to bottom.
+            imageRow = min(imageHeight - 1, int((field.rows - 1 - row) * imageHeight / field.rows))
+            for column in range(field.columns):
+                imageColumn = min(imageWidth - 1, int(column * imageWidth / field.columns))
+                offset = (imageRow * imageWidth + imageColumn) * 3
+                rgb = bytes(pixels[offset:offset + 3])
+                if rgb not in cache:
+                    cache[rgb] = nearest(rgb)
+                field.colors[row * field.columns + column] = cache[rgb]
+
+        return field.finalize()
+
+    @classmethod
+    def default(cls):
+
+        """
+        Returns the field that run.py is simulated on: a schematic mat with black lines where main.py's procedures
+        look for them, from the start zone at the bottom right. It is not a survey of the WRO 2021 Senior mat; use
+        `fromImage()` with a scan of the mat for accuracy.
+
+        ## Discussion
+        Every line is crossed squarely by both color sensors, or only by the sensor that the procedure watches, so
+        that stops with either sensor trigger where they do on the mat. `HOUSE_SLOTS` are the house block positions on
+        this field.
+        """
+
+        if cls.DEFAULT is not None:
+            return cls.DEFAULT
+
+        field = cls()
+
+        # Coloured zones
+        field.fillRect(1850, 0, 2362, 300, FieldColor.GREEN)               # Start zone
+
+        # Lines, by the procedures that stop on or follow them
+        field.verticalLine(1956, 620, 760)      # scanBlocksAtLeftHouse, collectYellowSurplusAndLeftEnergy
+        field.horizontalLine(377, 1100, 1900)   # rotateSolarPanels, collectYellowRightEnergy (tracked)
+        field.verticalLine(1556, 405, 480)      # rotateSolarPanels, collectYellowRightEnergy (right sensor)
+        field.horizontalLine(800, 1180, 1370)   # collectGreenSurplus, collectBlueSurplus, depositBlocksAtRightHouse
+        field.horizontalLine(822, 1406, 2362)   # collectGreenEnergy (tracked), storage battery, left house
+        field.verticalLine(1906, 650, 795)      # collectGreenEnergy, depositBlocksAtLeftHouse (right sensor)
+        field.verticalLine(1156, 815, 960)      # scanBlocksAtRightHouse, depositBlocksAtRightHouse
+        field.verticalLine(1600, 560, 715)      # scanBlocksAtTopHouse
+
+        cls.DEFAULT = field.finalize()
+
+        return cls.DEFAULT
+
+    @classmethod
+    def defaultBlocks(cls) -> list:
+
+        """
+        Returns a block layout for the default field: two blocks at each house.
+        """
+
+        colors = {'LEFT_HOUSE': (FieldColor.BLUE, FieldColor.GREEN),
+                  'TOP_HOUSE': (FieldColor.YELLOW, FieldColor.BLUE),
+                  'RIGHT_HOUSE': (FieldColor.GREEN, FieldColor.YELLOW)}
+
+        return [Block(x, y, color) for house, slots in cls.HOUSE_SLOTS.items()
+                for (x, y), color in zip(slots, colors[house])]
+
+    @classmethod
+    def grid(cls):
+
+        """
+        Returns a regular grid of black lines with the mat's coloured zones, which the default field was before it
+        followed run.py. Controllers are tuned and tested on it, and Replay's reference traces were recorded on it.
+        """
+
+        if cls.GRID is not None:
+            return cls.GRID
+
+        field = cls()
+
+        # Coloured zones, as on the mat
+        field.fillRect(0, 0, 350, 350, FieldColor.GREEN)                   # Start zone
+        field.fillRect(2012, 0, 2362, 300, FieldColor.GREEN)               # Green energy zone
+        field.fillRect(2012, 843, 2362, 1143, FieldColor.BLUE)             # Blue energy zone
+        field.fillRect(1031, 943, 1331, 1143, FieldColor.YELLOW)           # Storage battery
+
+        # Line grid
+        field.verticalLine(200, 400, 1143)                              # Left house
+        for x in range(400, 2362, 300):
+            field.verticalLine(x, 0, 1143)
+        for y in (200, 500, 800):
+            field.horizontalLine(y, 0, 2362)
+
+        cls.GRID = field.finalize()
+
+        return cls.GRID
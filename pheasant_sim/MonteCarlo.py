@@ -0,0 +1,326 @@
+# MonteCarlo.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Evaluates the mission over many randomised simulated runs, spread across a process pool.
+# Usage: python -m pheasant_sim.MonteCarlo --runs 1000
+
+
+import argparse
+import contextlib
+import importlib
+import io
+import multiprocessing
+import random
+import statistics
+import time
+
+from . import install, runProgram
+from .Field import FieldMap, FieldColor, Block
+from .World import World
+
+class MissionLayout:
+
+    """
+    Block randomisation for one run: the colors of the blocks standing at each house, in scanning order.
+
+    ## Discussion
+    Two houses get two blocks and one house gets a single block, each of a random energy color. `HOUSE_SLOTS` are the
+    default field's block positions, so the left house's blocks are next to the path that scanHouseBlocksProcedure()
+    drives there.
+    """
+
+    HOUSES = ('LEFT_HOUSE', 'TOP_HOUSE', 'RIGHT_HOUSE')
+    COLORS = (FieldColor.BLUE, FieldColor.GREEN, FieldColor.YELLOW)
+
+    # House -> block centres, in scanning order, in mm.
+    HOUSE_SLOTS = FieldMap.HOUSE_SLOTS
+
+    def __init__(self, houses: dict):
+        self.houses = houses                # House name -> list of FieldColor.
+
+    @classmethod
+    def random(cls, generator: random.Random):
+
+        singleHouse = generator.choice(cls.HOUSES)
+        houses = {}
+        for house in cls.HOUSES:
+            count = 1 if house == singleHouse else 2
+            houses[house] = [generator.choice(cls.COLORS) for _ in range(count)]
+
+        return cls(houses)
+
+    def blocks(self) -> list:
+        return [Block(x, y, color) for house, colors in self.houses.items()
+                for (x, y), color in zip(MissionLayout.HOUSE_SLOTS[house], colors)]
+
+class ProcedureTracker:
+
+    """
+    Wraps the functions of the program's main module to record which procedure is running, how long each top-level
+    procedure takes in simulated time, and where the run failed.
+    """
+
+    def __init__(self, world: World):
+
+        self.world = world
+        self.stack = []
+        self.durations = []                 # (procedure, simulated duration in s), for completed top-level calls.
+        self.failure = None                 # Stack of procedure names when the run failed.
+
+    def instrument(self, module):
+
+        for name, value in list(vars(module).items()):
+            if callable(value) and getattr(value, '__module__', None) == module.__name__ and \
+                    not isinstance(value, type):
+                setattr(module, name, self.wrap(name, value))
+
+    def wrap(self, name: str, function):
+
+        def tracked(*args, **kwargs):
+
+            self.stack.append(name)
+            start = self.world.now()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                if self.failure is None:
+                    self.failure = list(self.stack)
+                raise
+            finally:
+                self.stack.pop()
+
+            if not self.stack:
+                self.durations.append((name, self.world.now() - start))
+
+            return result
+
+        return tracked
+
+class MissionResult:
+
+    """
+    The outcome of one simulated run. `failedProcedure` is the top-level procedure that was running when the run
+    failed, and `failedStep` the innermost one.
+    """
+
+    def __init__(self, index: int, seed: int):
+
+        self.index = index
+        self.seed = seed
+
+        self.completed = False
+        self.runtime = None                 # Total simulated duration of the mission procedures, in s.
+        self.error = None                   # Exception type name, if the run failed.
+        self.failedProcedure = None
+        self.failedStep = None
+
+        self.durations = []                 # (procedure, simulated duration in s)
+        self.scanErrors = 0                 # Houses scanned with colors that do not match the layout.
+        self.wallTime = 0.0
+
+def runMission(task: tuple) -> MissionResult:
+
+    """
+    Runs one simulated mission. `task` is (index, seed, options); the seed determines the layout, sensor noise and
+    start pose error. Runs in a worker process.
+    """
+
+    index, seed, options = task
+    generator = random.Random(seed)
+    result = MissionResult(index, seed)
+    wallStart = time.perf_counter()
+
+    layout = MissionLayout.random(generator)
+    startX, startY, startHeading = World.DEFAULT_START
+    positionError, headingError = options['startError']
+    start = (startX + generator.gauss(0, positionError),
+             startY + generator.gauss(0, positionError),
+             startHeading + generator.gauss(0, headingError))
+
+    trackers = []
+
+    def prepare(world):
+        main = importlib.import_module('main')
+        main.FLIGHT_LOG_PATH = None                             # Runs do not write flight logs or profiles.
+        main.LOOP_PROFILE_PATH = None
+        main.MISSION_PROFILE_PATH = None
+        tracker = ProcedureTracker(world)
+        tracker.instrument(main)
+        trackers.append(tracker)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            runProgram(options['script'], prepare=prepare, blocks=layout.blocks(), start=start,
+                       seed=generator.randrange(2 ** 32), noise=options['noise'],
+                       gyroDrift=generator.gauss(0, options['gyroDrift']), timeLimit=options['timeLimit'],
+                       virtual=True, step=options['step'])
+        result.completed = True
+
+    except (Exception, SystemExit) as error:                    #pylint: disable=broad-except
+        result.error = type(error).__name__
+
+    if trackers:
+
+        tracker = trackers[0]
+        result.durations = tracker.durations
+        if tracker.failure is not None:
+            result.failedProcedure = tracker.failure[0]
+            result.failedStep = tracker.failure[-1]
+        elif not result.completed:
+            result.failedProcedure = result.failedStep = "(startup)"
+
+        if result.completed and tracker.durations:
+            result.runtime = sum(duration for _, duration in tracker.durations)
+
+        result.scanErrors = _countScanErrors(layout)
+
+    result.wallTime = time.perf_counter() - wallStart
+
+    return result
+
+def _countScanErrors(layout: MissionLayout) -> int:
+
+    utils = importlib.import_module('pheasant_utils')
+    blockColors = {FieldColor.BLUE: utils.BlockColor.BLUE,
+                   FieldColor.GREEN: utils.BlockColor.GREEN,
+                   FieldColor.YELLOW: utils.BlockColor.YELLOW}
+
+    errors = 0
+    for name, colors in layout.houses.items():
+        scanned = utils.RunLogic.houses.get(getattr(utils.DepositPoint, name), [])
+        if scanned and sorted(scanned, key=str) != sorted((blockColors[color] for color in colors), key=str):
+            errors += 1
+
+    return errors
+
+class MonteCarloReport:
+
+    """
+    Aggregates MissionResults: success rate, runtime distribution, and where and how often runs failed.
+    """
+
+    def __init__(self, results: list):
+
+        self.results = sorted(results, key=lambda result: result.index)
+        self.runs = len(self.results)
+        self.successes = [result for result in self.results if result.completed]
+        self.successRate = len(self.successes) / self.runs if self.runs else 0.0
+
+        self.runtimes = sorted(result.runtime for result in self.successes if result.runtime is not None)
+
+        # Procedure -> number of runs that failed in it
+        self.failures = {}
+        self.failedSteps = {}
+        self.errors = {}
+        for result in self.results:
+            if not result.completed:
+                self.failures[result.failedProcedure] = self.failures.get(result.failedProcedure, 0) + 1
+                step = (result.failedProcedure, result.failedStep)
+                self.failedSteps[step] = self.failedSteps.get(step, 0) + 1
+                self.errors[result.error] = self.errors.get(result.error, 0) + 1
+
+        # Procedure -> simulated durations of completed calls, in s
+        self.durations = {}
+        for result in self.results:
+            for procedure, duration in result.durations:
+                self.durations.setdefault(procedure, []).append(duration)
+
+        self.scanErrors = sum(result.scanErrors for result in self.results)
+
+    def runtimePercentile(self, percentile: float) -> float:
+
+        if not self.runtimes:
+            return None
+
+        position = (len(self.runtimes) - 1) * percentile / 100
+        lower = int(position)
+        upper = min(lower + 1, len(self.runtimes) - 1)
+
+        return self.runtimes[lower] + (self.runtimes[upper] - self.runtimes[lower]) * (position - lower)
+
+    def summary(self) -> str:
+
+        lines = ["Runs: " + str(self.runs) + "; success rate: " + str(round(self.successRate * 100, 1)) + "%"]
+
+        if self.runtimes:
+            lines.append("Runtime (s): mean " + str(round(statistics.mean(self.runtimes), 2)) +
+                         ", p5 " + str(round(self.runtimePercentile(5), 2)) +
+                         ", p50 " + str(round(self.runtimePercentile(50), 2)) +
+                         ", p95 " + str(round(self.runtimePercentile(95), 2)) +
+                         ", max " + str(round(self.runtimes[-1], 2)))
+
+        if self.failures:
+            lines.append("Failures by procedure:")
+            for procedure, count in sorted(self.failures.items(), key=lambda item: -item[1]):
+                lines.append("    " + str(procedure) + ": " + str(count) + " (" +
+                             str(round(count / self.runs * 100, 1)) + "%)")
+                for (failedProcedure, step), stepCount in sorted(self.failedSteps.items(), key=lambda item: -item[1]):
+                    if failedProcedure == procedure and step != procedure:
+                        lines.append("        in " + str(step) + ": " + str(stepCount))
+            lines.append("Errors: " + ", ".join(str(error) + " " + str(count) for error, count in self.errors.items()))
+
+        if self.durations:
+            lines.append("Mean procedure duration (s), over runs that completed it:")
+            for procedure, durations in self.durations.items():
+                lines.append("    " + procedure + ": " + str(round(statistics.mean(durations), 2)) + " (" +
+                             str(len(durations)) + " runs)")
+
+        lines.append("Houses scanned with wrong colors: " + str(self.scanErrors))
+
+        return "\n".join(lines)
+
+def evaluate(runs: int,
+             processes: int = None,
+             seed: int = 0,
+             noise: float = 1,
+             startError: tuple = (5, 1),
+             gyroDrift: float = 0.05,
+             timeLimit: float = 180,
+             step: float = None,
+             script: str = 'run.py') -> MonteCarloReport:
+
+    """
+    Runs `runs` simulated missions over `processes` worker processes (all cores by default), and returns the report.
+
+    ## Discussion
+    Each run's layout, sensor noise and start pose are derived from `seed` and its index, so reports are reproducible
+    regardless of the number of processes. `startError` is the standard deviation of the start position (in mm) and
+    heading (in deg); `gyroDrift` is the standard deviation of the gyro drift rate (in deg/s).
+    """
+
+    options = {'noise': noise, 'startError': startError, 'gyroDrift': gyroDrift, 'timeLimit': timeLimit,
+               'step': step, 'script': script}
+    tasks = [(index, seed * 1000003 + index, options) for index in range(runs)]
+
+    # Each worker reloads the program for every run, so workers can be reused.
+    with multiprocessing.Pool(processes, initializer=_initializeWorker) as pool:
+        results = list(pool.imap_unordered(runMission, tasks, chunksize=max(1, runs // (8 * (processes or 8)))))
+
+    return MonteCarloReport(results)
+
+def _initializeWorker():
+    install()
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(prog="python -m pheasant_sim.MonteCarlo",
+                                     description="Evaluates the mission over randomised simulated runs.")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--noise", type=float, default=1, help="reflection noise standard deviation, in %%")
+    parser.add_argument("--position-error", type=float, default=5, help="start position standard deviation, in mm")
+    parser.add_argument("--heading-error", type=float, default=1, help="start heading standard deviation, in deg")
+    parser.add_argument("--gyro-drift", type=float, default=0.05, help="gyro drift standard deviation, in deg/s")
+    parser.add_argument("--time-limit", type=float, default=180, help="simulated time limit per run, in s")
+    parser.add_argument("--step", type=float, default=None, help="physics step, in s")
+    arguments = parser.parse_args()
+
+    wallStart = time.perf_counter()
+    report = evaluate(arguments.runs, arguments.processes, arguments.seed, arguments.noise,
+                      (arguments.position_error, arguments.heading_error), arguments.gyro_drift, arguments.time_limit,
+                      arguments.step)
+
+    print(report.summary())
+    print("Wall time:", round(time.perf_counter() - wallStart, 1), "s")
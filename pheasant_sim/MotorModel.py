@@ -0,0 +1,166 @@
+# MotorModel.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Dynamics of a simulated EV3 motor.
+
+
+import math
+
+class MotorMode:
+    COAST = hash("COAST")               #HACK: enum workaround.
+    BRAKE = hash("BRAKE")
+    HOLD = hash("HOLD")
+    SPEED = hash("SPEED")
+    TIMED = hash("TIMED")
+    TARGET = hash("TARGET")
+
+class MotorModel:
+
+    """
+    A motor shaft, in physical coordinates (degrees, clockwise positive), driven by the EV3's on-board speed and
+    position control.
+
+    ## Discussion
+    Speed changes are limited by `acceleration`. Positional moves follow a trapezoidal profile, then end according to
+    their `then` action. Commanded speeds below `STICTION` are treated as zero, which stands in for drivetrain
+    friction. Shafts with `travel` limits (claws) stall at their end stops.
+    """
+
+    MAX_SPEED = 1050            # Physical top speed of an EV3 large motor, in deg/s.
+    STICTION = 4                # In deg/s.
+    HOLD_GAIN = 25              # Position hold stiffness, in 1/s.
+    COAST_DECELERATION = 1500   # In deg/s^2.
+
+    def __init__(self, acceleration: float = 8000, travel: tuple = None):
+
+        self.angle = 0.0
+        self.speed = 0.0
+
+        self.speedLimit = MotorModel.MAX_SPEED
+        self.acceleration = acceleration
+        self.travel = travel                # (minimum, maximum) shaft angle, or None.
+
+        self.mode = MotorMode.COAST
+        self.commandSpeed = 0.0
+        self.target = 0.0
+        self.then = MotorMode.COAST
+        self.endTime = 0.0
+        self.holdAngle = 0.0
+
+        self.stalled = False
+        self.commands = 0
+
+    # Commands
+
+    def run(self, speed: float):
+        self.mode = MotorMode.SPEED
+        self.commandSpeed = speed
+        self.commands += 1
+
+    def runTime(self, speed: float, duration: float, now: float, then: int):
+        self.mode = MotorMode.TIMED
+        self.commandSpeed = speed
+        self.endTime = now + duration
+        self.then = then
+        self.commands += 1
+
+    def runTarget(self, speed: float, target: float, then: int):
+        self.mode = MotorMode.TARGET
+        self.commandSpeed = abs(speed)
+        self.target = target
+        self.then = then
+        self.commands += 1
+
+    def hold(self):
+        self.mode = MotorMode.HOLD
+        self.holdAngle = self.angle
+        self.commands += 1
+
+    def stop(self, mode: int = MotorMode.COAST):
+        self.mode = mode
+        self.commands += 1
+
+    def done(self) -> bool:
+        return self.mode in (MotorMode.COAST, MotorMode.BRAKE, MotorMode.HOLD)
+
+    # Simulation
+
+    def __finish(self, holdAngle: float):
+
+        self.mode = self.then
+        self.holdAngle = holdAngle
+
+    def step(self, dt: float, now: float):
+
+        mode = self.mode
+
+        # Fast path for shafts at rest.
+        if self.speed == 0:
+            if mode == MotorMode.COAST or mode == MotorMode.BRAKE:
+                return
+            if mode == MotorMode.HOLD and abs(self.holdAngle - self.angle) < 0.5:
+                return
+
+        acceleration = self.acceleration
+        limit = self.speedLimit if self.speedLimit < MotorModel.MAX_SPEED else MotorModel.MAX_SPEED
+
+        if mode == MotorMode.TIMED and now >= self.endTime:
+            self.__finish(self.angle)
+            mode = self.mode
+
+        if mode == MotorMode.SPEED or mode == MotorMode.TIMED:
+            desired = self.commandSpeed
+
+        elif mode == MotorMode.TARGET:
+            remaining = self.target - self.angle
+            if abs(remaining) < 0.5 and abs(self.speed) < acceleration * dt:
+                self.angle = self.target
+                self.speed = 0.0
+                self.__finish(self.target)
+                return
+            desired = math.copysign(min(self.commandSpeed, math.sqrt(2 * acceleration * abs(remaining))), remaining)
+
+        elif mode == MotorMode.HOLD:
+            desired = (self.holdAngle - self.angle) * MotorModel.HOLD_GAIN
+
+        elif mode == MotorMode.BRAKE:
+            desired = 0.0
+
+        else:
+            desired = 0.0
+            acceleration = MotorModel.COAST_DECELERATION
+
+        if desired > limit:
+            desired = limit
+        elif desired < -limit:
+            desired = -limit
+
+        # Static friction
+        if abs(desired) < MotorModel.STICTION and mode != MotorMode.HOLD:
+            desired = 0.0
+            if self.speed == 0:
+                return
+
+        # Acceleration limit
+        change = desired - self.speed
+        maximumChange = acceleration * dt
+        if change > maximumChange:
+            change = maximumChange
+        elif change < -maximumChange:
+            change = -maximumChange
+        self.speed += change
+
+        if mode == MotorMode.HOLD and abs(self.speed) < MotorModel.STICTION and \
+            abs(self.holdAngle - self.angle) < 0.5:
+            self.speed = 0.0
+
+        self.angle += self.speed * dt
+
+        # End stops
+        self.stalled = False
+        if self.travel is not None:
+            if self.angle < self.travel[0]:
+                self.angle, self.speed, self.stalled = self.travel[0], 0.0, True
+            elif self.angle > self.travel[1]:
+                self.angle, self.speed, self.stalled = self.travel[1], 0.0, True
@@ -0,0 +1,147 @@
+# PIDBank.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Vectorised bank of PID controllers, for evaluating many gain sets at once off the brick. Requires NumPy.
+
+
+import importlib
+
+import numpy
+
+from . import install
+
+class PIDBank:
+
+    """
+    N PID controllers with independent gains and limits, stepped together by one vectorised `update()`.
+
+    ## Discussion
+    Follows ev3pid's PIDController.update() exactly: the same terms, evaluated in the same order and clamped in the
+    same way, so that each controller's outputs are identical, bit for bit, to a scalar PIDController given the same
+    errors. Gains and limits are broadcast to N; a limit of None (or an element of inf) means no limit, as in
+    PIDController.
+
+    Errors, integral multipliers and dts may be scalars, shared by all controllers, or arrays of N. Measured dts scale
+    the integral and differential terms relative to `nominalPeriod`, which defaults to PIDController.NOMINAL_PERIOD;
+    while that is None, dts are ignored and each update is a fixed step, as in PIDController.
+    """
+
+    def __init__(self,
+                 kp,
+                 ki,
+                 kd,
+                 integralLimit=None,
+                 outputLimit=None,
+                 size: int = None,
+                 nominalPeriod: float = None):
+
+        kp, ki, kd = (numpy.asarray(gain, dtype=numpy.float64) for gain in (kp, ki, kd))
+        size = size if size is not None else max(kp.size, ki.size, kd.size)
+
+        self.kp = numpy.broadcast_to(kp, (size,)).copy()
+        self.ki = numpy.broadcast_to(ki, (size,)).copy()
+        self.kd = numpy.broadcast_to(kd, (size,)).copy()
+        self.integralLimit = PIDBank.__limit(integralLimit, size)
+        self.outputLimit = PIDBank.__limit(outputLimit, size)
+
+        if nominalPeriod is None:
+            install()
+            nominalPeriod = importlib.import_module('ev3pid').PIDController.NOMINAL_PERIOD
+        self.nominalPeriod = nominalPeriod
+
+        # PID loop terms
+        self.integral = numpy.zeros(size)
+        self.prevError = numpy.zeros(size)
+
+        # Work arrays, reused by update().
+        self.__term = numpy.empty(size)
+        self.__output = numpy.empty(size)
+
+    @staticmethod
+    def __limit(limit, size: int):
+
+        if limit is None:
+            return numpy.full(size, numpy.inf)
+
+        limit = numpy.asarray([numpy.inf if value is None else value for value in numpy.ravel(limit)]
+                              if numpy.ndim(limit) else limit, dtype=numpy.float64)
+
+        return numpy.broadcast_to(limit, (size,)).copy()
+
+    @classmethod
+    def fromControllers(cls, controllers: list):
+
+        """
+        Returns a bank with the gains, limits and current state of the given PIDControllers.
+        """
+
+        bank = cls([controller.kp for controller in controllers],
+                   [controller.ki for controller in controllers],
+                   [controller.kd for controller in controllers],
+                   [controller.integralLimit for controller in controllers],
+                   [controller.outputLimit for controller in controllers],
+                   nominalPeriod=controllers[0].__class__.NOMINAL_PERIOD if controllers else None)
+        bank.integral[:] = [controller.integral for controller in controllers]
+        bank.prevError[:] = [controller.prevError for controller in controllers]
+
+        return bank
+
+    def __len__(self) -> int:
+        return self.kp.size
+
+    def update(self, error, integralMultiplier=1, dt=None) -> numpy.ndarray:
+
+        """
+        Steps all controllers and returns their outputs. The returned array is reused by the next call; copy it to
+        keep it.
+        """
+
+        error = numpy.asarray(error, dtype=numpy.float64)
+        integral, term, output = self.integral, self.__term, self.__output
+
+        # Proportional term
+        numpy.multiply(error, self.kp, out=output)
+
+        # Integral term
+        numpy.multiply(integral, integralMultiplier, out=integral)
+        if dt is None or self.nominalPeriod is None:
+            numpy.add(integral, error, out=integral)
+        else:
+            numpy.add(integral, error * (numpy.asarray(dt, dtype=numpy.float64) / self.nominalPeriod), out=integral)
+        numpy.minimum(integral, self.integralLimit, out=integral)
+        numpy.maximum(integral, -self.integralLimit, out=integral)
+        numpy.add(output, numpy.multiply(integral, self.ki, out=term), out=output)
+
+        # Differential term
+        numpy.subtract(error, self.prevError, out=term)
+        numpy.multiply(term, self.kd, out=term)
+        if dt is not None and self.nominalPeriod is not None:
+            dt = numpy.asarray(dt, dtype=numpy.float64)
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                term = numpy.where(dt > 0, term * (self.nominalPeriod / dt), 0.0)
+        numpy.add(output, term, out=output)
+
+        self.prevError[:] = error
+
+        numpy.minimum(output, self.outputLimit, out=output)
+        numpy.maximum(output, -self.outputLimit, out=output)
+
+        return output
+
+    def reset(self):
+        self.integral[:] = 0
+        self.prevError[:] = 0
+
+    def replay(self, errors, integralMultiplier=1, dts=None) -> numpy.ndarray:
+
+        """
+        Steps all controllers through a trace of T errors (each a scalar or an array of N), and returns the T x N
+        outputs. `dts`, if given, holds the measured dt of each step, in ms.
+        """
+
+        outputs = numpy.empty((len(errors), len(self)))
+        for i, error in enumerate(errors):
+            outputs[i] = self.update(error, integralMultiplier, dts[i] if dts is not None else None)
+
+        return outputs
@@ -0,0 +1,533 @@
+# Replay.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Replays recorded controller runs through the ev3pid controllers off the brick, for regression-testing controller
+# changes. Requires NumPy.
+# Usage: python -m pheasant_sim.Replay flight.bin [...]
+
+
+import argparse
+import importlib
+import os
+import time
+
+import numpy
+
+from . import install
+from .Field import FieldMap
+from .World import World
+
+from pheasant_analysis import FlightLog
+
+class ReplayDevice:
+
+    """
+    Stands in for a sensor or motor during a replay. Sensor readings come from the trace, through ReplaySnapshot;
+    motors keep their last commanded speed, which they report as their speed.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.command = 0
+
+    def run(self, speed: float):
+        self.command = speed
+
+    def hold(self):
+        self.command = 0
+
+    def brake(self):
+        self.command = 0
+
+    def stop(self):
+        self.command = 0
+
+    def speed(self) -> float:
+        return self.command
+
+    def angle(self) -> int:
+        return 0
+
+# Devices given to replayed controllers, by name.
+DEVICES = ('gyro', 'leftColor', 'rightColor', 'leftMotor', 'rightMotor')
+
+class ControllerTrace:
+
+    """
+    One run of an ev3pid controller loop, read from a flight log: per iteration, the sensor reading of each channel, the
+    measured dt, and the logged outputs and motor commands.
+
+    ## Discussion
+    Controllers log `error = reading - setpoint`, so readings are recovered exactly from the setpoint and error. Each of
+    LineSquare's runs is the pair of segments "LineSquare left" and "LineSquare right", as channels 0 and 1; the other
+    controllers have one channel.
+
+    LineApproach runs are replayed as their GyroStraight loop, which ends where the logged loop did; the latched
+    correction back to the line is a motor move, not a control loop, and is not replayed. ApproachSquare runs are
+    skipped (see `SKIPPED`): the slew-limited handoff from the approach to squaring is not recorded, so they cannot be
+    rebuilt from the log. `skippedRuns()` counts them.
+
+    The iteration on which a loop exits is not logged, as it makes no update. The logged exit is therefore the
+    iteration after the last logged one.
+    """
+
+    CONTROLLERS = ('GyroStraight', 'LineApproach', 'GyroTurn', 'LineTrack', 'LineSquare')
+    SKIPPED = ('ApproachSquare',)
+
+    # Channels by controller, as the devices that they are read from.
+    CHANNELS = {'GyroStraight': ('gyro',),
+                'LineApproach': ('gyro',),
+                'GyroTurn': ('gyro',),
+                'LineTrack': ('leftColor',),
+                'LineSquare': ('leftColor', 'rightColor')}
+
+    def __init__(self, name: str, controller: str, procedure: str, records: list):
+
+        self.name = name
+        self.controller = controller
+        self.procedure = procedure
+
+        self.times = records[0]['time'].tolist()                    # Since the recorder started, in us.
+        self.dts = records[0]['dt'].tolist()                        # In us; 0 for none.
+        self.setpoints = [channel['setpoint'].tolist() for channel in records]
+        self.errors = [channel['error'].tolist() for channel in records]
+        self.outputs = [channel['output'] for channel in records]   # float32, as logged.
+        self.left = records[0]['left']
+        self.right = records[0]['right']
+
+        # Readings are whole numbers, as from the sensors.
+        self.readings = [[int(reading) if reading.is_integer() else reading
+                          for reading in map(float.__add__, setpoints, errors)]
+                         for setpoints, errors in zip(self.setpoints, self.errors)]
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @classmethod
+    def fromLog(cls, log: FlightLog) -> list:
+
+        """
+        Returns the traces of every ev3pid controller run in `log`, in the order that they were run.
+        """
+
+        records = log.records
+        if not len(records):
+            return []
+
+        segments = records['segment']
+        order = numpy.argsort(segments, kind='stable')
+        ids, starts, counts = numpy.unique(segments[order], return_index=True, return_counts=True)
+        bySegment = {segment: records[order[start:start + count]]
+                     for segment, start, count in zip(ids.tolist(), starts.tolist(), counts.tolist())}
+
+        traces = []
+        for segment in sorted(bySegment):
+
+            controller = log.controllers[segment] if segment < len(log.controllers) else None
+            if controller not in cls.CONTROLLERS:
+                continue
+
+            name = log.segmentNames[segment]
+            if controller == 'LineSquare':
+                if not name.endswith(" left") or segment + 1 not in bySegment:
+                    continue
+                channels = [bySegment[segment], bySegment[segment + 1]]
+                name = name[:-len(" left")]
+            else:
+                channels = [bySegment[segment]]
+
+            traces.append(cls(name, controller, log.procedures[segment], channels))
+
+        return traces
+
+    @classmethod
+    def skippedRuns(cls, log: FlightLog) -> dict:
+
+        """
+        Returns the number of runs in `log` of each controller in SKIPPED, which `fromLog()` leaves out.
+        """
+
+        counts = {}
+        present = set(numpy.unique(log.records['segment']).tolist()) if len(log.records) else set()
+        for segment, (controller, name) in enumerate(zip(log.controllers, log.segmentNames)):
+            if controller in cls.SKIPPED and segment in present and name.endswith(" approach"):
+                counts[controller] = counts.get(controller, 0) + 1
+
+        return counts
+
+    def tickTimes(self) -> list:
+
+        """
+        Returns the time of each iteration's tick, in us, including the exit iteration. Ticks are spaced by the logged
+        dts, so that a LoopScheduler measures them again exactly; where no dt was logged, by the logged sample times.
+        """
+
+        saturated = importlib.import_module('ev3pid').FlightRecorder.DT_MAX
+
+        ticks = [0]
+        for i in range(1, len(self) + 1):
+            if i < len(self) and 0 < self.dts[i] < saturated:
+                ticks.append(ticks[-1] + self.dts[i])
+            elif i < len(self):
+                ticks.append(ticks[-1] + max(self.times[i] - self.times[i - 1], 1))
+            else:
+                ticks.append(ticks[-1] + max(self.dts[-1], 1))
+
+        return ticks
+
+    def loopRate(self) -> float:
+
+        """
+        Returns a loop rate that makes replayed loops pass dts to their controllers, as the logged loops did, or None if
+        they ran free.
+        """
+
+        dts = [dt for dt in self.dts if dt]
+        return 1000000 * len(dts) / sum(dts) if dts else None
+
+    def build(self, devices: dict, **options):
+
+        """
+        Returns a controller for replaying this trace, reading from `devices`. Parameters that the log does not record
+        (gains and limits) default to the controller's class defaults, and can be given in `options`; the others are
+        inferred from the trace.
+        """
+
+        ev3pid = importlib.import_module('ev3pid')
+        options.setdefault('loopRate', self.loopRate())
+
+        setpoint = self.setpoints[0][0]
+        setpoint = int(setpoint) if setpoint.is_integer() else setpoint
+
+        # Base speed of GyroStraight and LineTrack, which add and subtract their output; whole numbers are restored
+        # from the float32 commands.
+        speed = (float(self.left[0]) + float(self.right[0])) / 2
+        speed = round(speed) if abs(speed - round(speed)) < 1e-3 else speed
+
+        # Direction of the output in the left motor command, from the first iteration with a nonzero output.
+        direction = 1
+        for output, left in zip(self.outputs[0].tolist(), self.left.tolist()):
+            if output:
+                direction = 1 if (left - (speed if self.controller == 'LineTrack' else 0)) / output > 0 else -1
+                break
+
+        if self.controller == 'GyroTurn':
+            return ev3pid.GyroTurn(setpoint, bool(numpy.any(self.left)), bool(numpy.any(self.right)), devices['gyro'],
+                                   devices['leftMotor'], devices['rightMotor'], **options)
+
+        if self.controller in ('GyroStraight', 'LineApproach'):
+            return ev3pid.GyroStraight(speed, setpoint, devices['gyro'],
+                                       devices['leftMotor'], devices['rightMotor'], **options)
+
+        if self.controller == 'LineTrack':
+            return ev3pid.LineTrack(speed, ev3pid.LineEdge.LEFT if direction > 0 else ev3pid.LineEdge.RIGHT,
+                                    devices['leftColor'], setpoint, devices['leftMotor'], devices['rightMotor'],
+                                    **options)
+
+        rightSetpoint = self.setpoints[1][0]
+        return ev3pid.LineSquare(ev3pid.LinePosition.AHEAD if direction > 0 else ev3pid.LinePosition.BEHIND,
+                                 devices['leftColor'], devices['rightColor'], setpoint,
+                                 int(rightSetpoint) if rightSetpoint.is_integer() else rightSetpoint,
+                                 devices['leftMotor'], devices['rightMotor'], **options)
+
+    def run(self, controller, snapshot, **runOptions):
+
+        if self.controller in ('GyroStraight', 'LineApproach', 'LineTrack'):
+            controller.runUntil(snapshot.exhausted)
+        elif self.controller == 'GyroTurn':
+            controller.run(**runOptions)
+        else:
+            controller.run()
+
+class ReplayResult:
+
+    """
+    The outcome of replaying a trace: the iterations that the replayed loop ran for, and its outputs and motor
+    commands, compared with those logged.
+
+    ## Discussion
+    Outputs are compared after rounding to float32, as logged. `deviation` is the largest difference of any output or
+    motor command over the iterations that both runs made; `firstDifference` is the first iteration that differs, or
+    None.
+    """
+
+    def __init__(self, trace: ControllerTrace, samples: list, elapsed: float):
+
+        self.trace = trace
+        self.elapsed = elapsed                                      # Wall time, in s.
+
+        self.iterations = len(samples[0]) if samples else 0
+        self.loggedIterations = len(trace)
+
+        common = min(self.iterations, self.loggedIterations)
+        differences = []
+        for channel, channelSamples in enumerate(samples[:len(trace.outputs)]):
+            replayed = numpy.array(channelSamples[:common], dtype=numpy.float32).reshape(-1, 3)
+            differences.append(numpy.abs(replayed[:, 0] - trace.outputs[channel][:common]))
+            if channel == 0:
+                differences.append(numpy.abs(replayed[:, 1] - trace.left[:common]))
+                differences.append(numpy.abs(replayed[:, 2] - trace.right[:common]))
+
+        difference = numpy.max(differences, axis=0) if differences and common else numpy.zeros(0)
+        self.deviation = float(difference.max()) if len(difference) else 0.0
+        mismatched = numpy.flatnonzero(difference)
+        self.firstDifference = int(mismatched[0]) if len(mismatched) else None
+
+    @property
+    def identical(self) -> bool:
+        return self.iterations == self.loggedIterations and self.firstDifference is None
+
+    @property
+    def exitsNoLater(self) -> bool:
+        return self.iterations <= self.loggedIterations
+
+    def summary(self) -> str:
+
+        return self.trace.name + ": " + \
+            ("identical" if self.identical else
+             "deviation " + str(round(self.deviation, 3)) +
+             (" from iteration " + str(self.firstDifference) if self.firstDifference is not None else "")) + \
+            "; iterations " + str(self.iterations) + " (logged " + str(self.loggedIterations) + ")"
+
+def _snapshotClass():
+
+    SensorSnapshot = importlib.import_module('ev3pid').SensorSnapshot
+
+    class ReplaySnapshot(SensorSnapshot):
+
+        """
+        Serves a trace's readings to a replayed controller, one iteration per `next()`, and keeps the replay clock.
+
+        ## Discussion
+        Once the trace is exhausted, sensors read their setpoints and motors read as stopped, so that loops that exit
+        on their sensors do so on the logged exit iteration. Within the trace, motor speeds are not logged, and read as
+        the last command written.
+        """
+
+        def __init__(self, trace: ControllerTrace, devices: dict):
+
+            super().__init__()
+
+            channels = [devices[name] for name in ControllerTrace.CHANNELS[trace.controller]]
+            self.length = len(trace)
+            self.channels = {id(device): readings for device, readings in zip(channels, trace.readings)}
+            self.exitReadings = {id(device): int(setpoints[-1]) if setpoints[-1].is_integer() else setpoints[-1]
+                                 for device, setpoints in zip(channels, trace.setpoints)}
+            self.ticks = trace.tickTimes()
+
+        def exhausted(self) -> bool:
+            return self.tick > self.length
+
+        def now(self) -> int:
+            return self.ticks[min(self.tick, self.length)]
+
+        def angle(self, sensor) -> int:
+
+            self.reads += 1
+            if self.tick > self.length:
+                return self.exitReadings[id(sensor)]
+
+            return self.channels[id(sensor)][self.tick - 1]
+
+        reflection = angle
+
+        def speed(self, motor) -> int:
+            self.reads += 1
+            return motor.speed() if self.tick <= self.length else 0
+
+        def motorAngle(self, motor) -> int:
+            self.reads += 1
+            return motor.angle()
+
+    return ReplaySnapshot
+
+def _recorderClass():
+
+    FlightRecorder = importlib.import_module('ev3pid').FlightRecorder
+
+    class ReplayRecorder(FlightRecorder):
+
+        """
+        Collects the samples of a replayed run as (output, left command, right command), per segment.
+        """
+
+        def __init__(self):
+            super().__init__(0)
+            self.samples = []
+
+        def begin(self, name: str, reuse: bool = False) -> int:
+            self.samples.append([])
+            self.segment = len(self.samples) - 1
+            return self.segment
+
+        def record(self, controller, leftCommand: float, rightCommand: float):
+            self.samples[self.segment].append((controller.output, leftCommand, rightCommand))
+
+    return ReplayRecorder
+
+# Clock attributes replaced by Clock.setSource().
+_CLOCK_ATTRIBUTES = ('now', 'sleep', 'add', 'diff')
+
+def replay(trace: ControllerTrace, gains: dict = None, build=None, **runOptions) -> ReplayResult:
+
+    """
+    Replays `trace` through a controller, and returns the comparison with the logged run.
+
+    ## Discussion
+    The controller is made by `build(trace, devices)` if given, or by `trace.build()` with `gains`, and runs its own
+    loop (`run()` or `runUntil()`; `runOptions` go to GyroTurn.run()) on replay devices, with the ev3pid clock
+    following the logged ticks. The replay is open-loop: readings follow the trace whatever the controller commands,
+    so it checks that a change computes the same outputs and exits no later on the same readings, not how the robot
+    would respond.
+
+    Replays use the current virtual-time world (making one if needed), for the pybricks waits in the controllers.
+    """
+
+    install()
+    ev3pid = importlib.import_module('ev3pid')
+    Clock, FlightRecorder = ev3pid.Clock, ev3pid.FlightRecorder
+
+    if World.CURRENT is None or not World.CURRENT.virtual:
+        World.create(field=FieldMap(200, 200).finalize(), virtual=True)
+
+    devices = {name: ReplayDevice(name) for name in DEVICES}
+    controller = build(trace, devices) if build is not None else trace.build(devices, **(gains or {}))
+    snapshot = _snapshotClass()(trace, devices)
+    controller.snapshot = snapshot
+
+    clock = {name: Clock.__dict__[name] for name in _CLOCK_ATTRIBUTES}
+    previousRecorder = FlightRecorder.ACTIVE
+    start = time.perf_counter()
+
+    try:
+        Clock.setSource(snapshot.now, lambda us: None)
+        recorder = _recorderClass()()
+        recorder.activate()
+        trace.run(controller, snapshot, **runOptions)
+    finally:
+        FlightRecorder.ACTIVE = previousRecorder
+        for name, value in clock.items():
+            setattr(Clock, name, value)
+
+    return ReplayResult(trace, recorder.samples, time.perf_counter() - start)
+
+def replayLog(path: str, gains: dict = None, **runOptions) -> list:
+
+    """
+    Replays every controller run in the flight log at `path`, and returns their ReplayResults. `gains`, if given, maps
+    controller class names to gains for `ControllerTrace.build()`.
+    """
+
+    return [replay(trace, (gains or {}).get(trace.controller), **runOptions)
+            for trace in ControllerTrace.fromLog(FlightLog(path))]
+
+# Reference runs for pheasant_tests, recorded against the simulated robot with the gains set in main.py (Tuner's
+# baselines). Procedure name -> (tuning target, loop rate).
+REFERENCE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pheasant_tests', 'traces',
+                              'reference.bin')
+REFERENCE_RUNS = {'turnDouble': ('GyroTurnDouble', 200),
+                  'turnSingle': ('GyroTurnSingle', None),
+                  'straight': ('GyroStraight', 200),
+                  'track': ('LineTrack', None),
+                  'square': ('LineSquare', 200)}
+
+def referenceGains(procedure: str) -> dict:
+
+    """
+    Returns the gains and loop rate with which a reference run was recorded.
+    """
+
+    Tuner = importlib.import_module('pheasant_sim.Tuner')
+    target, loopRate = REFERENCE_RUNS[procedure]
+
+    return dict(Tuner.TARGETS[target].baseline, loopRate=loopRate)
+
+def recordReferenceTraces(path: str = REFERENCE_PATH):
+
+    """
+    Records the reference runs to a flight log at `path`. Re-record them only when a change to the controllers'
+    behaviour is intended.
+    """
+
+    Tuner = importlib.import_module('pheasant_sim.Tuner')
+    ev3pid = importlib.import_module('ev3pid')
+
+    recorder = ev3pid.FlightRecorder(16384)
+    previousRecorder = ev3pid.FlightRecorder.ACTIVE
+    recorder.activate()
+
+    def start(procedure: str, **plantOptions):
+
+        # Each run has its own world and clock.
+        plant = Tuner.SimulatedPlant(**plantOptions)
+        recorder.procedure = procedure
+        recorder.start = ev3pid.Clock.now()
+
+        return plant, referenceGains(procedure)
+
+    try:
+        _, gains = start('turnDouble', start=(1180, 570, 90))
+        ev3pid.GyroTurn(90, True, True, **gains).run()
+
+        _, gains = start('turnSingle', start=(1180, 570, 90))
+        ev3pid.GyroTurn(-30, False, True, **gains).run()
+
+        plant, gains = start('straight', start=(400, 570, 0))
+        ev3pid.GyroStraight(600, 5, **gains).runUntil(lambda: plant.now() > 1)
+
+        plant, gains = start('track', field=Tuner._lineField(), start=(400, 505, 0))   #pylint: disable=protected-access
+        ev3pid.LineTrack(300, ev3pid.LineEdge.LEFT, plant.leftColor, threshold=47, **gains) \
+            .runUntil(lambda: plant.now() > 0.4)
+
+        _, gains = start('square', field=Tuner._lineField(), start=(1000, 370, 98))    #pylint: disable=protected-access
+        ev3pid.LineSquare(ev3pid.LinePosition.AHEAD, leftThreshold=47, rightThreshold=42, **gains).run()
+
+    finally:
+        ev3pid.FlightRecorder.ACTIVE = previousRecorder
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    recorder.dump(path)
+
+def _useMainTuning():
+
+    """
+    Sets the ev3pid class defaults to main.py's, by importing it against a simulated robot.
+    """
+
+    World.create(virtual=True)
+    importlib.import_module('main')
+    importlib.import_module('ev3pid').FlightRecorder.deactivate()
+    importlib.import_module('pheasant_utils').MissionProfiler.deactivate()
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(prog="python -m pheasant_sim.Replay",
+                                     description="Replays the controller runs in flight logs through the current "
+                                                 "ev3pid controllers, with main.py's tuning.")
+    parser.add_argument("logs", nargs='*', help="flight log files written by FlightRecorder.dump()")
+    parser.add_argument("--precisely", action='store_true', help="replay GyroTurn runs with run(precisely=True)")
+    parser.add_argument("--record-reference", action='store_true',
+                        help="re-record the reference traces for pheasant_tests")
+    arguments = parser.parse_args()
+
+    install()
+
+    if arguments.record_reference:
+        recordReferenceTraces()
+        print("Recorded", len(ControllerTrace.fromLog(FlightLog(REFERENCE_PATH))), "reference traces to",
+              REFERENCE_PATH)
+
+    if arguments.logs:
+        _useMainTuning()
+
+    for log in arguments.logs:
+        results = replayLog(log, precisely=arguments.precisely)
+        for controller, count in sorted(ControllerTrace.skippedRuns(FlightLog(log)).items()):
+            print(log + ":", "skipped", count, controller, "runs")
+        print(log + ":", sum(result.identical for result in results), "of", len(results), "runs identical;",
+              sum(not result.exitsNoLater for result in results), "exit later;",
+              round(sum(result.elapsed for result in results), 3), "s")
+        for result in results:
+            if not result.identical:
+                print("   ", result.summary())
@@ -0,0 +1,439 @@
+# Tuner.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Searches PID gains for the ev3pid controllers against the simulated robot, in parallel.
+# Usage: python -m pheasant_sim.Tuner [target ...] --candidates 64
+
+
+import argparse
+import importlib
+import math
+import multiprocessing
+import random
+import sys
+import time
+
+from . import install, useWorldClock
+from .Field import FieldMap
+from .World import World, SimulationTimeout
+
+class SimulatedPlant:
+
+    """
+    The robot with main.py's hardware configuration, in a fresh virtual-time world (on the grid field by default),
+    without the mission. Records the errors passed to the PID controllers under test.
+    """
+
+    def __init__(self, field: FieldMap = None, start: tuple = None, timeLimit: float = 8):
+
+        field = field if field is not None else FieldMap.grid()
+        self.world = World.create(field=field, start=start, timeLimit=timeLimit, virtual=True)
+
+        ev3devices = importlib.import_module('pybricks.ev3devices')
+        parameters = importlib.import_module('pybricks.parameters')
+        ev3pid = importlib.import_module('ev3pid')
+        useWorldClock(self.world)
+
+        self.leftMotor = ev3devices.Motor(parameters.Port.B, positive_direction=parameters.Direction.COUNTERCLOCKWISE)
+        self.rightMotor = ev3devices.Motor(parameters.Port.C, positive_direction=parameters.Direction.CLOCKWISE)
+        self.gyro = ev3devices.GyroSensor(parameters.Port.S4, parameters.Direction.COUNTERCLOCKWISE)
+        self.leftColor = ev3devices.ColorSensor(parameters.Port.S2)
+        self.rightColor = ev3devices.ColorSensor(parameters.Port.S3)
+
+        ev3pid.DoubleMotorBase.setDefaultMotors(self.leftMotor, self.rightMotor)
+        ev3pid.GyroInput.setDefaultSensor(self.gyro)
+        ev3pid.DoubleColorInput.setDefaultSensors(self.leftColor, self.rightColor)
+        self.gyro.reset_angle(0)
+
+        self.errors = []                    # (simulated time in s, error)
+
+    def record(self, controller):
+
+        """
+        Records every error passed to `controller.update()`.
+        """
+
+        update = controller.update
+        errors = self.errors
+        world = self.world
+
+        def recordingUpdate(error, *args, **kwargs):
+            errors.append((world.now(), error))
+            return update(error, *args, **kwargs)
+
+        controller.update = recordingUpdate
+
+    def now(self) -> float:
+        return self.world.now()
+
+class TrialResult:
+
+    """
+    Settling behaviour of one closed-loop trial. `overshoot` is the largest error past the setpoint, on the opposite
+    side from where the trial started; `settleTime` is the time (in s) after which the error stays within tolerance.
+    """
+
+    def __init__(self, settleTime: float, overshoot: float, failed: bool = False):
+        self.settleTime = settleTime
+        self.overshoot = overshoot
+        self.failed = failed
+
+    @classmethod
+    def fromErrors(cls, errors: list, start: float, tolerance: float, end: float = None):
+
+        if not errors:
+            return cls(end - start if end is not None else 0, 0)
+
+        initialSign = 1 if errors[0][1] >= 0 else -1
+        overshoot = max(0, max(-initialSign * error for _, error in errors))
+
+        settled = start
+        for sampleTime, error in errors:
+            if abs(error) > tolerance:
+                settled = sampleTime
+        if end is not None:
+            settled = end
+
+        return cls(settled - start, overshoot)
+
+# Trials, by controller. Each takes the candidate gains and returns a list of TrialResults.
+
+def _gyroTurnTrials(gains: dict, leftDriven: bool) -> list:
+
+    ev3pid = importlib.import_module('ev3pid')
+    results = []
+
+    for angle in (90, -90, 180):
+        plant = SimulatedPlant(start=(1180, 570, 90))
+        turn = ev3pid.GyroTurn(angle, leftDriven, True, **gains)
+        plant.record(turn)
+        start = plant.now()
+        try:
+            turn.run(precisely=True)
+        except SimulationTimeout:
+            results.append(TrialResult(plant.world.timeLimit, 0, True))
+            continue
+        results.append(TrialResult.fromErrors(plant.errors, start, 0, plant.now()))
+
+    return results
+
+def _gyroStraightTrials(gains: dict) -> list:
+
+    ev3pid = importlib.import_module('ev3pid')
+    results = []
+
+    for angle in (5, -5):
+        plant = SimulatedPlant(start=(400, 570, 0))
+        straight = ev3pid.GyroStraight(600, angle, **gains)
+        plant.record(straight)
+        start = plant.now()
+        straight.runUntil(lambda: plant.now() - start > 1.5)
+        results.append(TrialResult.fromErrors(plant.errors, start, 1))
+
+    return results
+
+def _lineTrackTrials(gains: dict) -> list:
+
+    ev3pid = importlib.import_module('ev3pid')
+    results = []
+
+    # The sensor starts on white, and on the line.
+    for offset in (15, -5):
+        plant = SimulatedPlant(field=_lineField(), start=(400, _LINE_Y + FieldMap.LINE_WIDTH / 2 + offset - 25, 0))
+        track = ev3pid.LineTrack(300, ev3pid.LineEdge.LEFT, plant.leftColor, threshold=_LEFT_THRESHOLD, **gains)
+        plant.record(track)
+        start = plant.now()
+        track.runUntil(lambda: plant.now() - start > 2)
+        results.append(TrialResult.fromErrors(plant.errors, start, 5))
+
+    return results
+
+def _lineSquareTrials(gains: dict) -> list:
+
+    ev3pid = importlib.import_module('ev3pid')
+    results = []
+
+    for tilt in (8, -8):
+        plant = SimulatedPlant(field=_lineField(), start=(1000, _LINE_Y - 130, 90 + tilt))
+        square = ev3pid.LineSquare(ev3pid.LinePosition.AHEAD, leftThreshold=_LEFT_THRESHOLD,
+                                   rightThreshold=_RIGHT_THRESHOLD, **gains)
+        plant.record(square.leftPid)
+        plant.record(square.rightPid)
+        start = plant.now()
+        try:
+            square.run()
+        except SimulationTimeout:
+            results.append(TrialResult(plant.world.timeLimit, 0, True))
+            continue
+        results.append(TrialResult.fromErrors(plant.errors, start, 1, plant.now()))
+
+    return results
+
+# Thresholds from main.py
+_LEFT_THRESHOLD = 47
+_RIGHT_THRESHOLD = 42
+
+_LINE_Y = 500
+_LINE_FIELD = None
+
+def _lineField() -> FieldMap:
+
+    global _LINE_FIELD                                          #pylint: disable=global-statement
+
+    if _LINE_FIELD is None:
+        field = FieldMap(2000, 1000)
+        field.horizontalLine(_LINE_Y, 0, 2000)
+        _LINE_FIELD = field.finalize()
+
+    return _LINE_FIELD
+
+class TuningTarget:
+
+    """
+    A controller configuration to tune: its search space, the gains currently set in main.py, and its trials.
+
+    ## Discussion
+    `defaults` maps each gain to the ev3pid class default that holds it, as (class name, attribute). `baseline` reads
+    them once main.py's tuning is applied (see `mainTuning()`), so main.py is the only place the gains are written.
+
+    `space` maps each gain to its (low, high) search range; ranges with a positive low end are searched on a log
+    scale. `overshootWeight` converts overshoot (in the controller's error units) to seconds of settle time in the
+    cost.
+    """
+
+    def __init__(self, name: str, defaults: dict, space: dict, trials, overshootWeight: float):
+        self.name = name
+        self.defaults = defaults
+        self.space = space
+        self.trials = trials
+        self.overshootWeight = overshootWeight
+
+    @property
+    def baseline(self) -> dict:
+        return dict(mainTuning()[self.name])
+
+    def cost(self, results: list) -> float:
+        return sum(result.settleTime * (3 if result.failed else 1) + self.overshootWeight * result.overshoot
+                   for result in results) / len(results)
+
+    def sample(self, generator: random.Random) -> dict:
+
+        gains = {}
+        for gain, (low, high) in self.space.items():
+            if low > 0:
+                gains[gain] = math.exp(generator.uniform(math.log(low), math.log(high)))
+            else:
+                gains[gain] = generator.uniform(low, high)
+
+        return gains
+
+    def perturb(self, gains: dict, generator: random.Random, scale: float) -> dict:
+
+        perturbed = {}
+        for gain, (low, high) in self.space.items():
+            value = gains[gain] * math.exp(generator.gauss(0, scale)) if gains[gain] > 0 else \
+                generator.uniform(low, low + (high - low) * scale)
+            perturbed[gain] = min(max(value, low), high)
+
+        return perturbed
+
+def _defaults(controller: str, suffix: str = "") -> dict:
+
+    """
+    Returns the class defaults holding a controller's gains, with `suffix` (e.g. "_SINGLE") before "_DEFAULT".
+    """
+
+    return {gain: (controller, attribute + suffix + "_DEFAULT")
+            for gain, attribute in (('kp', 'kp'), ('ki', 'ki'), ('kd', 'kd'), ('integralLimit', 'INTEGRAL_LIMIT'),
+                                    ('outputLimit', 'OUTPUT_LIMIT'))}
+
+TARGETS = {
+    'GyroTurnDouble': TuningTarget('GyroTurnDouble', _defaults('GyroTurn', "_DOUBLE"),
+                                   {'kp': (3, 60), 'ki': (0, 4), 'kd': (20, 1000), 'integralLimit': (2, 60),
+                                    'outputLimit': (150, 900)},
+                                   lambda gains: _gyroTurnTrials(gains, True), 0.05),
+    'GyroTurnSingle': TuningTarget('GyroTurnSingle', _defaults('GyroTurn', "_SINGLE"),
+                                   {'kp': (5, 80), 'ki': (0, 4), 'kd': (40, 1600), 'integralLimit': (2, 80),
+                                    'outputLimit': (200, 1000)},
+                                   lambda gains: _gyroTurnTrials(gains, False), 0.05),
+    'GyroStraight': TuningTarget('GyroStraight', _defaults('GyroStraight'),
+                                 {'kp': (5, 80), 'ki': (0, 1), 'kd': (10, 600)},
+                                 _gyroStraightTrials, 0.05),
+    'LineTrack': TuningTarget('LineTrack', _defaults('LineTrack'),
+                              {'kp': (0.3, 6), 'ki': (0, 0.01), 'kd': (20, 800)},
+                              _lineTrackTrials, 0.01),
+    'LineSquare': TuningTarget('LineSquare', _defaults('LineSquare'),
+                               {'kp': (0.5, 12), 'ki': (0, 0.2), 'kd': (3, 200), 'integralLimit': (10, 300),
+                                'outputLimit': (30, 200)},
+                               _lineSquareTrials, 0.01),
+}
+
+_MAIN_TUNING = None
+
+def mainTuning() -> dict:
+
+    """
+    Returns target name -> the gains set in main.py.
+
+    ## Discussion
+    main.py is imported afresh, once per process, against a simulated robot in a world of its own, and each target's
+    class defaults are read straight after, so that tests or tuning runs that change the defaults later do not
+    change the baselines. The world, flight recorder and profilers active before, and the PID loop period and rate,
+    are restored afterwards.
+    """
+
+    global _MAIN_TUNING                                         #pylint: disable=global-statement
+
+    if _MAIN_TUNING is None:
+
+        install()
+        ev3pid = importlib.import_module('ev3pid')
+        profilers = (ev3pid.FlightRecorder, ev3pid.LoopProfiler,
+                     importlib.import_module('pheasant_utils').MissionProfiler)
+        previous = [World.CURRENT] + [profiler.ACTIVE for profiler in profilers]
+        loopSettings = ev3pid.PIDController.NOMINAL_PERIOD, ev3pid.PIDController.LOOP_RATE_DEFAULT
+        World.create(virtual=True)
+
+        try:
+            sys.modules.pop('main', None)
+            importlib.import_module('main')
+            _MAIN_TUNING = {name: {gain: getattr(getattr(ev3pid, controller), attribute)
+                                   for gain, (controller, attribute) in target.defaults.items()}
+                            for name, target in TARGETS.items()}
+        finally:
+            World.CURRENT = previous[0]
+            for profiler, active in zip(profilers, previous[1:]):
+                profiler.ACTIVE = active
+            ev3pid.PIDController.NOMINAL_PERIOD, ev3pid.PIDController.LOOP_RATE_DEFAULT = loopSettings
+
+    return _MAIN_TUNING
+
+def evaluateCandidate(task: tuple) -> tuple:
+
+    """
+    Runs a target's trials with one set of gains. `task` is (target name, gains); returns (cost, gains, results).
+    Runs in a worker process.
+    """
+
+    name, gains = task
+    target = TARGETS[name]
+    results = target.trials({gain: value for gain, value in gains.items() if value is not None})
+
+    return target.cost(results), gains, results
+
+class TuningResult:
+
+    def __init__(self, name: str, cost: float, gains: dict, baselineCost: float, evaluated: int):
+        self.name = name
+        self.cost = cost                    # Mean cost of the trials, in s.
+        self.gains = gains                  # Gain -> value, including fixed gains from the baseline.
+        self.baselineCost = baselineCost
+        self.evaluated = evaluated          # Number of candidates evaluated.
+
+def tune(names: list, candidates: int = 64, processes: int = None, seed: int = 0, refinements: int = 2) -> dict:
+
+    """
+    Searches gains for each named target, and returns target name -> TuningResult.
+
+    ## Discussion
+    Each target is searched by random sampling over its space, followed by `refinements` rounds of perturbation
+    around the best candidates so far. All candidates of a round are evaluated in parallel. The baseline is always a
+    candidate, so the result is never worse than the current tuning on the simulated trials.
+    """
+
+    generator = random.Random(seed)
+    results = {}
+
+    with multiprocessing.Pool(processes, initializer=install) as pool:
+
+        for name in names:
+
+            target = TARGETS[name]
+            baselineGains = {gain: target.baseline[gain] for gain in target.space}
+            tasks = [(name, baselineGains)] + [(name, target.sample(generator)) for _ in range(candidates - 1)]
+            evaluated = pool.map(evaluateCandidate, tasks)
+
+            for refinement in range(refinements):
+                best = sorted(evaluated, key=lambda item: item[0])[:4]
+                scale = 0.3 / (refinement + 1)
+                tasks = [(name, target.perturb(gains, generator, scale)) for _, gains, _ in best
+                         for _ in range(max(1, candidates // 8))]
+                evaluated += pool.map(evaluateCandidate, tasks)
+
+            cost, gains, _ = min(evaluated, key=lambda item: item[0])
+            results[name] = TuningResult(name, cost, dict(target.baseline, **gains), evaluated[0][0], len(evaluated))
+
+    return results
+
+def _format(value) -> str:
+
+    if value is None:
+        return "None"
+
+    value = float("%.3g" % value)
+
+    return str(int(value)) if value == int(value) and abs(value) >= 1 else repr(value)
+
+def formatCalls(results: dict) -> str:
+
+    """
+    Returns ready-to-paste main.py lines setting the tuned gains, from target name -> TuningResult. GyroTurn takes
+    single and double motor gains together, so an untuned half keeps its baseline.
+    """
+
+    lines = []
+
+    if 'GyroTurnSingle' in results or 'GyroTurnDouble' in results:
+
+        single = results['GyroTurnSingle'].gains if 'GyroTurnSingle' in results else \
+            TARGETS['GyroTurnSingle'].baseline
+        double = results['GyroTurnDouble'].gains if 'GyroTurnDouble' in results else \
+            TARGETS['GyroTurnDouble'].baseline
+
+        lines.append("ev3pid.GyroTurn.setDefaultTuning(kpSingle=" + _format(single['kp']) + ", kiSingle=" +
+                     _format(single['ki']) + ", kdSingle=" + _format(single['kd']) + ",")
+        lines.append("                                 kpDouble=" + _format(double['kp']) + ", kiDouble=" +
+                     _format(double['ki']) + ", kdDouble=" + _format(double['kd']) + ")")
+        lines.append("ev3pid.GyroTurn.setDefaultOutputLimit(limitSingle=" + _format(single['outputLimit']) +
+                     ", limitDouble=" + _format(double['outputLimit']) + ")")
+        lines.append("ev3pid.GyroTurn.setDefaultIntegralLimit(limitSingle=" + _format(single['integralLimit']) +
+                     ", limitDouble=" + _format(double['integralLimit']) + ")")
+
+    for name in ('GyroStraight', 'LineSquare', 'LineTrack'):
+
+        if name not in results:
+            continue
+
+        gains = results[name].gains
+        lines.append("ev3pid." + name + ".setDefaultTuning(" + _format(gains['kp']) + ", " + _format(gains['ki']) +
+                     ", " + _format(gains['kd']) + ")")
+        if gains['outputLimit'] is not None:
+            lines.append("ev3pid." + name + ".setDefaultOutputLimit(" + _format(gains['outputLimit']) + ")")
+        if gains['integralLimit'] is not None:
+            lines.append("ev3pid." + name + ".setDefaultIntegralLimit(" + _format(gains['integralLimit']) + ")")
+
+    return "\n".join(lines)
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(prog="python -m pheasant_sim.Tuner",
+                                     description="Searches PID gains against the simulated robot.")
+    parser.add_argument("targets", nargs='*', default=list(TARGETS), help="targets (default: all): " +
+                        ", ".join(TARGETS))
+    parser.add_argument("--candidates", type=int, default=64, help="random candidates per target")
+    parser.add_argument("--refinements", type=int, default=2, help="rounds of refinement around the best candidates")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    wallStart = time.perf_counter()
+    tuned = tune(arguments.targets, arguments.candidates, arguments.processes, arguments.seed, arguments.refinements)
+
+    for result in tuned.values():
+        print(result.name + ": cost " + str(round(result.cost, 3)) + " s (baseline " +
+              str(round(result.baselineCost, 3)) + " s), over " + str(result.evaluated) + " candidates")
+    print()
+    print(formatCalls(tuned))
+    print()
+    print("Wall time:", round(time.perf_counter() - wallStart, 1), "s")
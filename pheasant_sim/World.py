@@ -0,0 +1,267 @@
+# World.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Simulated robot and field, shared by the simulated pybricks devices.
+
+
+import math
+import random
+import time
+
+from .Field import FieldMap, Block
+from .MotorModel import MotorModel
+
+class SimulationTimeout(Exception):
+    pass
+
+class World:
+
+    """
+    The simulated robot on the field: a differential drive with two wheel motors, two claw motors, a gyro, two
+    downward-facing color sensors, and a side-facing RGB sensor.
+
+    ## Discussion
+    Physics is stepped in fixed steps of `step` seconds (`STEP` by default); coarser steps run faster but resolve
+    line edges less finely. The world is advanced lazily whenever a simulated device is used. In real time, it is
+    advanced to the current wall time, so programs run as fast as on the brick. In virtual time (`virtual=True`), each
+    device call advances the world by `DEVICE_CALL_TIME` and `wait()` advances it by the waited time without sleeping,
+    so programs run as fast as the host can step the physics while timers still report simulated time.
+
+    The simulated pybricks devices use `World.current()`. Use `World.create()` to start a new world before running a
+    program. Exceeding `timeLimit` seconds of simulated time raises SimulationTimeout from the device call, which stops
+    programs that wait forever for a line that is never found. Time then stops, so that clean-up code (e.g. `finally`
+    blocks) still runs.
+
+    Without a field, the world is the default field with its house blocks, and the robot starts in its start zone, so
+    that run.py can run there in full.
+
+    Ports follow main.py: wheels on B (left) and C (right), claws on A (front) and D (rear), side scanner on S1, color
+    sensors on S2 (left) and S3 (right), gyro on S4.
+    """
+
+    CURRENT = None
+
+    STEP = 0.001                        # In s.
+    DEVICE_CALL_TIME = 0.0005           # Simulated duration of one sensor read or motor command in virtual time, in s.
+
+    # Robot geometry, in mm
+    WHEEL_DIAMETER = 56
+    TRACK_WIDTH = 120
+    MILLIMETRES_PER_DEGREE = math.pi * WHEEL_DIAMETER / 360     # Of wheel rotation.
+    RADIUS = 90                         # Distance kept from the walls.
+
+    # Drive motors: port -> (side, shaft direction that drives the robot forwards).
+    WHEELS = {'B': ('left', -1), 'C': ('right', 1)}
+
+    # Claw motors: port -> (minimum, maximum) shaft angle. Shafts start at their upper end stop.
+    CLAWS = {'A': (-960, 5), 'D': (-5, 320)}
+
+    # Sensor mounts: port -> (forwards, leftwards) offset from the centre of the wheelbase, in mm.
+    SENSORS = {'S1': (0, -70), 'S2': (90, 25), 'S3': (90, -25)}
+    SIDE_SCAN_RANGE = 40                # Distance seen by the side scanner, in mm.
+    SIDE_SCAN_BACKGROUND = (3, 3, 3)    # 'RGB-RAW' reading with nothing in range.
+
+    DEFAULT_START = (2000, 180, 90)     # x, y (in mm) and heading (in deg, anticlockwise from the x axis).
+
+    def __init__(self,
+                 field: FieldMap = None,
+                 blocks: list = None,
+                 start: tuple = None,
+                 seed: int = None,
+                 noise: float = 0,
+                 gyroDrift: float = 0,
+                 timeLimit: float = 300,
+                 virtual: bool = False,
+                 step: float = None):
+
+        self.field = field if field is not None else FieldMap.default()
+        self.blocks = blocks if blocks is not None else (FieldMap.defaultBlocks() if field is None else [])
+
+        # Robot pose
+        x, y, heading = start if start is not None else World.DEFAULT_START
+        self.x = x
+        self.y = y
+        self.heading = math.radians(heading)
+        self.headingRate = 0.0
+
+        # Sensor noise
+        self.random = random.Random(seed)
+        self.noise = noise                  # Standard deviation of reflection readings, in %.
+        self.gyroDrift = gyroDrift          # In deg/s.
+        self.gyroBias = 0.0
+
+        # Time
+        self.time = 0.0                     # Simulated time stepped so far, in s.
+        self.pending = 0.0                  # Simulated time elapsed but shorter than a step, in s.
+        self.timeLimit = timeLimit
+        self.virtual = virtual
+        self.timedOut = False
+        self.stepSize = step if step is not None else World.STEP
+        self.wallStart = time.perf_counter()
+
+        # Brick
+        self.batteryVoltage = 8300
+        self.buttonPresses = [["CENTER"]]   # Successive results of EV3Brick.buttons.pressed(), by button name.
+
+        self.motors = {}
+        self.motorModels = []
+        self.wheelModels = []               # (model, shaft direction that drives forwards, is left wheel)
+
+    @classmethod
+    def create(cls, **kwargs):
+        cls.CURRENT = cls(**kwargs)
+        return cls.CURRENT
+
+    @classmethod
+    def current(cls):
+
+        if cls.CURRENT is None:
+            cls.create()
+
+        return cls.CURRENT
+
+    # Time
+
+    def sync(self):
+
+        if self.virtual:
+            self.advance(World.DEVICE_CALL_TIME)
+        else:
+            self.advance(time.perf_counter() - self.wallStart - self.now())
+
+    def advance(self, duration: float):
+
+        # Time stops once the limit is exceeded, so that the program's clean-up code can run.
+        if self.timedOut:
+            return
+
+        self.pending += duration
+        stepSize = self.stepSize
+        steps = int(self.pending / stepSize)
+        self.pending -= steps * stepSize
+
+        step = self.step
+        for _ in range(steps):
+            step(stepSize)
+
+        if self.time > self.timeLimit:
+            self.timedOut = True
+            raise SimulationTimeout("Simulated time limit of " + str(self.timeLimit) + " s exceeded.")
+
+    def sleep(self, milliseconds: float):
+
+        if self.virtual:
+            self.advance(max(milliseconds, 0) / 1000)
+        else:
+            time.sleep(max(milliseconds, 0) / 1000)
+            self.sync()
+
+    def now(self) -> float:
+        """Returns the simulated time, in s."""
+        return self.time + self.pending
+
+    # Physics
+
+    def motor(self, port: str) -> MotorModel:
+
+        if port not in self.motors:
+            model = MotorModel(travel=World.CLAWS.get(port))
+            self.motors[port] = model
+            self.motorModels.append(model)
+            if port in World.WHEELS:
+                side, forwards = World.WHEELS[port]
+                self.wheelModels.append((model, forwards, side == 'left'))
+
+        return self.motors[port]
+
+    def step(self, dt: float):
+
+        now = self.time
+        for motor in self.motorModels:
+            motor.step(dt, now)
+
+        # Wheel surface speeds, in mm/s.
+        left = right = 0.0
+        for motor, forwards, isLeft in self.wheelModels:
+            if isLeft:
+                left = motor.speed * forwards * World.MILLIMETRES_PER_DEGREE
+            else:
+                right = motor.speed * forwards * World.MILLIMETRES_PER_DEGREE
+
+        if left or right or self.headingRate:
+
+            speed = (left + right) / 2
+            self.headingRate = (right - left) / World.TRACK_WIDTH
+
+            self.heading += self.headingRate * dt
+            self.x += speed * math.cos(self.heading) * dt
+            self.y += speed * math.sin(self.heading) * dt
+
+            self.__collideWithWalls(dt)
+
+        self.gyroBias += self.gyroDrift * dt
+        self.time = now + dt
+
+    def __collideWithWalls(self, dt: float):
+
+        radius = World.RADIUS
+        x, y = self.x, self.y
+
+        if radius <= x <= self.field.width - radius and radius <= y <= self.field.height - radius:
+            return
+
+        self.x = min(max(x, radius), self.field.width - radius)
+        self.y = min(max(y, radius), self.field.height - radius)
+
+        # Pushing against a wall squares the robot up to it.
+        square = round(self.heading / (math.pi / 2)) * (math.pi / 2)
+        self.heading += (square - self.heading) * min(1, 10 * dt)
+
+    # Sensors
+
+    def sensorPosition(self, port: str) -> tuple:
+
+        forwards, leftwards = World.SENSORS[port]
+        cos, sin = math.cos(self.heading), math.sin(self.heading)
+
+        return (self.x + forwards * cos - leftwards * sin, self.y + forwards * sin + leftwards * cos)
+
+    def reflection(self, port: str) -> int:
+
+        x, y = self.sensorPosition(port)
+        value = self.field.reflectionAt(x, y)
+        if self.noise > 0:
+            value += self.random.gauss(0, self.noise)
+
+        return int(round(min(max(value, 0), 100)))
+
+    def surfaceColor(self, port: str) -> int:
+        x, y = self.sensorPosition(port)
+        return self.field.colorAt(x, y)
+
+    def rgbRaw(self, port: str) -> tuple:
+
+        x, y = self.sensorPosition(port)
+
+        # Looks to the right of the robot.
+        lookX = x + World.SIDE_SCAN_RANGE * math.sin(self.heading)
+        lookY = y - World.SIDE_SCAN_RANGE * math.cos(self.heading)
+
+        rgb = World.SIDE_SCAN_BACKGROUND
+        for block in self.blocks:
+            if block.contains(lookX, lookY):
+                rgb = Block.RGB_RAW[block.color]
+                break
+
+        if self.noise > 0:
+            rgb = tuple(max(0, int(round(value + self.random.gauss(0, self.noise / 4)))) for value in rgb)
+
+        return rgb
+
+    def gyroAngle(self) -> float:
+        """Returns the robot heading, in degrees, anticlockwise positive."""
+        return math.degrees(self.heading) + self.gyroBias
+
+    def gyroRate(self) -> float:
+        return math.degrees(self.headingRate) + self.gyroDrift
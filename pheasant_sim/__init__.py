@@ -0,0 +1,78 @@
+# __init__.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Headless simulator for running Team Pheasant programs off the brick. Provides a simulated pybricks package, backed by
+# a differential-drive robot model on a rasterised field.
+
+
+import importlib
+import os
+import runpy
+import sys
+
+from .World import *
+from .Field import *
+from .MotorModel import *
+
+PACKAGE_PATH = os.path.dirname(os.path.abspath(__file__))
+STUBS_PATH = os.path.join(PACKAGE_PATH, 'stubs')
+PROGRAM_PATH = os.path.join(os.path.dirname(PACKAGE_PATH), 'pheasant')
+
+# Modules of the robot program, which hold run state at module and class level.
+PROGRAM_MODULES = ('main', 'ev3move', 'ev3pid', 'pheasant_utils')
+
+def install():
+
+    """
+    Makes the simulated pybricks package and the robot program importable, as they are on the brick.
+    """
+
+    for path in (PROGRAM_PATH, STUBS_PATH):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+def unloadProgram():
+
+    """
+    Removes the robot program's modules, so that the next import starts from fresh run state.
+    """
+
+    for name in list(sys.modules):
+        if name.split('.')[0] in PROGRAM_MODULES:
+            del sys.modules[name]
+
+def runProgram(script: str = 'run.py', prepare=None, **worldOptions) -> World:
+
+    """
+    Runs a program from the pheasant directory (run.py by default) in a new simulated world, and returns the world.
+    Keyword arguments are passed to World(); pass `virtual=True` to run faster than real time.
+
+    ## Discussion
+    `prepare`, if given, is called with the world after it is created and before the program starts, e.g. to import
+    and instrument the program's modules.
+    """
+
+    install()
+    unloadProgram()
+
+    world = World.create(**worldOptions)
+    if world.virtual:
+        useWorldClock(world)
+
+    if prepare is not None:
+        prepare(world)
+
+    runpy.run_path(os.path.join(PROGRAM_PATH, script), run_name='__main__')
+
+    return world
+
+def useWorldClock(world: World):
+
+    """
+    Drives the ev3pid control loop clock from the world's simulated time, for virtual-time runs. The program's ev3pid
+    is imported here and reused by the program.
+    """
+
+    clock = importlib.import_module('ev3pid').Clock
+    clock.setSource(lambda: int(world.now() * 1000000), lambda microseconds: world.sleep(microseconds / 1000))
@@ -0,0 +1,35 @@
+# __main__.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Runs a robot program in the simulator: python -m pheasant_sim [script]
+
+
+import argparse
+import sys
+import time
+
+from . import runProgram, World, SimulationTimeout
+
+parser = argparse.ArgumentParser(prog="python -m pheasant_sim", description="Runs a robot program in the simulator.")
+parser.add_argument("script", nargs='?', default='run.py', help="program in the pheasant directory (default: run.py)")
+parser.add_argument("--seed", type=int, default=None, help="random seed for sensor noise")
+parser.add_argument("--noise", type=float, default=0, help="reflection noise standard deviation, in %%")
+parser.add_argument("--virtual", action='store_true', help="run in virtual time, faster than real time")
+parser.add_argument("--step", type=float, default=None, help="physics step, in s (default: 0.001)")
+parser.add_argument("--time-limit", type=float, default=300, help="simulated time limit, in s")
+arguments = parser.parse_args()
+
+exitCode = 0
+wallStart = time.perf_counter()
+try:
+    runProgram(arguments.script, seed=arguments.seed, noise=arguments.noise, timeLimit=arguments.time_limit,
+               virtual=arguments.virtual, step=arguments.step)
+except SimulationTimeout as error:
+    print(error)
+    exitCode = 1
+
+print("Simulated time:", round(World.current().now(), 3), "s; wall time:", round(time.perf_counter() - wallStart, 3),
+      "s")
+
+sys.exit(exitCode)
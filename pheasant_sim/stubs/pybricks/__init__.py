@@ -0,0 +1,6 @@
+# __init__.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Simulated pybricks package. Implements the parts of the Pybricks EV3 API used by Team Pheasant, backed by
+# pheasant_sim.World.
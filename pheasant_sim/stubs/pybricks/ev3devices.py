@@ -0,0 +1,177 @@
+# ev3devices.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Simulated pybricks.ev3devices.
+
+
+from pheasant_sim.World import World
+from pheasant_sim.Field import FieldColor
+from pheasant_sim.MotorModel import MotorMode
+
+from .parameters import Direction, Stop, Color
+
+_STOP_MODES = {Stop.COAST: MotorMode.COAST, Stop.BRAKE: MotorMode.BRAKE, Stop.HOLD: MotorMode.HOLD}
+
+class Control:
+
+    def __init__(self, motor):
+        self.motor = motor
+
+    def limits(self, speed=None, acceleration=None, actuation=None):
+
+        model = self.motor.model
+
+        if speed is None and acceleration is None and actuation is None:
+            return (model.speedLimit, model.acceleration, 100)
+
+        if speed is not None:
+            model.speedLimit = speed
+        if acceleration is not None:
+            model.acceleration = acceleration
+
+    def pid(self, *args, **kwargs):
+        pass
+
+    def done(self) -> bool:
+        self.motor.world.sync()
+        return self.motor.model.done()
+
+    def stalled(self) -> bool:
+        self.motor.world.sync()
+        return self.motor.model.stalled
+
+class Motor:
+
+    def __init__(self, port, positive_direction=Direction.CLOCKWISE, gears=None):
+
+        self.world = World.current()
+        self.port = port
+        self.model = self.world.motor(port.name)
+        self.sign = 1 if positive_direction == Direction.CLOCKWISE else -1
+        self.offset = 0.0
+
+        self.control = Control(self)
+
+    def __wait(self):
+        while not self.model.done():
+            self.world.sleep(1)
+
+    # Measurements
+
+    def angle(self) -> int:
+        self.world.sync()
+        return int(round(self.model.angle * self.sign + self.offset))
+
+    def speed(self) -> int:
+        self.world.sync()
+        return int(round(self.model.speed * self.sign))
+
+    def reset_angle(self, angle=None):
+        self.world.sync()
+        if angle is None:
+            self.offset = -self.model.angle * self.sign + round(self.model.angle * self.sign) % 360
+        else:
+            self.offset = angle - self.model.angle * self.sign
+
+    # Actions
+
+    def stop(self):
+        self.world.sync()
+        self.model.stop(MotorMode.COAST)
+
+    def brake(self):
+        self.world.sync()
+        self.model.stop(MotorMode.BRAKE)
+
+    def hold(self):
+        self.world.sync()
+        self.model.hold()
+
+    def run(self, speed):
+        self.world.sync()
+        self.model.run(speed * self.sign)
+
+    def run_time(self, speed, time, then=Stop.HOLD, wait=True):
+        self.world.sync()
+        self.model.runTime(speed * self.sign, time / 1000, self.world.now(), _STOP_MODES[then])
+        if wait:
+            self.__wait()
+
+    def run_angle(self, speed, rotation_angle, then=Stop.HOLD, wait=True):
+        self.world.sync()
+        target = self.model.angle + rotation_angle * self.sign * (1 if speed >= 0 else -1)
+        self.model.runTarget(speed, target, _STOP_MODES[then])
+        if wait:
+            self.__wait()
+
+    def run_target(self, speed, target_angle, then=Stop.HOLD, wait=True):
+        self.world.sync()
+        self.model.runTarget(speed, (target_angle - self.offset) * self.sign, _STOP_MODES[then])
+        if wait:
+            self.__wait()
+
+    def run_until_stalled(self, speed, then=Stop.COAST, duty_limit=None):
+        self.world.sync()
+        self.model.run(speed * self.sign)
+        while not self.model.stalled:
+            self.world.sleep(1)
+        self.model.stop(_STOP_MODES[then])
+        return self.angle()
+
+    def dc(self, duty):
+        self.world.sync()
+        self.model.run(self.model.MAX_SPEED * duty / 100 * self.sign)
+
+class GyroSensor:
+
+    def __init__(self, port, positive_direction=Direction.CLOCKWISE):
+
+        self.world = World.current()
+        self.port = port
+
+        # The gyro is mounted upside down, so its clockwise (seen from the red dot) is the robot's anticlockwise, which
+        # is positive in the world.
+        self.sign = 1 if positive_direction == Direction.CLOCKWISE else -1
+        self.offset = 0.0
+
+    def angle(self) -> int:
+        self.world.sync()
+        return int(round(self.world.gyroAngle() * self.sign - self.offset))
+
+    def speed(self) -> int:
+        self.world.sync()
+        return int(round(self.world.gyroRate() * self.sign))
+
+    def reset_angle(self, angle):
+        self.world.sync()
+        self.offset = self.world.gyroAngle() * self.sign - angle
+
+class ColorSensor:
+
+    COLORS = {FieldColor.WHITE: Color.WHITE,
+              FieldColor.BLACK: Color.BLACK,
+              FieldColor.BLUE: Color.BLUE,
+              FieldColor.GREEN: Color.GREEN,
+              FieldColor.YELLOW: Color.YELLOW,
+              FieldColor.RED: Color.RED}
+
+    def __init__(self, port):
+        self.world = World.current()
+        self.port = port
+
+    def reflection(self) -> int:
+        self.world.sync()
+        return self.world.reflection(self.port.name)
+
+    def color(self):
+        self.world.sync()
+        return ColorSensor.COLORS[self.world.surfaceColor(self.port.name)]
+
+    def ambient(self) -> int:
+        self.world.sync()
+        return 5
+
+    def rgb(self) -> tuple:
+        reflection = self.reflection()
+        return (reflection, reflection, reflection)
@@ -0,0 +1,69 @@
+# hubs.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Simulated pybricks.hubs.
+
+
+from pheasant_sim.World import World
+
+from .parameters import Button
+
+class _Battery:
+
+    def __init__(self, world):
+        self.world = world
+
+    def voltage(self) -> int:
+        return self.world.batteryVoltage
+
+    def current(self) -> int:
+        return 150
+
+class _Buttons:
+
+    def __init__(self, world):
+        self.world = world
+
+    def pressed(self) -> list:
+        self.world.sync()
+        if self.world.buttonPresses:
+            return [getattr(Button, name) for name in self.world.buttonPresses.pop(0)]
+        return []
+
+class _Screen:
+
+    def clear(self):
+        pass
+
+    def draw_text(self, x, y, text, text_color=None, background_color=None):
+        pass
+
+    def print(self, *args, **kwargs):
+        pass
+
+class _Speaker:
+
+    def beep(self, frequency=500, duration=100):
+        pass
+
+    def say(self, text):
+        pass
+
+class _Light:
+
+    def on(self, color):
+        pass
+
+    def off(self):
+        pass
+
+class EV3Brick:
+
+    def __init__(self):
+        world = World.current()
+        self.battery = _Battery(world)
+        self.buttons = _Buttons(world)
+        self.screen = _Screen()
+        self.speaker = _Speaker()
+        self.light = _Light()
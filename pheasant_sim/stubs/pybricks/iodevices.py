@@ -0,0 +1,25 @@
+# iodevices.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Simulated pybricks.iodevices.
+
+
+from pheasant_sim.World import World
+
+class Ev3devSensor:
+
+    def __init__(self, port):
+        self.world = World.current()
+        self.port = port
+        self.sensor_index = int(port.name[1:]) - 1
+        self.port_index = self.sensor_index
+
+    def read(self, mode: str) -> tuple:
+
+        self.world.sync()
+
+        if mode == 'RGB-RAW':
+            return self.world.rgbRaw(self.port.name)
+
+        return (0,)
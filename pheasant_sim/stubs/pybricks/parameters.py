@@ -0,0 +1,44 @@
+# parameters.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Simulated pybricks.parameters.
+
+
+class _Constant:
+
+    def __init__(self, group: str, name: str):
+        self.group = group
+        self.name = name
+
+    def __repr__(self):
+        return self.group + "." + self.name
+
+    __str__ = __repr__
+
+def _constants(cls, names):
+    for name in names:
+        setattr(cls, name, _Constant(cls.__name__, name))
+    return cls
+
+class Port:
+    pass
+
+class Direction:
+    pass
+
+class Stop:
+    pass
+
+class Color:
+    pass
+
+class Button:
+    pass
+
+_constants(Port, ("A", "B", "C", "D", "S1", "S2", "S3", "S4"))
+_constants(Direction, ("CLOCKWISE", "COUNTERCLOCKWISE"))
+_constants(Stop, ("COAST", "BRAKE", "HOLD"))
+_constants(Color, ("BLACK", "BLUE", "GREEN", "YELLOW", "RED", "WHITE", "BROWN", "ORANGE", "PURPLE"))
+_constants(Button, ("LEFT_DOWN", "DOWN", "RIGHT_DOWN", "LEFT", "CENTER", "RIGHT", "LEFT_UP", "UP", "BEACON",
+                    "RIGHT_UP"))
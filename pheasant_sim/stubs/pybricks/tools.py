@@ -0,0 +1,42 @@
+# tools.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Simulated pybricks.tools. Times are in ms of simulated time.
+
+
+from pheasant_sim.World import World
+
+def wait(time):
+    World.current().sleep(time)
+
+class StopWatch:
+
+    def __init__(self):
+        self.world = World.current()
+        self.world.sync()
+        self.start = self.world.now()
+        self.elapsed = 0.0
+        self.running = True
+
+    def time(self) -> int:
+        self.world.sync()
+        elapsed = self.elapsed + (self.world.now() - self.start if self.running else 0)
+        return int(elapsed * 1000)
+
+    def pause(self):
+        if self.running:
+            self.world.sync()
+            self.elapsed += self.world.now() - self.start
+            self.running = False
+
+    def resume(self):
+        if not self.running:
+            self.world.sync()
+            self.start = self.world.now()
+            self.running = True
+
+    def reset(self):
+        self.world.sync()
+        self.start = self.world.now()
+        self.elapsed = 0.0
@@ -3,3 +3,7 @@
 # Copyright © 2021 Qi Tianshi. All rights reserved.
 
 # Pheasant tests.
+
+# Makes the simulated pybricks package importable, so that tests run off the brick.
+import pheasant_sim
+pheasant_sim.install()
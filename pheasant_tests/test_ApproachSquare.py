@@ -0,0 +1,109 @@
+# test_ApproachSquare.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Tests ev3pid.ApproachSquare against the simulated robot.
+
+
+import math
+import unittest
+from ev3pid import Clock, GyroStraight, LineSquare, LinePosition, ApproachSquare, PIDController, Reflection
+from pheasant_sim.Tuner import SimulatedPlant
+
+class test_ApproachSquare(unittest.TestCase):
+
+    def setUp(self):
+
+        # Tuning from main.py
+        self.tuning = (GyroStraight.kp_DEFAULT, GyroStraight.ki_DEFAULT, GyroStraight.kd_DEFAULT,
+                       LineSquare.kp_DEFAULT, LineSquare.ki_DEFAULT, LineSquare.kd_DEFAULT,
+                       LineSquare.OUTPUT_LIMIT_DEFAULT, LineSquare.INTEGRAL_LIMIT_DEFAULT)
+        GyroStraight.setDefaultTuning(22, 0, 100)
+        LineSquare.setDefaultTuning(3, 0.03, 30)
+        LineSquare.setDefaultOutputLimit(60)
+        LineSquare.setDefaultIntegralLimit(60)
+
+    def tearDown(self):
+        (GyroStraight.kp_DEFAULT, GyroStraight.ki_DEFAULT, GyroStraight.kd_DEFAULT,
+         LineSquare.kp_DEFAULT, LineSquare.ki_DEFAULT, LineSquare.kd_DEFAULT,
+         LineSquare.OUTPUT_LIMIT_DEFAULT, LineSquare.INTEGRAL_LIMIT_DEFAULT) = self.tuning
+        Clock.resetSource()
+
+    def test_matchesSeparateSquaring(self):
+
+        # Squares on the line at x = 700 mm, from a 5 degree heading error, both ways.
+        for linePosition in (LinePosition.AHEAD, LinePosition.BEHIND):
+            with self.subTest(linePosition=linePosition):
+
+                plant = SimulatedPlant(start=(450, 570, 5))
+                GyroStraight(500, 5).runUntil(Reflection(plant.leftColor).below(47) |
+                                              Reflection(plant.rightColor).below(42))
+                start = plant.now()
+                for _ in range(3):
+                    LineSquare(linePosition, leftThreshold=47, rightThreshold=42).run()
+                separate = plant.world.x, plant.world.heading, plant.now() - start
+
+                plant = SimulatedPlant(start=(450, 570, 5))
+                approachSquare = ApproachSquare(500, 5, linePosition, leftThreshold=47, rightThreshold=42)
+                approachSquare.run()
+
+                self.assertTrue(approachSquare.converged)
+                self.assertAlmostEqual(plant.world.x, separate[0], delta=1)
+                self.assertAlmostEqual(math.degrees(plant.world.heading), math.degrees(separate[1]), delta=0.5)
+                self.assertLess(approachSquare.elapsed, separate[2] * 1000)
+                self.assertGreater(approachSquare.iterations, ApproachSquare.WINDOW)
+
+    def test_skewedApproach(self):
+
+        # Approaches the line at x = 700 mm from 10 and 20 degrees off square, either way. Each wheel drives straight
+        # until its own sensor crosses the line, then both sensors square on its far edge.
+        for skew in (10, 20, -10, -20):
+            with self.subTest(skew=skew):
+
+                plant = SimulatedPlant(start=(450, 650, skew))
+                approachSquare = ApproachSquare(500, plant.gyro.angle(), LinePosition.BEHIND, leftThreshold=47,
+                                                rightThreshold=42)
+                approachSquare.run()
+
+                self.assertTrue(approachSquare.converged)
+                self.assertAlmostEqual(math.degrees(plant.world.heading), 0, delta=2)
+                for port in ('S2', 'S3'):
+                    self.assertGreater(plant.world.sensorPosition(port)[0], 700)
+
+    def test_loopRate(self):
+
+        # The slew limit runs on clock time, and the PID terms on dt, so that free-running and fixed-rate loops (with
+        # main.py's nominal period) square in the same place.
+        PIDController.setNominalPeriod(0.9)
+        try:
+            positions = []
+            for loopRate in (None, 500, 200):
+                with self.subTest(loopRate=loopRate):
+                    plant = SimulatedPlant(start=(450, 570, 5))
+                    approachSquare = ApproachSquare(800, 5, LinePosition.BEHIND, leftThreshold=47, rightThreshold=42,
+                                                    loopRate=loopRate)
+                    approachSquare.run()
+                    self.assertTrue(approachSquare.converged)
+                    positions.append(plant.world.x)
+        finally:
+            PIDController.setNominalPeriod(None)
+
+        self.assertLess(max(positions) - min(positions), 0.5)
+
+    def test_reuse(self):
+
+        # A second run starts from a fresh window, and gives the same result.
+        plant = SimulatedPlant(start=(450, 570, 0))
+        approachSquare = ApproachSquare(800, 0, LinePosition.BEHIND, leftThreshold=47, rightThreshold=42)
+        results = []
+        for _ in range(2):
+            plant.world.x, plant.world.heading = 450, 0
+            approachSquare.run()
+            results.append((round(plant.world.x, 1), approachSquare.converged))
+
+        self.assertEqual(results, [results[0], results[0]])
+        self.assertTrue(results[0][1])
+        self.assertGreater(results[0][0], 600)
+
+if __name__ == '__main__':
+    unittest.main()
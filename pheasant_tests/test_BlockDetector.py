@@ -0,0 +1,68 @@
+# test_BlockDetector.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for pheasant_utils.BlockDetector.
+
+
+import unittest
+from pybricks.parameters import Color
+from pheasant_utils import BlockDetector
+
+BACKGROUND = (3, 3, 3)
+BLUE = (8, 14, 40)
+GREEN = (10, 35, 12)
+YELLOW = (40, 30, 10)
+EDGE = (8, 7, 6)                    # Present, but with no clear color, as at the edge of a block.
+
+class test_BlockDetector(unittest.TestCase):
+
+    def scan(self, readings: list) -> BlockDetector:
+
+        # One reading every 10 degrees.
+        detector = BlockDetector()
+        for index, rgb in enumerate(readings):
+            detector.update(rgb, index * 10)
+        detector.finish(len(readings) * 10)
+
+        return detector
+
+    def test_windows(self):
+
+        readings = [BACKGROUND] * 5 + [EDGE, YELLOW, YELLOW, GREEN, YELLOW, EDGE] + [BACKGROUND] * 5 + \
+            [BLUE] * 6 + [BACKGROUND] * 5
+        detector = self.scan(readings)
+
+        self.assertEqual(detector.colors(), [Color.YELLOW, Color.BLUE])
+        self.assertEqual([(block.start, block.end) for block in detector.blocks], [(50, 110), (160, 220)])
+        self.assertEqual(detector.blocks[0].votes, [0, 1, 3])
+        self.assertEqual(detector.blocks[0].samples, 6)
+
+    def test_debounce(self):
+
+        # A dropout inside a block does not split it, and a single glitch outside does not make a block.
+        readings = [BACKGROUND, GREEN, BACKGROUND, BACKGROUND] + [GREEN] * 4 + [BACKGROUND, BACKGROUND] + \
+            [GREEN] * 4 + [BACKGROUND] * 4
+        detector = self.scan(readings)
+
+        self.assertEqual(len(detector.blocks), 1)
+        self.assertEqual(detector.blocks[0].start, 40)
+        self.assertEqual(detector.blocks[0].votes, [0, 8, 0])
+
+    def test_stillInView(self):
+
+        detector = self.scan([BACKGROUND] * 3 + [BLUE] * 4)
+
+        self.assertEqual(detector.colors(), [Color.BLUE])
+        self.assertEqual(detector.blocks[0].end, 70)
+
+    def test_strongest(self):
+
+        readings = [GREEN] * 5 + [BACKGROUND] * 3 + [BLUE] * 2 + [BACKGROUND] * 3 + [YELLOW] * 6 + [BACKGROUND] * 3
+        detector = self.scan(readings)
+
+        self.assertEqual(detector.colors(), [Color.GREEN, Color.BLUE, Color.YELLOW])
+        self.assertEqual(detector.colors(2), [Color.GREEN, Color.YELLOW])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# test_Claw.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for pheasant_utils.Claw and ClawMove.
+
+
+import math
+import unittest
+from ev3pid import Clock
+from pheasant_utils import ClawMove, FrontClaw, RearClaw
+
+class Motor:
+
+    """
+    A claw motor that moves towards its target at its commanded speed, and stops at `jamAngle`, if set.
+    """
+
+    class Control:
+
+        def __init__(self, motor):
+            self.motor = motor
+
+        def done(self) -> bool:
+            return self.motor.angle() == self.motor.target
+
+        def stalled(self) -> bool:
+            return False
+
+    def __init__(self, test, jamAngle: float = None):
+
+        self.test = test
+        self.jamAngle = jamAngle
+        self.control = Motor.Control(self)
+
+        self.position = 0.0
+        self.target = 0.0
+        self.speed = 0
+        self.time = 0               # Of the latest update, in us.
+        self.held = False
+        self.blockingCalls = 0
+
+    def update(self):
+
+        step = self.speed * (self.test.time - self.time) / 1000000
+        self.time = self.test.time
+        if abs(self.target - self.position) <= step:
+            self.position = self.target
+        else:
+            self.position += step if self.target > self.position else -step
+        if self.jamAngle is not None and self.position >= self.jamAngle:
+            self.position = self.jamAngle
+
+    def angle(self) -> float:
+        self.update()
+        return self.position
+
+    def run_target(self, speed, target_angle, wait=True):
+
+        self.update()
+        self.speed = speed
+        self.target = target_angle
+        self.blockingCalls += wait
+
+        # Blocks until the claw arrives, by advancing the test's clock.
+        if wait:
+            self.test.time += math.ceil(abs(self.target - self.position) / speed * 1000000)
+            self.update()
+
+    def hold(self):
+        self.update()
+        self.target = self.position
+        self.held = True
+
+class test_Claw(unittest.TestCase):
+
+    def setUp(self):
+
+        self.time = 0
+        Clock.setSource(lambda: self.time, self.sleep)
+
+        self.motors = FrontClaw.MOTOR, RearClaw.MOTOR
+        self.loads = FrontClaw.loads, RearClaw.loads
+        self.targets = FrontClaw.target, RearClaw.target
+        FrontClaw.MOTOR = Motor(self)
+        RearClaw.MOTOR = Motor(self)
+
+    def tearDown(self):
+        Clock.resetSource()
+        FrontClaw.MOTOR, RearClaw.MOTOR = self.motors
+        FrontClaw.loads, RearClaw.loads = self.loads
+        FrontClaw.target, RearClaw.target = self.targets
+
+    def sleep(self, us: int):
+        self.time += us
+
+    def test_targets(self):
+
+        for claw in (FrontClaw, RearClaw):
+            for loads in range(claw.MAX_LOADS + 2):
+                for amount in (0.1, claw.LIFTING_THRESHOLD, 0.9):
+                    with self.subTest(claw=claw.__name__, loads=loads, amount=amount):
+                        expected = claw.ANGLE_RANGE * amount * \
+                            (1 if amount <= claw.LIFTING_THRESHOLD else claw.LOAD_MULTIPLIER ** loads)
+                        self.assertAlmostEqual(claw.targetAngle(amount, loads), expected)
+
+        self.assertIsNot(FrontClaw.TARGETS, RearClaw.TARGETS)
+
+    def test_nonBlocking(self):
+
+        FrontClaw.loads = 0
+        move = FrontClaw.closeGate(wait=False)                  # 627 deg at 900 deg/s
+
+        self.assertEqual(self.time, 0)
+        self.assertFalse(move.done())
+        self.time += 350000
+        self.assertAlmostEqual(move.progress(), 0.5, places=1)
+
+        self.assertTrue(move.wait())
+        self.assertTrue(move.done())
+        self.assertAlmostEqual(move.elapsed, 700, delta=ClawMove.POLL_TIME)
+        self.assertFalse(move.stalled())
+
+    def test_blocking(self):
+
+        RearClaw.loads = 2
+        move = RearClaw.collect()
+
+        # Blocks in the motor's run_target(), as before moves returned handles.
+        self.assertEqual(RearClaw.MOTOR.blockingCalls, 1)
+        self.assertTrue(move.done())
+        self.assertEqual(RearClaw.target, RearClaw.targetAngle(0.34, 2))
+
+    def test_progress(self):
+
+        move = RearClaw.openGate(wait=False)
+
+        self.assertTrue(move.wait(progress=0.5))
+        self.assertFalse(move.done())
+        self.assertGreaterEqual(move.progress(), 0.5)
+
+    def test_jam(self):
+
+        RearClaw.MOTOR = Motor(self, jamAngle=100)
+        move = RearClaw.openGate(wait=False)
+
+        self.assertFalse(move.wait())
+        self.assertTrue(move.stalled())
+        self.assertTrue(RearClaw.MOTOR.held)
+        self.assertEqual(RearClaw.MOTOR.position, 100)
+
+if __name__ == '__main__':
+    unittest.main()
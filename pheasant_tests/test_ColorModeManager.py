@@ -0,0 +1,108 @@
+# test_ColorModeManager.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for ev3pid.utils.ColorModeManager.
+
+
+import unittest
+from pybricks.parameters import Color
+from ev3pid import Clock, ColorMode, ColorModeManager, ColorIs, SensorSnapshot
+
+class Sensor:
+
+    """
+    A color sensor whose mode switches take `SWITCH_TIME` us, like ev3dev.
+    """
+
+    SWITCH_TIME = 30000
+
+    def __init__(self, test, reflection: int, color):
+        self.test = test
+        self.value = reflection
+        self.surface = color
+        self.mode = None
+        self.switches = 0
+
+    def read(self, mode: str):
+        if mode != self.mode:
+            if self.mode is not None:
+                self.switches += 1
+            self.mode = mode
+            self.test.time += Sensor.SWITCH_TIME
+
+    def reflection(self) -> int:
+        self.read("COL-REFLECT")
+        return self.value
+
+    def color(self):
+        self.read("COL-COLOR")
+        return self.surface
+
+class test_ColorModeManager(unittest.TestCase):
+
+    def setUp(self):
+        self.time = 0
+        Clock.setSource(lambda: self.time, None)
+
+    def tearDown(self):
+        Clock.resetSource()
+
+    def test_derivedColor(self):
+
+        manager = ColorModeManager()
+        sensor = Sensor(self, 8, Color.BLACK)
+        managed = manager.sensor(sensor, "left", 10, 65)
+        manager.pin(ColorMode.REFLECTION, "track")
+
+        self.assertEqual(managed.reflection(), 8)
+        self.assertEqual(managed.color(), Color.BLACK)
+        sensor.value = 80
+        self.assertEqual(managed.color(), Color.WHITE)
+        sensor.value = 40
+        self.assertIsNone(managed.color())
+
+        # Stop conditions read the derived color through the snapshot too.
+        condition = ColorIs(managed, Color.BLACK)
+        condition.bind(SensorSnapshot())
+        sensor.value = 5
+        self.assertTrue(condition())
+
+        self.assertEqual(sensor.switches, 0)
+        self.assertEqual(managed.switches, 0)
+
+    def test_countsSwitches(self):
+
+        manager = ColorModeManager()
+        sensor = Sensor(self, 8, Color.GREEN)
+        managed = manager.sensor(sensor, "right", 10, 65)
+
+        managed.reflection()                                    # Sets the first mode, which is not a switch.
+        manager.pin(ColorMode.COLOR, "green check")
+        self.assertEqual(managed.color(), Color.GREEN)
+        self.assertEqual(managed.color(), Color.GREEN)
+        manager.pin(ColorMode.REFLECTION, "track")
+        managed.reflection()
+
+        self.assertEqual(managed.switches, sensor.switches)
+        self.assertEqual(managed.switches, 2)
+        self.assertEqual(managed.switchTime, 2 * Sensor.SWITCH_TIME)
+        self.assertEqual(managed.maxSwitchTime, Sensor.SWITCH_TIME)
+        self.assertEqual(manager.phases, {"green check": [1, Sensor.SWITCH_TIME], "track": [1, Sensor.SWITCH_TIME]})
+        self.assertEqual(manager.switches(), 2)
+
+    def test_standsInForSensor(self):
+
+        sensor = Sensor(self, 50, None)
+        managed = ColorModeManager().sensor(sensor, "left", 10, 65)
+
+        # As in ColorInput.checkKnownThresholds().
+        self.assertIn(sensor, [managed])
+        self.assertEqual([managed].index(sensor), 0)
+
+        # Equal objects hash alike, so the managed sensor also stands in for it as a dict key.
+        self.assertEqual(hash(managed), hash(sensor))
+        self.assertEqual({managed: 1}[sensor], 1)
+
+if __name__ == '__main__':
+    unittest.main()
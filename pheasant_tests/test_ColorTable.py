@@ -0,0 +1,77 @@
+# test_ColorTable.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for pheasant_utils.ColorTable and its use by SideScan.
+
+
+import os
+import random
+import tempfile
+import unittest
+from pybricks.parameters import Color
+from pheasant_utils import ColorTable, SideScan
+
+# Side scanner readings, as in the simulator: background, and blocks at full and half brightness.
+READINGS = {None: [(3, 3, 3)],
+            Color.BLUE: [(8, 14, 40), (4, 7, 20)],
+            Color.GREEN: [(10, 35, 12), (5, 17, 6)],
+            Color.YELLOW: [(40, 30, 10), (20, 15, 5)]}
+
+class test_ColorTable(unittest.TestCase):
+
+    def setUp(self):
+
+        rng = random.Random(4)
+        self.samples = {}
+        for color, readings in READINGS.items():
+            self.samples[color] = [tuple(max(0, round(value + rng.gauss(0, 1))) for value in rgb)
+                                   for rgb in readings for _ in range(50)]
+
+        self.table = ColorTable.build(self.samples)
+
+    def tearDown(self):
+        SideScan.table = None
+
+    def test_classify(self):
+
+        for color, readings in self.samples.items():
+            with self.subTest(color=color):
+                correct = sum(1 for rgb in readings if self.table.classify(rgb) == color)
+                self.assertGreaterEqual(correct / len(readings), 0.95)
+
+        # Readings brighter than any sample clamp to the edge of the table.
+        self.assertEqual(self.table.classify((400, 300, 100)), Color.YELLOW)
+
+    def test_persistence(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            path = os.path.join(directory, "sidescan.bin")
+            self.assertIsNone(ColorTable.load(path))
+
+            self.table.save(path)
+            loaded = ColorTable.load(path)
+
+            self.assertEqual(loaded.shift, self.table.shift)
+            self.assertEqual(loaded.table, self.table.table)
+
+            # Invalid tables are ignored.
+            with open(path, 'wb') as file:
+                file.write(b"PCT1")
+            self.assertIsNone(ColorTable.load(path))
+
+    def test_sideScan(self):
+
+        # Without a table, SideScan uses its fixed rules.
+        self.assertEqual(SideScan.color((10, 35, 12)), Color.GREEN)
+        self.assertTrue(SideScan.presence((10, 35, 12)))
+
+        SideScan.table = self.table
+        for readings in self.samples.values():
+            for rgb in readings:
+                self.assertEqual(SideScan.color(rgb), self.table.classify(rgb))
+                self.assertEqual(SideScan.presence(rgb), self.table.classify(rgb) is not None)
+
+if __name__ == '__main__':
+    unittest.main()
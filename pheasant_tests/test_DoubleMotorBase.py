@@ -0,0 +1,119 @@
+# test_DoubleMotorBase.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for ev3move.DoubleMotorBase and the waits of ev3move.TwoWheelDrive.
+
+
+import unittest
+from ev3move import DoubleMotorBase, TwoWheelDrive
+
+class Motor:
+
+    """
+    A motor that logs its commands, and completes positional commands after `polls` calls to `control.done()`.
+    """
+
+    class Control:
+
+        def __init__(self, motor):
+            self.motor = motor
+
+        def done(self) -> bool:
+            self.motor.log.append(("done", self.motor.name))
+            self.motor.remaining -= 1
+            return self.motor.remaining < 0
+
+    def __init__(self, name: str, log: list, polls: int = 0):
+
+        self.name = name
+        self.log = log
+        self.polls = polls
+        self.remaining = 0
+        self.control = Motor.Control(self)
+
+    def run(self, speed):
+        self.log.append(("run", self.name, speed))
+
+    def run_angle(self, speed, rotation_angle, then=None, wait=True):
+        self.log.append(("run_angle", self.name, wait))
+        self.remaining = self.polls
+
+class TestDoubleMotorBase(unittest.TestCase):
+
+    def setUp(self):
+
+        self.log = []
+        self.leftMotor = Motor("left", self.log, polls=2)
+        self.rightMotor = Motor("right", self.log, polls=3)
+        self.deadband = DoubleMotorBase.SPEED_DEADBAND
+        DoubleMotorBase.resetWriteCounts()
+
+    def tearDown(self):
+        DoubleMotorBase.setSpeedDeadband(self.deadband)
+        DoubleMotorBase.resetWriteCounts()
+
+    def runs(self) -> list:
+        return [entry for entry in self.log if entry[0] == "run"]
+
+    def test_deadband(self):
+
+        DoubleMotorBase.setSpeedDeadband(5)
+        base = DoubleMotorBase(self.leftMotor, self.rightMotor)
+
+        base.runMotors(100, 200)            # First commands are always written.
+        base.runMotors(104, 196)            # Within the deadband, so neither is written.
+        base.runMotors(106, 199)            # Only the left motor has moved far enough from its last write.
+
+        self.assertEqual(self.runs(), [("run", "left", 100), ("run", "right", 200), ("run", "left", 106)])
+        self.assertEqual(DoubleMotorBase.motorWrites, 3)
+        self.assertEqual(DoubleMotorBase.skippedWrites, 3)
+
+    def test_resetMotorCommands(self):
+
+        base = DoubleMotorBase(self.leftMotor, self.rightMotor)
+
+        base.runMotors(100, 100)
+        base.resetMotorCommands()
+        base.runMotors(100, 100)
+
+        self.assertEqual(len(self.runs()), 4)
+        self.assertEqual(DoubleMotorBase.motorWrites, 4)
+        self.assertEqual(DoubleMotorBase.skippedWrites, 0)
+
+    def test_resetWriteCounts(self):
+
+        base = DoubleMotorBase(self.leftMotor, self.rightMotor)
+        base.runMotors(100, 100)
+        base.runMotors(100, 100)
+        DoubleMotorBase.resetWriteCounts()
+
+        self.assertEqual(DoubleMotorBase.motorWrites, 0)
+        self.assertEqual(DoubleMotorBase.skippedWrites, 0)
+
+    def test_waitsForBothMotors(self):
+
+        drive = TwoWheelDrive(self.leftMotor, self.rightMotor)
+        drive.run_angle(300, 360)
+
+        # Both commands are written, left then right, without waiting, before either motor is polled.
+        self.assertEqual(self.log[:2], [("run_angle", "left", False), ("run_angle", "right", False)])
+        self.assertTrue(all(entry[0] == "done" for entry in self.log[2:]))
+
+        # Returns only once both motors are done, including the slower right motor.
+        self.assertEqual(self.log[-1], ("done", "right"))
+        self.assertLess(self.rightMotor.remaining, 0)
+        self.assertEqual(DoubleMotorBase.motorWrites, 2)
+
+    def test_waitsForSlowerLeftMotor(self):
+
+        # Waiting on the right motor's command alone would return while the left motor is still running.
+        self.leftMotor.polls = 4
+        self.rightMotor.polls = 1
+        TwoWheelDrive(self.leftMotor, self.rightMotor).run_angle(300, 360)
+
+        self.assertLess(self.leftMotor.remaining, 0)
+        self.assertLess(self.rightMotor.remaining, 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# test_FlightLog.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for pheasant_analysis.
+
+
+import os
+import tempfile
+import unittest
+from ev3pid import Clock, FlightRecorder, PIDController
+from pheasant_sim import World, useWorldClock
+
+try:
+    import numpy
+    import pheasant_analysis
+except ImportError:
+    numpy = None
+
+@unittest.skipIf(numpy is None, "requires NumPy")
+class test_FlightLog(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.world = World.create(virtual=True)
+        useWorldClock(self.world)
+
+    def tearDown(self):
+        Clock.resetSource()
+        self.directory.cleanup()
+
+    def writeLog(self, name: str, errors: dict) -> str:
+
+        """Records a segment per (procedure, controller) in `errors`, 10 ms apart, then a 250 ms wait, and dumps it."""
+
+        recorder = FlightRecorder(1024)
+        controller = PIDController(0, 1, 0, 0, None, None)
+
+        for (procedure, segment), trace in errors.items():
+            recorder.procedure = procedure
+            recorder.begin(segment)
+            for error in trace:
+                self.world.sleep(10)
+                controller.update(error)
+                recorder.record(controller, 0, 0)
+
+        recorder.wait(250)
+
+        path = os.path.join(self.directory.name, name)
+        recorder.dump(path)
+
+        return path
+
+    def test_segmentMetrics(self):
+
+        path = self.writeLog("a.bin", {("turn", "GyroTurn"): [90, 40, 10, -3, 0.5, 0.2, 0.1, 0, 0, 0],
+                                       ("track", "LineSquare left"): [-20] * 5})
+        log = pheasant_analysis.FlightLog(path)
+        metrics = pheasant_analysis.segmentMetrics(log)
+
+        self.assertIsInstance(log.records, numpy.memmap)
+        self.assertEqual(list(metrics['controller']), ["GyroTurn", "LineSquare", "wait"])
+        self.assertEqual(list(metrics['procedure']), ["turn", "track", "track"])
+
+        turn = metrics[0]
+        self.assertEqual(turn['samples'], 10)
+        self.assertAlmostEqual(turn['duration'], 0.09)
+        self.assertAlmostEqual(turn['loopRate'], 100)
+        self.assertAlmostEqual(turn['overshoot'], 3)
+        self.assertAlmostEqual(turn['settleTime'], 0.03)                # Last outside 1 deg at the 4th sample
+        self.assertAlmostEqual(turn['steadyStateError'], 0)
+
+        self.assertAlmostEqual(metrics[1]['steadyStateError'], 20)
+        self.assertAlmostEqual(metrics[1]['overshoot'], 0)
+        self.assertAlmostEqual(metrics[2]['waitTime'], 0.25)
+
+    def test_runSummary(self):
+
+        paths = [self.writeLog(str(i) + ".bin", {("turn", "GyroTurn"): [10, 5, 0], ("drive", "GyroStraight"): [2, 0]})
+                 for i in range(3)]
+        summary = pheasant_analysis.RunSummary(paths)
+
+        procedures = summary.byProcedure()
+        self.assertEqual(list(procedures['name']), ["drive", "turn"])
+        self.assertEqual(list(procedures['segments']), [3, 3])
+        self.assertAlmostEqual(procedures['waitTime'][0], 0.25)          # The wait follows the drive segment.
+
+        controllers = summary.byController()
+        self.assertEqual(list(controllers['name']), ["GyroStraight", "GyroTurn", "wait"])
+        self.assertAlmostEqual(controllers['duration'][1], 0.02)
+        self.assertIn("GyroTurn", summary.summary())
@@ -0,0 +1,131 @@
+# test_FlightRecorder.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for ev3pid.utils.FlightRecorder.
+
+
+import os
+import struct
+import tempfile
+import unittest
+from ev3pid import FlightRecorder, PIDController
+
+class test_FlightRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "flight.bin")
+        self.controller = PIDController(10, 2, 0.5, 4, None, 100)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def readLog(self):
+
+        with open(self.path, 'rb') as file:
+            data = file.read()
+
+        header = struct.unpack_from(FlightRecorder.HEADER_FORMAT, data)
+        names = data[FlightRecorder.HEADER_SIZE:FlightRecorder.HEADER_SIZE + header[6]].decode().split("\n")
+        offset = FlightRecorder.HEADER_SIZE + header[6]
+        records = [struct.unpack_from(FlightRecorder.RECORD_FORMAT, data, offset + i * FlightRecorder.RECORD_SIZE)
+                   for i in range(header[3])]
+
+        return header, names, records
+
+    def test_formatSizes(self):
+        self.assertEqual(struct.calcsize(FlightRecorder.HEADER_FORMAT), FlightRecorder.HEADER_SIZE)
+        self.assertEqual(struct.calcsize(FlightRecorder.RECORD_FORMAT), FlightRecorder.RECORD_SIZE)
+        self.assertEqual(len(FlightRecorder.FIELDS), 11)
+
+    def test_recordAndDump(self):
+
+        recorder = FlightRecorder(16)
+        recorder.begin("GyroStraight")
+        for error in (3, -2, 1):
+            output = self.controller.update(error)
+            recorder.record(self.controller, 500 - output, 500 + output)
+
+        recorder.dump(self.path)
+        header, names, records = self.readLog()
+
+        self.assertEqual(header[:6], (b'PHFR', 2, 40, 3, 0, 1))
+        self.assertEqual(names, ["GyroStraight"])
+
+        _, segment, dt, setpoint, error, p, i, d, output, left, right = records[-1]
+        self.assertEqual((segment, dt, setpoint, error), (0, 0, 10, 1))
+        self.assertEqual((p, i, d), (2, 1, 12))
+        self.assertEqual(output, p + i + d)
+        self.assertEqual((left, right), (500 - output, 500 + output))
+        self.assertLessEqual(records[0][0], records[-1][0])
+
+    def test_dt(self):
+
+        recorder = FlightRecorder(4)
+        recorder.begin("GyroTurn")
+        for dt in (None, 2.137, 100):
+            self.controller.update(1, dt=dt)
+            recorder.record(self.controller, 0, 0)
+
+        recorder.dump(self.path)
+        _, _, records = self.readLog()
+
+        # In us, saturating at DT_MAX.
+        self.assertEqual([record[2] for record in records], [0, 2137, FlightRecorder.DT_MAX])
+
+    def test_ringBuffer(self):
+
+        recorder = FlightRecorder(4)
+        for segment in range(3):
+            recorder.begin("segment " + str(segment))
+            for error in range(3):
+                self.controller.update(segment * 10 + error)
+                recorder.record(self.controller, 0, 0)
+
+        recorder.dump(self.path)
+        header, names, records = self.readLog()
+
+        # The four latest samples, oldest first
+        self.assertEqual((header[3], header[4]), (4, 5))
+        self.assertEqual(len(names), 3)
+        self.assertEqual([record[4] for record in records], [12, 20, 21, 22])
+        self.assertEqual([record[1] for record in records], [1, 2, 2, 2])
+
+    def test_waitSegments(self):
+
+        recorder = FlightRecorder(16)
+        recorder.procedure = "start"
+        recorder.begin("GyroStraight")
+        for _ in range(3):
+            recorder.wait(1)
+        recorder.procedure = "end"
+        recorder.wait(1)
+
+        # Waits reuse one segment per procedure, and don't end the current segment.
+        self.assertEqual(recorder.segments, ["start/GyroStraight", "start/wait", "end/wait"])
+        self.assertEqual(recorder.segment, 0)
+
+        recorder.dump(self.path)
+        _, _, records = self.readLog()
+        self.assertEqual([record[1] for record in records], [1, 1, 1, 2])
+
+    def test_segmentLimit(self):
+
+        maxSegments = FlightRecorder.MAX_SEGMENTS
+        FlightRecorder.MAX_SEGMENTS = 4
+        try:
+            recorder = FlightRecorder(16)
+            numbers = [recorder.begin(name) for name in ("a", "b", "a", "c", "a", "d")]
+        finally:
+            FlightRecorder.MAX_SEGMENTS = maxSegments
+
+        # Once out of numbers, known names reuse their latest number, and new names share the last one.
+        self.assertEqual(numbers, [0, 1, 2, 3, 2, 3])
+        self.assertEqual(recorder.segments, ["a", "b", "a", "overflow"])
+
+    def test_measureOverhead(self):
+        self.assertGreater(FlightRecorder.measureOverhead(self.controller, 100), 0)
+
+if __name__ == '__main__':
+    unittest.main()
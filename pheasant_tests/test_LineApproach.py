@@ -0,0 +1,77 @@
+# test_LineApproach.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Tests ev3pid.LineApproach against the simulated robot.
+
+
+import unittest
+from ev3pid import Clock, GyroStraight, LineApproach, Reflection
+from pheasant_sim.Tuner import SimulatedPlant
+
+class test_LineApproach(unittest.TestCase):
+
+    def setUp(self):
+        self.tuning = GyroStraight.kp_DEFAULT, GyroStraight.ki_DEFAULT, GyroStraight.kd_DEFAULT
+        GyroStraight.setDefaultTuning(22, 0, 100)
+
+    def tearDown(self):
+        GyroStraight.kp_DEFAULT, GyroStraight.ki_DEFAULT, GyroStraight.kd_DEFAULT = self.tuning
+        Clock.resetSource()
+
+    def approach(self, speed: int) -> tuple:
+
+        # Drives onto the line at x = 700 mm.
+        plant = SimulatedPlant(start=(450, 570, 0))
+        approach = LineApproach(speed, 0, leftThreshold=47, rightThreshold=42)
+        approach.run()
+        plant.world.sleep(0.3)
+
+        return plant.world.x, approach
+
+    def test_speedIndependent(self):
+
+        slowX, slow = self.approach(300)
+        fastX, fast = self.approach(1000)
+
+        # The sensors are 90 mm ahead of the wheels, and end on the edge of the line.
+        self.assertAlmostEqual(slowX, 600, delta=1.5)
+        self.assertAlmostEqual(fastX, slowX, delta=1)
+        self.assertGreater(fast.overshoot, slow.overshoot)
+        self.assertAlmostEqual(fast.crossing[0], slow.crossing[0], delta=2)
+
+    def test_baselinePose(self):
+
+        # Before LineApproach, lines were approached at 400 deg/s until both sensors were below their thresholds.
+        for start, speed in (((450, 570, 0), 400), ((950, 570, 0), -400), ((450, 650, 5), 400), ((450, 650, -8), 400)):
+            with self.subTest(start=start, speed=speed):
+                plant = SimulatedPlant(start=start)
+                baseline = GyroStraight(speed, plant.gyro.angle())
+                baseline.runUntil(Reflection(plant.leftColor).below(47) & Reflection(plant.rightColor).below(42))
+                baseline.leftMotor.hold()
+                baseline.rightMotor.hold()
+                plant.world.sleep(0.3)
+                baselinePose = plant.world.x, plant.world.y
+
+                plant = SimulatedPlant(start=start)
+                approach = LineApproach(speed * 2, plant.gyro.angle(), leftThreshold=47, rightThreshold=42)
+                self.assertTrue(approach.run())
+                plant.world.sleep(0.3)
+
+                self.assertTrue(approach.corrected)
+                self.assertAlmostEqual(plant.world.x, baselinePose[0], delta=1.5)
+                self.assertAlmostEqual(plant.world.y, baselinePose[1], delta=1.5)
+
+    def test_backwards(self):
+
+        plant = SimulatedPlant(start=(950, 570, 0))
+        approach = LineApproach(-800, 0, leftThreshold=47, rightThreshold=42)
+        approach.run()
+        plant.world.sleep(0.3)
+
+        # Reversing onto the line at x = 1000 mm stops with the sensors on its near edge.
+        self.assertAlmostEqual(plant.world.x, 920, delta=1.5)
+        self.assertGreater(approach.overshoot, 0)
+
+if __name__ == '__main__':
+    unittest.main()
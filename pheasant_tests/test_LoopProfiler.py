@@ -0,0 +1,108 @@
+# test_LoopProfiler.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for ev3pid.utils.LoopProfiler.
+
+
+import os
+import tempfile
+import unittest
+from ev3pid import Clock, LoopProfiler, GyroStraight
+from pheasant_sim.Tuner import SimulatedPlant
+
+class test_LoopProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.time = 0
+        Clock.setSource(lambda: self.time, lambda us: None)
+
+    def tearDown(self):
+        Clock.resetSource()
+        LoopProfiler.deactivate()
+
+    def iterate(self, stats, read: int, math: int, write: int, other: int):
+        stats.tick()
+        self.time += read
+        stats.read()
+        self.time += math
+        stats.computed()
+        self.time += write
+        stats.written()
+        self.time += other
+
+    def test_phases(self):
+
+        profiler = LoopProfiler()
+        profiler.procedure = "scan"
+        stats = profiler.begin("GyroTurn")
+
+        for _ in range(3):
+            self.iterate(stats, 300, 100, 400, 200)
+        stats.tick()                                    # Exit iteration
+
+        self.assertEqual(stats.name, "scan/GyroTurn")
+        self.assertEqual((stats.iterations, stats.periods), (3, 3))
+        self.assertEqual((stats.periodMin, stats.periodMean(), stats.periodMax), (1000, 1000, 1000))
+        self.assertEqual((stats.readTime, stats.mathTime, stats.writeTime), (900, 300, 1200))
+        self.assertEqual(stats.rate(), 1000)
+        self.assertIn("read 30%, math 10%, write 40%, other 20%", stats.summary())
+
+    def test_histogram(self):
+
+        stats = LoopProfiler().begin("LineTrack")
+        for period in (100, 240, 260, 1000000):
+            self.iterate(stats, period, 0, 0, 0)
+        stats.tick()
+
+        self.assertEqual(stats.histogram[0], 2)
+        self.assertEqual(stats.histogram[1], 1)
+        self.assertEqual(stats.histogram[-1], 1)                 # Longer periods go in the last bucket.
+        self.assertEqual(sum(stats.histogram), 4)
+        self.assertEqual((stats.periodMin, stats.periodMax), (100, 1000000))
+
+    def test_dump(self):
+
+        profiler = LoopProfiler()
+        self.iterate(profiler.begin("GyroStraight"), 10, 10, 10, 10)
+        profiler.begin("LineSquare")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "loops.csv")
+            profiler.dump(path)
+            with open(path) as file:
+                lines = file.read().splitlines()
+
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(len(lines[0].split(",")), 8 + LoopProfiler.BUCKET_COUNT)
+        self.assertTrue(lines[1].startswith("GyroStraight,1,"))
+        self.assertTrue(lines[2].startswith("LineSquare,0,None"))
+
+    def test_controllerLoop(self):
+
+        plant = SimulatedPlant(start=(400, 570, 0))
+        profiler = LoopProfiler()
+        profiler.activate()
+
+        start = plant.now()
+        GyroStraight(600, 0, kp=22, ki=0, kd=100).runUntil(lambda: plant.now() - start > 0.2)
+
+        stats = profiler.invocations[0]
+        self.assertEqual(stats.name, "GyroStraight")
+        self.assertGreater(stats.iterations, 10)
+        self.assertEqual(stats.periods, stats.iterations)
+        self.assertGreater(stats.readTime, 0)
+        self.assertGreater(stats.writeTime, 0)
+
+    def test_inactive(self):
+
+        self.assertIs(LoopProfiler.stats("GyroTurn"), LoopProfiler.NULL_STATS)
+        self.iterate(LoopProfiler.NULL_STATS, 10, 10, 10, 10)
+
+        profiler = LoopProfiler()
+        profiler.activate()
+        stats = LoopProfiler.stats("GyroTurn")
+        self.assertEqual(profiler.invocations, [stats])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# test_LoopScheduler.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for ev3pid.utils.LoopScheduler.
+
+
+import unittest
+from ev3pid import Clock, LoopScheduler
+
+class test_LoopScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.time = 0
+        Clock.setSource(lambda: self.time, self.sleep)
+
+    def tearDown(self):
+        Clock.resetSource()
+
+    def sleep(self, us: int):
+        self.time += us
+
+    def test_holdsPeriod(self):
+
+        # 200 Hz, with 1 to 4 ms of work in each iteration.
+        scheduler = LoopScheduler(200)
+        ticks = []
+        dts = []
+        for index in range(20):
+            dts.append(scheduler.tick())
+            ticks.append(self.time)
+            self.time += 1000 + (index % 4) * 1000
+
+        self.assertIsNone(dts[0])
+        self.assertEqual(dts[1:], [5] * 19)
+        self.assertEqual([later - earlier for earlier, later in zip(ticks, ticks[1:])], [5000] * 19)
+        self.assertEqual(scheduler.overruns, 0)
+
+    def test_overrun(self):
+
+        # An iteration of 12 ms restarts the schedule from the late tick, instead of bursting to catch up.
+        scheduler = LoopScheduler(200)
+        scheduler.tick()
+        self.time += 12000
+        self.assertEqual(scheduler.tick(), 12)
+        self.time += 1000
+        self.assertEqual(scheduler.tick(), 5)
+        self.assertEqual(self.time, 17000)
+        self.assertEqual(scheduler.overruns, 1)
+
+    def test_freeRunning(self):
+
+        scheduler = LoopScheduler()
+        for _ in range(3):
+            self.assertIsNone(scheduler.tick())
+            self.time += 2000
+
+        self.assertEqual(scheduler.ticks, 3)
+        self.assertEqual(self.time, 6000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+# test_MissionGraph.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for pheasant_utils.MissionGraph.
+
+
+import unittest
+from ev3pid import Clock
+from pheasant_utils import MissionGraph, Resource
+
+class Handle:
+
+    """
+    A background step that is done `duration` ms after it starts, or stalls and holds after `jamTime` ms, if set.
+    """
+
+    def __init__(self, test, duration: int, jamTime: int = None):
+        self.test = test
+        self.begin = test.time
+        self.end = test.time + duration * 1000
+        self.jam = test.time + jamTime * 1000 if jamTime is not None else None
+        self.held = None
+
+    def done(self) -> bool:
+        return self.jam is None and self.test.time >= self.end
+
+    def progress(self) -> float:
+        return min((self.test.time - self.begin) / (self.end - self.begin), 1.0)
+
+    def stalled(self) -> bool:
+        return self.jam is not None and self.test.time >= self.jam
+
+    def hold(self):
+        self.held = self.test.time // 1000
+
+class test_MissionGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.time = 0
+        self.log = []
+        self.handles = []
+        Clock.setSource(lambda: self.time, self.sleep)
+
+    def tearDown(self):
+        Clock.resetSource()
+
+    def sleep(self, us: int):
+        self.time += us
+
+    def blocking(self, name: str, duration: int):
+
+        def function():
+            self.log.append((name, self.time // 1000))
+            self.time += duration * 1000
+
+        return function
+
+    def background(self, name: str, duration: int, jamTime: int = None):
+
+        def function():
+            self.log.append((name, self.time // 1000))
+            self.handles.append(Handle(self, duration, jamTime))
+            return self.handles[-1]
+
+        return function
+
+    def test_overlap(self):
+
+        graph = MissionGraph()
+        turn = graph.add("turn", self.blocking("turn", 500), (Resource.DRIVE_BASE,))
+        graph.add("lower", self.background("lower", 300), (Resource.REAR_CLAW,), after=(turn,))
+        drive = graph.add("drive", self.blocking("drive", 700), (Resource.DRIVE_BASE,))
+        graph.add("close", self.blocking("close", 200), (Resource.REAR_CLAW,), after=(drive,))
+        graph.add("scan", self.blocking("scan", 100), (Resource.SIDE_SCAN,))
+        graph.run()
+
+        self.assertEqual(self.log, [("turn", 0), ("lower", 500), ("drive", 500), ("close", 1200), ("scan", 1400)])
+        self.assertEqual(graph.elapsed, 1500000)
+        self.assertEqual([step.name for step in graph.criticalPath()], ["turn", "drive", "close"])
+
+        # lower finished during drive, so it is timed as finishing with it.
+        self.assertEqual([step.duration() // 1000 for step in graph.steps], [500, 700, 700, 200, 100])
+        self.assertIn("sequential 2200 ms; critical path 1400 ms: turn > drive > close", graph.report())
+
+    def test_resourceOrder(self):
+
+        graph = MissionGraph()
+        graph.add("lift", self.background("lift", 400), (Resource.FRONT_CLAW,))
+        graph.add("drop", self.blocking("drop", 100), (Resource.FRONT_CLAW,))
+        graph.run()
+
+        self.assertEqual(self.log, [("lift", 0), ("drop", 400)])
+
+    def test_progressDependency(self):
+
+        graph = MissionGraph()
+        lower = graph.add("lower", self.background("lower", 400), (Resource.REAR_CLAW,))
+        drive = graph.add("drive", self.blocking("drive", 500), (Resource.DRIVE_BASE,), after=((lower, 0.75),))
+        graph.add("close", self.blocking("close", 200), (Resource.REAR_CLAW,), after=(drive,))
+
+        self.assertTrue(graph.run())
+        self.assertEqual(self.log, [("lower", 0), ("drive", 300), ("close", 800)])
+
+        # The drive only chains through the first 300 ms of the lowering.
+        self.assertEqual([step.name for step in graph.criticalPath()], ["lower", "drive", "close"])
+        self.assertIn("critical path 1000 ms", graph.report())
+
+    def test_stall(self):
+
+        graph = MissionGraph()
+        lower = graph.add("lower", self.background("lower", 400, jamTime=100), (Resource.REAR_CLAW,))
+        graph.add("close", self.blocking("close", 200), (Resource.REAR_CLAW,), after=(lower,))
+
+        self.assertFalse(graph.run())
+        self.assertTrue(lower.stalled)
+        self.assertEqual(self.handles[0].held, 100)             # Held as soon as the stall was polled.
+        self.assertEqual(self.log, [("lower", 0), ("close", 100)])
+
+    def test_foreignDependency(self):
+
+        other = MissionGraph().add("elsewhere", self.blocking("elsewhere", 100))
+        graph = MissionGraph()
+        graph.add("step", self.blocking("step", 100), after=(other,))
+
+        with self.assertRaises(ValueError):
+            graph.run()
+
+if __name__ == '__main__':
+    unittest.main()
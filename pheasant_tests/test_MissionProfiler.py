@@ -0,0 +1,106 @@
+# test_MissionProfiler.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for pheasant_utils.MissionProfiler.
+
+
+import os
+import tempfile
+import unittest
+from ev3pid import Clock
+from pheasant_utils import MissionProfiler
+
+class Robot:
+
+    def __init__(self, test):
+        self.test = test
+
+    def drive(self, ms: int):
+        self.test.time += ms * 1000
+
+    def turn(self, ms: int):
+        self.drive(ms)                              # Nested timed call: counts as turning only.
+
+    @classmethod
+    def claw(cls, test, ms: int):
+        test.time += ms * 1000
+
+class test_MissionProfiler(unittest.TestCase):
+
+    def setUp(self):
+
+        self.time = 0
+        Clock.setSource(lambda: self.time, lambda us: None)
+
+        class InstrumentedRobot(Robot):
+            pass
+
+        for name, category in (('drive', "drive"), ('turn', "turn"), ('claw', "claw")):
+            MissionProfiler.instrument(InstrumentedRobot, name, category)
+        self.robot = InstrumentedRobot(self)
+
+        @MissionProfiler.timed("wait")
+        def wait(ms: int):
+            self.time += ms * 1000
+
+        self.wait = wait
+
+    def tearDown(self):
+        Clock.resetSource()
+        MissionProfiler.deactivate()
+
+    def test_breakdown(self):
+
+        profiler = MissionProfiler()
+        profiler.activate()
+
+        @MissionProfiler.step("deposit")
+        def deposit():
+            self.robot.drive(300)
+            type(self.robot).claw(self, 200)        # Claws are used through their class.
+            self.time += 50000
+
+        self.robot.drive(1000)                      # Before any procedure: not counted.
+
+        profiler.startProcedure("first")
+        self.robot.drive(100)
+        self.robot.turn(400)
+        self.wait(250)
+        deposit()
+        profiler.startProcedure("second")
+        self.wait(5000)
+        profiler.finish()
+
+        self.assertEqual(profiler.table(),
+                         [["first", 1000, 1300, 400, 400, 200, 250, 50],
+                          ["first/deposit", 1750, 550, 300, 0, 200, 0, 50],
+                          ["second", 2300, 5000, 0, 0, 0, 5000, 0]])
+        self.assertIn("first/deposit", profiler.report())
+
+    def test_inactive(self):
+
+        profiler = MissionProfiler()
+        profiler.startProcedure("first")
+        self.robot.drive(100)
+
+        self.assertEqual(profiler.table()[0][3], 0)
+
+    def test_dump(self):
+
+        profiler = MissionProfiler()
+        profiler.activate()
+        profiler.startProcedure("first")
+        self.wait(10)
+        profiler.finish()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "mission.csv")
+            profiler.dump(path)
+            with open(path) as file:
+                lines = file.read().splitlines()
+
+        self.assertEqual(lines, ["name,start,duration,drive,turn,claw,wait,other", "first,0,10,0,0,0,10,0"])
+
+if __name__ == '__main__':
+    unittest.main()
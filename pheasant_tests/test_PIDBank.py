@@ -0,0 +1,81 @@
+# test_PIDBank.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for pheasant_sim.PIDBank, against ev3pid's scalar PIDController.
+
+
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ev3pid import PIDController
+
+@unittest.skipIf(numpy is None, "PIDBank requires NumPy")
+class test_PIDBank(unittest.TestCase):
+
+    def setUp(self):
+
+        from pheasant_sim.PIDBank import PIDBank            # pylint: disable=import-outside-toplevel
+
+        generator = random.Random(2021)
+        self.gains = [(generator.choice((22, 1.2, 3, generator.uniform(0, 40))),
+                       generator.choice((0, 1, 0.0008, generator.uniform(0, 2))),
+                       generator.choice((100, 200, 30, generator.uniform(0, 500))),
+                       generator.choice((None, 10, 60, generator.uniform(1, 100))),
+                       generator.choice((None, 400, 60, generator.uniform(10, 1000)))) for _ in range(64)]
+        self.controllers = [PIDController(0, *gains) for gains in self.gains]
+        self.bank = PIDBank.fromControllers(self.controllers)
+
+        # Reference trace: integer errors, as from a sensor, then fractional ones.
+        self.errors = [generator.randint(-60, 60) for _ in range(200)] + \
+                      [generator.uniform(-60, 60) for _ in range(200)]
+        self.dts = [generator.choice((0, 2, 5, 5, 7.5, generator.uniform(0.5, 20))) for _ in self.errors]
+
+    def assertMatches(self, integralMultiplier, dts):
+
+        for i, error in enumerate(self.errors):
+            dt = dts[i] if dts is not None else None
+            outputs = self.bank.update(error, integralMultiplier, dt)
+            for controller, output in zip(self.controllers, outputs):
+                self.assertEqual(float(controller.update(error, integralMultiplier, dt)).hex(), float(output).hex())
+
+        for controller, integral in zip(self.controllers, self.bank.integral):
+            self.assertEqual(float(controller.integral).hex(), float(integral).hex())
+
+    def test_fixedStep(self):
+        self.assertMatches(1, None)
+
+    def test_integralMultiplier(self):
+        self.assertMatches(0.4, None)
+
+    def test_measuredDt(self):
+
+        from pheasant_sim.PIDBank import PIDBank            # pylint: disable=import-outside-toplevel
+
+        # Measured dts are only used once the nominal period is set.
+        PIDController.setNominalPeriod(5)
+        try:
+            self.bank = PIDBank.fromControllers(self.controllers)
+            self.assertMatches(0.4, self.dts)
+        finally:
+            PIDController.setNominalPeriod(None)
+
+    def test_unmeasuredPeriod(self):
+        self.assertMatches(0.4, self.dts)
+
+    def test_replay(self):
+
+        outputs = self.bank.replay(self.errors[:50])
+
+        self.assertEqual(outputs.shape, (50, len(self.controllers)))
+        for column, controller in enumerate(self.controllers):
+            expected = [float(controller.update(error)) for error in self.errors[:50]]
+            self.assertEqual(outputs[:, column].tolist(), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+# test_PIDController.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for the dt scaling of ev3pid.utils.PIDController.update().
+
+
+import random
+import unittest
+from ev3pid import PIDController
+
+class test_PIDController(unittest.TestCase):
+
+    def setUp(self):
+        generator = random.Random(7)
+        self.errors = [generator.randint(-60, 60) for _ in range(100)]
+
+    def tearDown(self):
+        PIDController.setNominalPeriod(None)
+
+    def outputs(self, dt: float = None) -> list:
+        controller = PIDController(0, 3, 0.03, 30, 60, 60)
+        return [controller.update(error, dt=dt) for error in self.errors]
+
+    def test_nominalPeriod(self):
+
+        # At the nominal period, measured updates match fixed-step updates.
+        PIDController.setNominalPeriod(5)
+        self.assertEqual(self.outputs(5), self.outputs())
+
+    def test_scaling(self):
+
+        PIDController.setNominalPeriod(5)
+        controller = PIDController(0, 0, 1, 10, None, None)
+        self.assertEqual(controller.update(4, dt=10), 4 * 2 + 4 * 10 / 2)        # Twice the integral, half the slope.
+
+    def test_unmeasuredPeriod(self):
+
+        # Until the nominal period is measured, dt does not change the gains.
+        self.assertIsNone(PIDController.NOMINAL_PERIOD)
+        self.assertEqual(self.outputs(2), self.outputs())
+        self.assertEqual(self.outputs(12.5), self.outputs())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# test_Replay.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Regression tests for the ev3pid controllers, replaying reference traces recorded against the simulated robot. If a
+# change to the controllers' behaviour is intended, re-record the traces with:
+#     python -m pheasant_sim.Replay --record-reference
+
+
+import os
+import tempfile
+import unittest
+import ev3pid
+
+try:
+    import numpy
+    from pheasant_analysis import FlightLog
+    from pheasant_sim.Replay import ControllerTrace, replay, referenceGains, REFERENCE_PATH
+    from pheasant_sim.Tuner import SimulatedPlant, _lineField                         #pylint: disable=protected-access
+except ImportError:
+    numpy = None
+
+@unittest.skipIf(numpy is None, "requires NumPy")
+class test_Replay(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.log = FlightLog(REFERENCE_PATH)
+        cls.traces = {trace.procedure: trace for trace in ControllerTrace.fromLog(cls.log)}
+
+    def test_referenceTraces(self):
+
+        self.assertEqual(self.log.dropped, 0)
+        self.assertEqual(sorted(trace.controller for trace in self.traces.values()),
+                         ["GyroStraight", "GyroTurn", "GyroTurn", "LineSquare", "LineTrack"])
+
+        elapsed = 0
+        for procedure, trace in self.traces.items():
+            with self.subTest(procedure):
+                result = replay(trace, referenceGains(procedure))
+                self.assertTrue(result.identical, result.summary())
+                elapsed += result.elapsed
+
+        self.assertLess(elapsed, 1)
+
+    def test_changedGains(self):
+
+        gains = referenceGains('turnDouble')
+        gains['kp'] *= 2
+        result = replay(self.traces['turnDouble'], gains)
+
+        self.assertFalse(result.identical)
+        self.assertIsNotNone(result.firstDifference)
+        self.assertGreater(result.deviation, 0)
+
+    def test_earlierExit(self):
+
+        tolerance = ev3pid.LineSquare.THRESHOLD_TOLERANCE
+        ev3pid.LineSquare.THRESHOLD_TOLERANCE = 5
+        try:
+            result = replay(self.traces['square'], referenceGains('square'))
+        finally:
+            ev3pid.LineSquare.THRESHOLD_TOLERANCE = tolerance
+
+        self.assertLess(result.iterations, result.loggedIterations)
+        self.assertTrue(result.exitsNoLater)
+        self.assertIsNone(result.firstDifference)
+
+    def test_approaches(self):
+
+        recorder = ev3pid.FlightRecorder(4096)
+        previousRecorder = ev3pid.FlightRecorder.ACTIVE
+        recorder.activate()
+        gains = referenceGains('straight')
+
+        try:
+            SimulatedPlant(field=_lineField(), start=(1000, 300, 90))
+            recorder.start = ev3pid.Clock.now()
+            ev3pid.LineApproach(400, 0, leftThreshold=47, rightThreshold=42, **gains).run()
+
+            # Stands in for an ApproachSquare run.
+            controller = ev3pid.PIDController(0, 1, 0, 0, None, None)
+            for segment in ("ApproachSquare approach", "ApproachSquare left", "ApproachSquare right"):
+                recorder.begin(segment)
+                controller.update(1)
+                recorder.record(controller, 0, 0)
+        finally:
+            ev3pid.FlightRecorder.ACTIVE = previousRecorder
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "approaches.bin")
+            recorder.dump(path)
+            log = FlightLog(path)
+
+        # LineApproach replays as its GyroStraight loop; ApproachSquare is skipped, and counted.
+        traces = ControllerTrace.fromLog(log)
+        self.assertEqual([trace.controller for trace in traces], ["LineApproach"])
+        self.assertEqual(ControllerTrace.skippedRuns(log), {"ApproachSquare": 1})
+
+        result = replay(traces[0], gains)
+        self.assertGreater(result.loggedIterations, 10)
+        self.assertTrue(result.identical, result.summary())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+# test_SensorSampler.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for ev3pid.utils.SensorSampler.
+
+
+import unittest
+from ev3pid import Clock, SensorSampler
+from ev3pid.utils.SensorSampler import SampleBuffer
+
+class ColorSensor:
+
+    """
+    A color sensor that records whether the sampler's lock was held for each read.
+    """
+
+    def __init__(self, sampler: SensorSampler):
+        self.sampler = sampler
+        self.locked = []
+
+    def reflection(self) -> int:
+        self.locked.append(self.sampler.lock.locked())
+        return 50
+
+    def color(self):
+        self.locked.append(self.sampler.lock.locked())
+        return "BLACK"
+
+class test_SensorSampler(unittest.TestCase):
+
+    def setUp(self):
+        self.time = 0
+        Clock.setSource(lambda: self.time, self.sleep)
+
+    def tearDown(self):
+        Clock.resetSource()
+
+    def sleep(self, us: int):
+        self.time += us
+
+    def test_wraparound(self):
+
+        buffer = SampleBuffer("rgb", None, width=3, capacity=4)
+        self.assertIsNone(buffer.latest())
+        self.assertIsNone(buffer.staleness())
+
+        for index in range(10):
+            buffer.append(index * 2000, (index, index + 1, index + 2))
+
+        self.assertEqual(buffer.count, 10)
+        self.assertEqual(buffer.latest(), (9, 10, 11))
+        self.assertEqual(buffer.latestTime(), 18000)
+
+        # Only the 4 samples still in the buffer, 2 ms apart, are used for the rate.
+        self.assertEqual(list(buffer.times), [16000, 18000, 12000, 14000])
+        self.assertEqual(buffer.sampleRate(), 500)
+
+    def test_staleness(self):
+
+        buffer = SampleBuffer("gyro", None)
+        buffer.append(1000, -90)
+
+        self.time = 1000
+        self.assertEqual(buffer.staleness(), 0)
+        self.time = 6500
+        self.assertEqual(buffer.staleness(), 5500)
+        self.assertEqual(buffer.latest(), -90)
+
+    def test_standsInForSensor(self):
+
+        sampler = SensorSampler()
+        sensor = ColorSensor(sampler)
+        sampled = sampler.colorSensor(sensor)
+
+        self.assertEqual(sampled, sensor)
+        self.assertEqual(hash(sampled), hash(sensor))
+        self.assertEqual({sensor: 47}[sampled], 47)
+
+    def test_passThroughLock(self):
+
+        Clock.resetSource()
+        sampler = SensorSampler()
+        sensor = ColorSensor(sampler)
+        sampled = sampler.colorSensor(sensor)
+
+        sampler.start()
+        try:
+            colors = [sampled.color() for _ in range(20)]
+            self.assertEqual(sampled.reflection(), 50)
+        finally:
+            sampler.stop()
+
+        self.assertEqual(colors, ["BLACK"] * 20)
+        self.assertTrue(all(sensor.locked))
+        self.assertGreater(len(sensor.locked), 20)
+
+    def test_timestampedAtRead(self):
+
+        # Each read takes 1 ms of the fake clock; samples are stamped when their read starts, not once it has finished.
+        sampler = SensorSampler()
+        reads = []
+
+        def read():
+            reads.append(self.time)
+            self.time += 1000
+            return 50
+
+        buffer = sampler.register("slow", read)
+        sampler.start()
+        try:
+            while buffer.count < 5:
+                Clock.sleep(100)
+        finally:
+            sampler.stop()
+
+        # Sample n is at index n % capacity; checks the samples still in the buffer.
+        for number in range(max(buffer.count - buffer.capacity, 0), buffer.count):
+            self.assertLessEqual(buffer.times[number % buffer.capacity], reads[number])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# test_SensorSnapshot.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for ev3pid.utils.SensorSnapshot.
+
+
+import unittest
+from ev3pid import SensorSnapshot
+
+class Sensor:
+
+    """
+    A color sensor and gyro whose readings change on every hardware read, counting the reads.
+    """
+
+    def __init__(self, start: int = 0):
+        self.value = start
+        self.calls = 0
+
+    def __read(self) -> int:
+        self.calls += 1
+        self.value += 1
+        return self.value
+
+    def reflection(self) -> int:
+        return self.__read()
+
+    def angle(self) -> int:
+        return self.__read()
+
+class test_SensorSnapshot(unittest.TestCase):
+
+    def test_oncePerTick(self):
+
+        sensor = Sensor()
+        snapshot = SensorSnapshot()
+        snapshot.next()
+
+        readings = [snapshot.reflection(sensor) for _ in range(5)]
+
+        self.assertEqual(readings, [1] * 5)
+        self.assertEqual(sensor.calls, 1)
+        self.assertEqual(snapshot.reads, 1)
+
+    def test_next(self):
+
+        sensor = Sensor()
+        snapshot = SensorSnapshot()
+
+        readings = []
+        for _ in range(3):
+            snapshot.next()
+            readings.append((snapshot.reflection(sensor), snapshot.reflection(sensor)))
+
+        self.assertEqual(readings, [(1, 1), (2, 2), (3, 3)])
+        self.assertEqual(snapshot.tick, 3)
+        self.assertEqual(snapshot.reads, 3)
+
+    def test_separateCaches(self):
+
+        # Each device and each kind of reading is cached separately.
+        left, right = Sensor(0), Sensor(100)
+        snapshot = SensorSnapshot()
+        snapshot.next()
+
+        self.assertEqual((snapshot.reflection(left), snapshot.reflection(right)), (1, 101))
+        self.assertEqual(snapshot.angle(left), 2)
+        self.assertEqual((snapshot.reflection(left), snapshot.angle(left)), (1, 2))
+        self.assertEqual(snapshot.reads, 3)
+
+if __name__ == '__main__':
+    unittest.main()
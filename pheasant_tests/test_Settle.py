@@ -0,0 +1,73 @@
+# test_Settle.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for ev3pid.utils.Settle.
+
+
+import unittest
+from ev3pid import Clock, FlightRecorder, Settle
+
+class Device:
+
+    """
+    A motor or gyro whose speed follows a list of (time in ms, speed) steps.
+    """
+
+    def __init__(self, test, steps: list):
+        self.test = test
+        self.steps = steps
+
+    def speed(self) -> int:
+
+        speed = 0
+        for time, value in self.steps:
+            if self.test.time >= time * 1000:
+                speed = value
+
+        return speed
+
+class test_Settle(unittest.TestCase):
+
+    def setUp(self):
+        self.time = 0
+        Clock.setSource(lambda: self.time, self.sleep)
+
+    def tearDown(self):
+        Clock.resetSource()
+        FlightRecorder.deactivate()
+
+    def sleep(self, us: int):
+        self.time += us
+
+    def test_motors(self):
+
+        motors = (Device(self, [(0, 300), (100, 5)]), Device(self, [(0, 300), (150, -8)]))
+        settle = Settle.motors(motors, speed=10, settleTime=30)
+
+        self.assertTrue(settle.wait())
+        self.assertTrue(settle.settled)
+        self.assertEqual(settle.elapsed, 180)                   # Both still from 150 ms, for 30 ms.
+
+    def test_restarts(self):
+
+        gyro = Device(self, [(0, 0), (20, 50), (40, 0)])
+        settle = Settle.gyro(gyro, settleTime=30)
+
+        self.assertTrue(settle.wait())
+        self.assertEqual(settle.elapsed, 70)                    # The settle time restarts when the gyro moves.
+
+    def test_timeout(self):
+
+        recorder = FlightRecorder()
+        recorder.activate()
+
+        settle = Settle.gyro(Device(self, [(0, 90)]), timeout=200)
+
+        self.assertFalse(settle.wait())
+        self.assertEqual(settle.elapsed, 200)
+        self.assertEqual(recorder.segments, ["wait gyro"])
+        self.assertEqual(recorder.count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
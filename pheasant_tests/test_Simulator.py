@@ -0,0 +1,164 @@
+# test_Simulator.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for pheasant_sim.
+
+
+import contextlib
+import importlib
+import io
+import random
+import sys
+import time
+import unittest
+from pheasant_sim import World, FieldMap, FieldColor, MotorModel, MotorMode, PROGRAM_MODULES, runProgram, unloadProgram
+from pheasant_sim.MonteCarlo import MissionLayout, MissionResult, MonteCarloReport, runMission
+from pheasant_sim.Tuner import TARGETS, TuningResult, formatCalls
+
+class test_Simulator(unittest.TestCase):
+
+    def test_runTarget(self):
+
+        model = MotorModel()
+        model.runTarget(500, 360, MotorMode.HOLD)
+        for _ in range(2000):
+            model.step(0.001, 0)
+
+        self.assertTrue(model.done())
+        self.assertAlmostEqual(model.angle, 360, delta=0.5)
+
+    def test_endStop(self):
+
+        model = MotorModel(travel=(-100, 5))
+        model.run(-500)
+        for _ in range(1000):
+            model.step(0.001, 0)
+
+        self.assertEqual(model.angle, -100)
+        self.assertTrue(model.stalled)
+
+    def test_lineReflection(self):
+
+        field = FieldMap(400, 400)
+        field.horizontalLine(200, 0, 400)
+        field.finalize()
+
+        self.assertEqual(field.colorAt(100, 200), FieldColor.BLACK)
+        self.assertLess(field.reflectionAt(100, 200), 20)
+        self.assertGreater(field.reflectionAt(100, 100), 80)
+
+        # Readings vary continuously across the line edge.
+        self.assertTrue(field.reflectionAt(100, 200) < field.reflectionAt(100, 210) < field.reflectionAt(100, 220))
+
+    def test_driveStraight(self):
+
+        world = World(field=FieldMap.default(), start=(1000, 600, 0))
+        world.motor('B').run(-360)
+        world.motor('C').run(360)
+        world.advance(1)
+
+        # One wheel revolution per second, less the acceleration ramp.
+        self.assertAlmostEqual(world.x, 1000 + 3.1416 * World.WHEEL_DIAMETER, delta=10)
+        self.assertAlmostEqual(world.y, 600, delta=0.5)
+        self.assertAlmostEqual(world.gyroAngle(), 0, delta=0.5)
+
+    def test_virtualTime(self):
+
+        World.create(virtual=True)
+        from pybricks.tools import wait, StopWatch      # pylint: disable=import-outside-toplevel
+
+        wallStart = time.perf_counter()
+        stopWatch = StopWatch()
+        wait(60000)
+
+        self.assertAlmostEqual(stopWatch.time(), 60000, delta=5)
+        self.assertLess(time.perf_counter() - wallStart, 5)
+
+    def test_runProgram(self):
+
+        procedures = []
+
+        def prepare(_):
+            main = importlib.import_module('main')
+            startProcedure = main.startProcedure
+
+            def recordProcedure(name: str):
+                procedures.append(name)
+                startProcedure(name)
+
+            main.startProcedure = recordProcedure
+
+        # run.py runs in full on the default field, in its own copy of the program modules.
+        programModules = {name: module for name, module in sys.modules.items()
+                          if name.split('.')[0] in PROGRAM_MODULES}
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                world = runProgram('run.py', prepare=prepare, virtual=True, timeLimit=180)
+            utils = importlib.import_module('pheasant_utils')
+            leftHouse = utils.RunLogic.houses[utils.DepositPoint.LEFT_HOUSE]
+        finally:
+            unloadProgram()
+            sys.modules.update(programModules)
+
+        self.assertEqual(procedures[0], "scanBlocksAtLeftHouse")
+        self.assertEqual(procedures[-1], "returnToStartZone")
+        self.assertEqual(len(procedures), 15)
+        self.assertLess(world.now(), 180)
+
+        # The side scanner finds the default blocks at the left house.
+        self.assertEqual(leftHouse, [utils.BlockColor.BLUE, utils.BlockColor.GREEN])
+
+    def test_monteCarloReport(self):
+
+        layout = MissionLayout.random(random.Random(1))
+        self.assertEqual(sorted(len(colors) for colors in layout.houses.values()), [1, 2, 2])
+        self.assertEqual(len(layout.blocks()), 5)
+
+        results = []
+        for index in range(4):
+            result = MissionResult(index, index)
+            result.completed = index < 3
+            result.runtime = 100 + index if result.completed else None
+            if not result.completed:
+                result.error, result.failedProcedure, result.failedStep = "SimulationTimeout", "collectGreenEnergy", \
+                    "driveBackAndCollectGreenBlocksProcedure"
+            results.append(result)
+
+        report = MonteCarloReport(results)
+        self.assertEqual(report.successRate, 0.75)
+        self.assertEqual(report.runtimePercentile(50), 101)
+        self.assertEqual(report.failures, {"collectGreenEnergy": 1})
+
+    def test_runMission(self):
+
+        # One seeded run, with the layout, noise, start error and gyro drift that evaluate() uses by default.
+        options = {'noise': 1, 'startError': (5, 1), 'gyroDrift': 0.05, 'timeLimit': 180, 'step': None,
+                   'script': 'run.py'}
+        programModules = {name: module for name, module in sys.modules.items()
+                          if name.split('.')[0] in PROGRAM_MODULES}
+        try:
+            result = runMission((0, 0, options))
+        finally:
+            unloadProgram()
+            sys.modules.update(programModules)
+
+        self.assertTrue(result.completed, result.error)
+        self.assertEqual(result.durations[-1][0], "returnToStartZone")
+        self.assertEqual(result.scanErrors, 0)
+
+    def test_tunerFormatCalls(self):
+
+        results = {name: TuningResult(name, 0, TARGETS[name].baseline, 0, 1)
+                   for name in ('GyroTurnDouble', 'LineSquare', 'LineTrack')}
+        lines = formatCalls(results).split("\n")
+
+        # Matches the tuning set in main.py.
+        self.assertEqual(lines[0], "ev3pid.GyroTurn.setDefaultTuning(kpSingle=20, kiSingle=1, kdSingle=400,")
+        self.assertEqual(lines[2], "ev3pid.GyroTurn.setDefaultOutputLimit(limitSingle=500, limitDouble=400)")
+        self.assertIn("ev3pid.LineSquare.setDefaultTuning(3, 0.03, 30)", lines)
+        self.assertIn("ev3pid.LineTrack.setDefaultTuning(1.2, 0.0008, 200)", lines)
+        self.assertNotIn("ev3pid.LineTrack.setDefaultOutputLimit(None)", lines)
+
+if __name__ == '__main__':
+    unittest.main()
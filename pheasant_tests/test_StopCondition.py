@@ -0,0 +1,152 @@
+# test_StopCondition.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for ev3pid.utils.StopCondition.
+
+
+import unittest
+from ev3pid import Clock, SensorSnapshot, GyroStraight
+from ev3pid import StopCondition, EncoderAngle, Reflection, ColorIs, Timeout, All, Any
+from pheasant_sim.Tuner import SimulatedPlant
+
+class Device:
+
+    """
+    A motor or color sensor that returns a settable value, and counts its reads.
+    """
+
+    def __init__(self, value=0):
+        self.value = value
+        self.reads = 0
+
+    def read(self):
+        self.reads += 1
+        return self.value
+
+    angle = reflection = color = read
+
+class test_StopCondition(unittest.TestCase):
+
+    def setUp(self):
+        self.time = 0
+        Clock.setSource(lambda: self.time, None)
+
+    def tearDown(self):
+        Clock.resetSource()
+
+    def test_comparisons(self):
+
+        left, right = Device(100), Device(101)
+        condition = EncoderAngle(leftMotor=left, rightMotor=right)
+
+        # The mean angle is 100.5.
+        self.assertTrue(condition.above(100)())
+        self.assertFalse(condition.above(100.5)())
+        self.assertTrue(condition.atLeast(100.5)())
+        self.assertTrue(condition.below(101)())
+        self.assertFalse(condition.atMost(100)())
+
+    def test_sharedSnapshot(self):
+
+        sensor = Device(20)
+        snapshot = SensorSnapshot()
+        condition = Reflection(sensor).below(30)
+        condition.bind(snapshot)
+
+        snapshot.next()
+        snapshot.reflection(sensor)                             # Read by the control law.
+        self.assertTrue(condition())
+        self.assertTrue(condition())
+        self.assertEqual(sensor.reads, 1)
+
+        snapshot.next()
+        sensor.value = 40
+        self.assertFalse(condition())
+        self.assertEqual(sensor.reads, 2)
+
+    def test_shortCircuit(self):
+
+        left, right, color = Device(0), Device(0), Device("BLACK")
+        reflection = Device(50)
+
+        # The color is checked last, and not at all once the reflection fails.
+        condition = ColorIs(color, "BLACK") & EncoderAngle(leftMotor=left, rightMotor=right).above(-10) & \
+            Reflection(reflection).below(30)
+        self.assertEqual([type(part) for part in condition.conditions], [Reflection, EncoderAngle, ColorIs])
+        self.assertFalse(condition())
+        self.assertEqual((reflection.reads, left.reads, color.reads), (1, 0, 0))
+
+        anyCondition = Reflection(reflection).above(30) | ColorIs(color, "BLACK")
+        self.assertTrue(anyCondition())
+        self.assertEqual(color.reads, 0)
+
+        self.assertIsInstance(condition, All)
+        self.assertIsInstance(anyCondition, Any)
+
+    def test_timeout(self):
+
+        timeout = Timeout(100)
+        self.time = 50000
+        timeout.bind(None)                                      # Restarts the timeout.
+
+        self.time = 149000
+        self.assertFalse(timeout())
+        self.time = 150000
+        self.assertTrue(timeout())
+
+    def test_controller(self):
+
+        # A condition object stops the controller at the same tick as the equivalent lambda.
+        results = []
+        for useCondition in (False, True):
+
+            plant = SimulatedPlant(start=(400, 570, 0))
+            left, right = plant.leftMotor, plant.rightMotor
+            controller = GyroStraight(600, 0, kp=22, ki=0, kd=100)
+            if useCondition:
+                controller.runUntil(EncoderAngle(leftMotor=left, rightMotor=right).above(200))
+            else:
+                controller.runUntil(lambda: (left.angle() + right.angle()) / 2 > 200)
+
+            results.append((plant.now(), left.angle(), right.angle()))
+
+        self.assertGreater(results[0][1] + results[0][2], 400)
+        self.assertEqual(results[0], results[1])
+
+    def test_unboundAfterRun(self):
+
+        plant = SimulatedPlant(start=(400, 570, 0))
+        left, right = plant.leftMotor, plant.rightMotor
+        condition = EncoderAngle(leftMotor=left, rightMotor=right)
+
+        GyroStraight(600, 0, kp=22, ki=0, kd=100).runUntil(condition.above(200))
+        self.assertIsNone(condition.snapshot)
+
+        # The robot coasts on after the run; a direct call reads where it is now, not the loop's last tick.
+        end = (left.angle() + right.angle()) / 2
+        plant.world.sleep(200)
+        moved = (left.angle() + right.angle()) / 2
+        self.assertGreater(moved, end + 10)
+        self.assertTrue(condition.above(end + 10)())
+
+    def test_singleUse(self):
+
+        # A condition is retargeted in place, so a loop that is using it keeps it to itself.
+        condition = Reflection(Device(20)).below(30)
+        condition.bind(SensorSnapshot())
+
+        with self.assertRaises(RuntimeError):
+            condition.above(10)
+        with self.assertRaises(RuntimeError):
+            condition.bind(SensorSnapshot())
+        self.assertEqual(condition.threshold, 30)
+
+        condition.unbind()
+        self.assertIs(condition.above(10), condition)
+
+    def test_baseCondition(self):
+        self.assertFalse(StopCondition()())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# test_SysfsInput.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for ev3pid.utils.SysfsInput, using a fake sysfs tree.
+
+
+import os
+import tempfile
+import unittest
+from ev3pid.utils.SysfsInput import SysfsSensor, SysfsColorSensor, SysfsGyroSensor, SysfsEv3devSensor
+
+class test_SysfsInput(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def makeSensor(self, name: str, address: str, mode: str, values):
+
+        path = os.path.join(self.root, name)
+        os.mkdir(path)
+
+        self.writeAttribute(name, 'address', address)
+        self.writeAttribute(name, 'mode', mode)
+        self.writeAttribute(name, 'num_values', len(values))
+        for i, value in enumerate(values):
+            self.writeAttribute(name, 'value' + str(i), value)
+
+    def writeAttribute(self, name: str, attribute: str, value):
+        with open(os.path.join(self.root, name, attribute), 'w') as file:
+            file.write(str(value) + '\n')
+
+    def readAttribute(self, name: str, attribute: str) -> str:
+        with open(os.path.join(self.root, name, attribute)) as file:
+            return file.read().strip()
+
+    def test_findDevice(self):
+
+        self.makeSensor('sensor0', 'ev3-ports:in1', 'RGB-RAW', [0, 0, 0])
+        self.makeSensor('sensor1', 'ev3-ports:in2', 'COL-REFLECT', [50])
+
+        self.assertEqual(SysfsSensor.findDevice('ev3-ports:in2', self.root), os.path.join(self.root, 'sensor1'))
+        with self.assertRaises(OSError):
+            SysfsSensor.findDevice('ev3-ports:in4', self.root)
+
+    def test_reflectionRereadsOpenFile(self):
+
+        self.makeSensor('sensor0', 'ev3-ports:in2', 'COL-REFLECT', [47])
+        sensor = SysfsColorSensor('ev3-ports:in2', root=self.root)
+
+        self.assertEqual(sensor.reflection(), 47)
+        self.writeAttribute('sensor0', 'value0', 8)
+        self.assertEqual(sensor.reflection(), 8)
+
+        sensor.close()
+
+    def test_modeOnlyWrittenOnChange(self):
+
+        self.makeSensor('sensor0', 'ev3-ports:in2', 'COL-REFLECT', [47])
+        sensor = SysfsColorSensor('ev3-ports:in2', root=self.root)
+
+        sensor.reflection()
+        self.writeAttribute('sensor0', 'mode', 'UNCHANGED')
+        sensor.reflection()
+        self.assertEqual(self.readAttribute('sensor0', 'mode'), 'UNCHANGED')
+
+        self.writeAttribute('sensor0', 'value0', 1)
+        sensor.color()
+        self.assertEqual(self.readAttribute('sensor0', 'mode'), 'COL-COLOR')
+
+        sensor.close()
+
+    def test_gyroDirectionAndReset(self):
+
+        self.makeSensor('sensor0', 'ev3-ports:in4', 'GYRO-G&A', [30, 5])
+        sensor = SysfsGyroSensor('ev3-ports:in4', counterclockwise=True, root=self.root)
+
+        self.assertEqual(sensor.angle(), -30)
+        self.assertEqual(sensor.speed(), -5)
+
+        sensor.reset_angle(90)
+        self.assertEqual(sensor.angle(), 90)
+        self.writeAttribute('sensor0', 'value0', 20)
+        self.assertEqual(sensor.angle(), 100)
+
+        sensor.close()
+
+    def test_readRgbRaw(self):
+
+        self.makeSensor('sensor0', 'ev3-ports:in1', 'RGB-RAW', [12, 4, 3])
+        sensor = SysfsEv3devSensor('ev3-ports:in1', root=self.root)
+
+        self.assertEqual(sensor.read('RGB-RAW'), (12, 4, 3))
+
+        sensor.close()
+
+if __name__ == '__main__':
+    unittest.main()
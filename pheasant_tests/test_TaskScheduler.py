@@ -0,0 +1,87 @@
+# test_TaskScheduler.py
+# Created on 18 Oct 2026 for Team Pheasant.
+# Copyright © 2026 Qi Tianshi. All rights reserved.
+
+# Unit tests for ev3pid.utils.TaskScheduler and the controller tasks.
+
+
+import unittest
+from ev3pid import GyroStraight, TaskScheduler
+from pheasant_sim.Tuner import SimulatedPlant
+
+class test_TaskScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.log = []
+
+    def counter(self, name: str, count: int = None):
+
+        i = 0
+        while count is None or i < count:
+            self.log.append((name, i))
+            i += 1
+            yield
+
+    def test_interleaving(self):
+
+        tasks = TaskScheduler()
+        tasks.add(self.counter("drive", 3))
+        tasks.add(self.counter("scan"), background=True)
+        tasks.run()
+
+        # The scan is not resumed after the drive finishes.
+        self.assertEqual(self.log, [("drive", 0), ("scan", 0), ("drive", 1), ("scan", 1), ("drive", 2), ("scan", 2)])
+        self.assertEqual(tasks.iterations, 4)                   # Including the one in which the drive finished.
+        self.assertEqual(tasks.tasks, [])
+
+    def test_allForeground(self):
+
+        tasks = TaskScheduler()
+        tasks.add(self.counter("short", 1))
+        tasks.add(self.counter("long", 3))
+        tasks.run()
+
+        self.assertEqual(self.log, [("short", 0), ("long", 0), ("long", 1), ("long", 2)])
+
+    def test_backgroundClosed(self):
+
+        closed = []
+
+        def background():
+            try:
+                while True:
+                    yield
+            finally:
+                closed.append(True)
+
+        tasks = TaskScheduler()
+        tasks.add(self.counter("drive", 2))
+        tasks.add(background(), background=True)
+        tasks.run()
+
+        self.assertEqual(closed, [True])
+
+    def test_controllerTask(self):
+
+        # Running a controller's task alongside other tasks gives the same motor commands as runUntil().
+        results = []
+        for multiplexed in (False, True):
+
+            plant = SimulatedPlant(start=(400, 570, 0))
+            controller = GyroStraight(600, 5, kp=22, ki=0, kd=100)
+            plant.record(controller)
+            if multiplexed:
+                tasks = TaskScheduler()
+                tasks.add(controller.task(lambda: plant.now() > 0.2))
+                tasks.add(self.counter("scan"), background=True)
+                tasks.run()
+            else:
+                controller.runUntil(lambda: plant.now() > 0.2)
+
+            results.append([error for _, error in plant.errors])
+
+        self.assertGreater(len(results[0]), 10)
+        self.assertEqual(results[0], results[1])
+
+if __name__ == '__main__':
+    unittest.main()